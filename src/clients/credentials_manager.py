@@ -0,0 +1,230 @@
+"""Google OAuth 자격 증명 관리 (프로세스 공용, 백그라운드 갱신)"""
+import datetime
+import os
+import threading
+from pathlib import Path
+from typing import Optional, Dict, List, Callable, Any
+from google.auth.transport.requests import Request
+from google.oauth2.credentials import Credentials
+from google_auth_oauthlib.flow import InstalledAppFlow
+
+
+# Drive API 권한 범위
+SCOPES = ['https://www.googleapis.com/auth/drive.file']
+
+# 만료 몇 초 전에 미리 갱신할지 (google-auth는 만료 약 4분 전부터 토큰을 무효로 취급)
+REFRESH_MARGIN = 10 * 60
+
+# 만료 시각을 모를 때 / 갱신 실패 시 다시 확인할 간격 (초)
+RECHECK_INTERVAL = 30 * 60
+RETRY_INTERVAL = 30
+
+
+class CredentialsManager:
+    """
+    토큰 파일 하나에 대응하는 Credentials 공유 관리자
+
+    같은 token.json을 쓰는 모든 DriveClient와 HTTP 연결이 하나의 Credentials 객체를 공유하며,
+    백그라운드 스레드가 만료 전에 미리 갱신하므로 요청 경로에서 토큰 갱신을 기다리지 않습니다.
+    """
+
+    _registry: Dict[str, "CredentialsManager"] = {}
+    _registry_lock = threading.Lock()
+
+    def __init__(
+        self,
+        credentials_path: Path,
+        token_path: Path,
+        scopes: Optional[List[str]] = None,
+        refresh_margin: float = REFRESH_MARGIN
+    ):
+        """
+        자격 증명 관리자 초기화 (보통은 get()으로 공용 인스턴스를 사용)
+
+        Args:
+            credentials_path: OAuth 클라이언트 정보 파일 경로 (credentials.json)
+            token_path: 토큰 저장 파일 경로 (token.json)
+            scopes: 권한 범위 (None이면 Drive 파일 권한)
+            refresh_margin: 만료 몇 초 전에 갱신할지
+        """
+        self.credentials_path = Path(credentials_path)
+        self.token_path = Path(token_path)
+        self.scopes = scopes or SCOPES
+        self.refresh_margin = refresh_margin
+
+        self.credentials: Optional[Credentials] = None
+        self._listeners: List[Callable[[Credentials], Any]] = []
+        self._lock = threading.Lock()
+        self._refresh_lock = threading.Lock()
+
+        self._thread: Optional[threading.Thread] = None
+        self._wakeup = threading.Event()
+        self._stopped = threading.Event()
+
+    @classmethod
+    def get(cls, credentials_path: Path, token_path: Path) -> "CredentialsManager":
+        """
+        토큰 파일 경로별 공용 인스턴스 반환
+
+        Args:
+            credentials_path: OAuth 클라이언트 정보 파일 경로
+            token_path: 토큰 저장 파일 경로
+
+        Returns:
+            CredentialsManager: 같은 토큰 파일이면 항상 같은 인스턴스
+        """
+        key = str(Path(token_path).resolve())
+        with cls._registry_lock:
+            manager = cls._registry.get(key)
+            if manager is None:
+                manager = cls(credentials_path, token_path)
+                cls._registry[key] = manager
+            return manager
+
+    def load(self) -> Credentials:
+        """
+        자격 증명 로드 (이미 로드했으면 그대로 반환)
+
+        토큰 파일이 없거나 갱신할 수 없으면 브라우저 OAuth 플로우를 실행하며,
+        로드 후 백그라운드 갱신 스레드를 시작합니다.
+
+        Returns:
+            Credentials: 공유 자격 증명
+        """
+        if self.credentials is None:
+            with self._lock:
+                if self.credentials is None:
+                    self.credentials = self._load_or_authorize()
+
+        self.start()
+        return self.credentials
+
+    def _load_or_authorize(self) -> Credentials:
+        """토큰 파일 로드, 만료되었으면 갱신, 없으면 새로 발급"""
+        creds = None
+        if self.token_path.exists():
+            creds = Credentials.from_authorized_user_file(str(self.token_path), self.scopes)
+
+        if creds and creds.valid:
+            return creds
+
+        if creds and creds.expired and creds.refresh_token:
+            # 토큰 갱신
+            creds.refresh(Request())
+        else:
+            # 새로운 OAuth 플로우 시작
+            flow = InstalledAppFlow.from_client_secrets_file(str(self.credentials_path), self.scopes)
+            creds = flow.run_local_server(port=0)
+
+        self._save(creds)
+        return creds
+
+    def update(self, credentials: Credentials):
+        """
+        새로 발급받은 자격 증명으로 교체 (웹 OAuth 콜백 등)
+
+        토큰 파일을 저장하고, 등록된 리스너(연결 풀 등)에 새 자격 증명을 알립니다.
+
+        Args:
+            credentials: 새 자격 증명
+        """
+        with self._lock:
+            self.credentials = credentials
+            listeners = list(self._listeners)
+
+        with self._refresh_lock:
+            self._save(credentials)
+
+        for listener in listeners:
+            listener(credentials)
+
+        self.start()
+        self._wakeup.set()
+
+    def add_listener(self, listener: Callable[[Credentials], Any]):
+        """
+        자격 증명 교체 알림 등록
+
+        Args:
+            listener: listener(credentials) 형태로 호출될 함수
+        """
+        with self._lock:
+            self._listeners.append(listener)
+
+    def refresh(self) -> bool:
+        """
+        토큰 갱신 후 저장
+
+        공유 Credentials 객체를 제자리에서 갱신하므로, 갱신 중에도 다른 스레드는
+        아직 만료되지 않은 기존 토큰으로 요청을 계속 보냅니다.
+
+        Returns:
+            bool: 갱신 성공 여부 (갱신 토큰이 없으면 False)
+        """
+        creds = self.credentials
+        if creds is None or not creds.refresh_token:
+            return False
+
+        with self._refresh_lock:
+            creds.refresh(Request())
+            self._save(creds)
+        return True
+
+    def seconds_until_refresh(self) -> float:
+        """다음 선제 갱신까지 남은 시간 (초, 최대 재확인 간격)"""
+        creds = self.credentials
+        if creds is None or creds.expiry is None:
+            return RECHECK_INTERVAL
+
+        # google-auth의 expiry는 UTC 기준 naive datetime
+        now = datetime.datetime.now(datetime.timezone.utc).replace(tzinfo=None)
+        remaining = (creds.expiry - now).total_seconds() - self.refresh_margin
+        return min(max(0.0, remaining), RECHECK_INTERVAL)
+
+    def start(self):
+        """백그라운드 갱신 스레드 시작 (이미 실행 중이면 무시)"""
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._stopped.clear()
+            self._thread = threading.Thread(
+                target=self._refresh_loop,
+                name="oauth-refresh",
+                daemon=True
+            )
+            self._thread.start()
+
+    def stop(self):
+        """백그라운드 갱신 스레드 종료"""
+        self._stopped.set()
+        self._wakeup.set()
+
+    def _refresh_loop(self):
+        """만료 refresh_margin초 전마다 토큰 갱신 (실패 시 잠시 후 재시도)"""
+        while not self._stopped.is_set():
+            self._wakeup.wait(self.seconds_until_refresh())
+            self._wakeup.clear()
+            if self._stopped.is_set():
+                return
+
+            if self.seconds_until_refresh() > 0:
+                continue
+
+            try:
+                if not self.refresh():
+                    self._wakeup.wait(RECHECK_INTERVAL)
+            except Exception:
+                # 네트워크 오류 등: 요청 경로에서는 기존 토큰(만료 전)이나 자체 갱신을 사용
+                self._wakeup.wait(RETRY_INTERVAL)
+
+    def _save(self, credentials: Credentials):
+        """토큰 파일 저장 (임시 파일 작성 후 교체)"""
+        try:
+            self.token_path.parent.mkdir(parents=True, exist_ok=True)
+            temp_file = self.token_path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+            with open(temp_file, 'w') as token_file:
+                token_file.write(credentials.to_json())
+            os.replace(temp_file, self.token_path)
+        except OSError:
+            # 저장 실패 시에도 메모리의 자격 증명은 계속 사용 가능
+            pass
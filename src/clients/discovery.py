@@ -0,0 +1,89 @@
+"""Google API 디스커버리 문서 로드 (네트워크 없이 서비스 생성)"""
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Optional, Dict
+import httplib2
+
+
+DISCOVERY_URL = 'https://www.googleapis.com/discovery/v1/apis/{api}/{version}/rest'
+
+# 프로세스 안에서 한 번만 파싱 (서비스를 만들 때마다 수백 KB JSON을 다시 읽지 않도록)
+_documents: Dict[str, Dict] = {}
+_lock = threading.Lock()
+
+
+def load_discovery_document(api: str, version: str, cache_dir: Optional[Path] = None) -> Dict:
+    """
+    디스커버리 문서 로드
+
+    디스크 캐시 → google-api-python-client에 포함된 문서 → 네트워크 순으로 찾고,
+    네트워크에서 받은 문서는 디스크에 저장해 다음 시작부터는 네트워크를 사용하지 않습니다.
+
+    Args:
+        api: API 이름 (예: drive)
+        version: API 버전 (예: v3)
+        cache_dir: 디스크 캐시 디렉토리 (None이면 디스크 캐시 사용 안 함)
+
+    Returns:
+        Dict: 파싱된 디스커버리 문서 (build_from_document에 그대로 전달)
+    """
+    key = f"{api}.{version}"
+
+    with _lock:
+        document = _documents.get(key)
+        if document is not None:
+            return document
+
+        cache_file = Path(cache_dir) / f"{key}.json" if cache_dir else None
+
+        content = _read_cached(cache_file) or _read_packaged(api, version)
+        if content is None:
+            content = _fetch(api, version)
+            _write_cached(cache_file, content)
+
+        document = json.loads(content)
+        _documents[key] = document
+        return document
+
+
+def _read_cached(cache_file: Optional[Path]) -> Optional[str]:
+    """디스크 캐시에서 읽기"""
+    if cache_file is None or not cache_file.exists():
+        return None
+    try:
+        return cache_file.read_text(encoding='utf-8')
+    except OSError:
+        return None
+
+
+def _read_packaged(api: str, version: str) -> Optional[str]:
+    """google-api-python-client에 포함된 정적 문서 읽기 (구버전이면 None)"""
+    try:
+        from googleapiclient.discovery_cache import get_static_doc
+    except ImportError:
+        return None
+    return get_static_doc(api, version)
+
+
+def _fetch(api: str, version: str) -> str:
+    """네트워크에서 문서 받기"""
+    response, content = httplib2.Http(timeout=30).request(DISCOVERY_URL.format(api=api, version=version))
+    if response.status >= 400:
+        raise Exception(f"디스커버리 문서 조회 실패: HTTP {response.status}")
+    return content.decode('utf-8')
+
+
+def _write_cached(cache_file: Optional[Path], content: str):
+    """디스크 캐시에 저장 (임시 파일 작성 후 교체)"""
+    if cache_file is None:
+        return
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        temp_file = cache_file.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        temp_file.write_text(content, encoding='utf-8')
+        os.replace(temp_file, cache_file)
+    except OSError:
+        # 저장 실패 시 다음 시작에서 다시 받을 뿐이므로 무시
+        pass
@@ -1,29 +1,123 @@
 """Google Drive API 클라이언트"""
+import asyncio
+import base64
+import codecs
+import hashlib
+import inspect
 import io
+import json
 import os
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from functools import partial
 from pathlib import Path
-from typing import Optional, Dict, List
-from google.auth.transport.requests import Request
+from typing import Optional, Dict, List, Callable, Any, Union, BinaryIO, AsyncIterator
+import httplib2
+from google_auth_httplib2 import AuthorizedHttp
 from google.oauth2.credentials import Credentials
-from google_auth_oauthlib.flow import InstalledAppFlow
-from googleapiclient.discovery import build
-from googleapiclient.http import MediaFileUpload, MediaIoBaseDownload
+from googleapiclient.discovery import build_from_document
+from googleapiclient.errors import HttpError
+from googleapiclient.http import MediaIoBaseUpload, MediaIoBaseDownload
 
+from src.clients.credentials_manager import CredentialsManager
+from src.clients.discovery import load_discovery_document
+from src.clients.service_pool import DriveServicePool
+from src.managers.content_cache import ContentCache
+from src.managers.folder_cache import FolderCache
+from src.managers.metadata_index import DriveMetadataIndex, INDEX_FIELDS
+from src.managers.upload_sessions import UploadSessionStore
+from src.utils.config import Config
+from src.utils.rate_limiter import TokenBucket
 
-# Drive API 권한 범위
-SCOPES = ['https://www.googleapis.com/auth/drive.file']
+
+# 업로드 가능한 내용 타입 (문자열, 바이트 버퍼, 읽기 가능한 바이너리 스트림)
+UploadContent = Union[str, bytes, bytearray, memoryview, BinaryIO]
+
+# 진행 상황 콜백: callback(전송한 바이트 수, 전체 바이트 수). 코루틴 함수도 허용
+ProgressCallback = Callable[[int, int], Any]
+
+# 재개 가능 업로드 청크 크기 단위 (Drive 요구사항: 256KiB 배수)
+CHUNK_SIZE_UNIT = 256 * 1024
+
+# 재시도할 HTTP 상태 코드 (429와 속도 제한 사유의 403은 별도 처리)
+RETRYABLE_STATUS = (408, 500, 502, 503, 504)
+
+# 속도 제한을 뜻하는 403 오류 사유
+RATE_LIMIT_REASONS = {'userRateLimitExceeded', 'rateLimitExceeded'}
+
+# 재시도할 네트워크 오류 (연결 끊김, 타임아웃, SSL 오류 등)
+RETRYABLE_ERRORS = (OSError, httplib2.HttpLib2Error)
+
+# Drive 배치 요청 1회당 최대 요청 수
+BATCH_LIMIT = 100
+
+# 폴더 MIME 타입
+FOLDER_MIME_TYPE = 'application/vnd.google-apps.folder'
+
+# 파일 메타데이터 조회 기본 필드
+METADATA_FIELDS = 'id, name, mimeType, size, md5Checksum, modifiedTime, webViewLink'
+
+# 파일 목록 조회 기본 필드 / 정렬 / 페이지 크기 상한
+LIST_FIELDS = 'id, name, mimeType, createdTime, webViewLink'
+LIST_ORDER_BY = 'createdTime desc'
+MAX_PAGE_SIZE = 1000
+
+# 로컬 인덱스에서 반환한 페이지 토큰 접두어 (뒤에 정렬 기준과 마지막 파일의 정렬 키를 인코딩)
+LOCAL_PAGE_TOKEN_PREFIX = 'local:'
+
+# 다른 요청의 인덱스 동기화가 끝나기를 기다릴 때 확인 간격 (초)
+SYNC_LOCK_POLL_INTERVAL = 0.05
+
+# changes.list 응답 필드
+CHANGES_FIELDS = f'nextPageToken, newStartPageToken, changes(fileId, removed, file({INDEX_FIELDS}))'
+
+
+class _ChunkSink:
+    """MediaIoBaseDownload가 받은 청크를 복사 없이 넘겨주는 쓰기 대상"""
+
+    def __init__(self):
+        self.chunks: List[bytes] = []
+
+    def write(self, data: bytes) -> int:
+        self.chunks.append(data)
+        return len(data)
+
+    def drain(self) -> List[bytes]:
+        chunks, self.chunks = self.chunks, []
+        return chunks
 
 
 class DriveClient:
     """Google Drive API 클라이언트"""
 
-    def __init__(self, credentials_path: str, token_path: Optional[str] = None):
+    def __init__(
+        self,
+        credentials_path: str,
+        token_path: Optional[str] = None,
+        folder_cache: Optional[FolderCache] = None,
+        max_concurrency: Optional[int] = None,
+        upload_sessions: Optional[UploadSessionStore] = None,
+        metadata_index: Optional[DriveMetadataIndex] = None,
+        content_cache: Optional[ContentCache] = None,
+        pool_size: Optional[int] = None,
+        lazy: bool = False
+    ):
         """
         Drive 클라이언트 초기화
 
         Args:
             credentials_path: OAuth 인증 정보 파일 경로 (credentials.json)
             token_path: 토큰 저장 파일 경로 (token.json, None이면 자동 생성)
+            folder_cache: 폴더 ID 캐시 (None이면 기본 캐시 파일 사용)
+            max_concurrency: 동시에 실행할 수 있는 Drive 요청 수 (None이면 설정값 사용)
+            upload_sessions: 재개 가능 업로드 세션 저장소 (None이면 기본 저장 파일 사용)
+            metadata_index: 로컬 메타데이터 인덱스 (None이면 설정에 따라 기본 DB 사용)
+            content_cache: 파일 내용 캐시 (None이면 설정에 따라 기본 캐시 사용)
+            pool_size: HTTP 연결 풀 크기 (None이면 설정값, 설정이 없으면 max_concurrency)
+            lazy: True면 인증과 서비스 생성을 첫 Drive 요청 때까지 미룸
 
         Raises:
             FileNotFoundError: credentials 파일이 없는 경우
@@ -40,42 +134,364 @@ class DriveClient:
         self.token_path = Path(token_path)
         self.creds = None
         self.service = None
+        self.pool: Optional[DriveServicePool] = None
 
-        self._authenticate()
+        if folder_cache is None:
+            folder_cache = FolderCache(
+                cache_file=Config.get_cache_dir() / "folder_cache.json",
+                ttl=Config.get_folder_cache_ttl(),
+                max_entries=Config.get_folder_cache_size()
+            )
+        self.folder_cache = folder_cache
+
+        # 재개 가능 업로드 설정
+        if upload_sessions is None:
+            upload_sessions = UploadSessionStore(Config.get_cache_dir() / "upload_sessions.json")
+        self.upload_sessions = upload_sessions
+        self.resumable_threshold = Config.get_drive_resumable_threshold()
+        chunk_size = Config.get_drive_upload_chunk_size()
+        self.upload_chunk_size = max(1, -(-chunk_size // CHUNK_SIZE_UNIT)) * CHUNK_SIZE_UNIT
+        self.upload_chunk_retries = Config.get_drive_upload_chunk_retries()
+        self.download_chunk_size = Config.get_drive_download_chunk_size()
+
+        # 로컬 메타데이터 인덱스 (changes API로 증분 동기화)
+        if metadata_index is None and Config.get_drive_metadata_index_enabled():
+            metadata_index = DriveMetadataIndex(Config.get_cache_dir() / "drive_metadata.db")
+        self.metadata_index = metadata_index
+        self.index_sync_interval = Config.get_drive_index_sync_interval()
+        # 이벤트 루프가 요청마다 다를 수 있으므로 asyncio.Lock 대신 스레드 잠금으로 동기화를 직렬화
+        self._sync_lock = threading.Lock()
+
+        # 파일 내용 캐시 (file_id + md5Checksum/version 기준)
+        if content_cache is None and Config.get_content_cache_enabled():
+            content_cache = ContentCache(
+                cache_dir=Config.get_cache_dir() / "content",
+                max_memory_bytes=Config.get_content_cache_memory_bytes(),
+                max_disk_bytes=Config.get_content_cache_disk_bytes()
+            )
+        self.content_cache = content_cache
+
+        # Drive 요청은 워커 스레드에서 실행 (이벤트 루프 블로킹 방지)
+        if max_concurrency is None:
+            max_concurrency = Config.get_drive_max_concurrency()
+        self.max_concurrency = max(1, max_concurrency)
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.max_concurrency,
+            thread_name_prefix="drive"
+        )
+        self._local = threading.local()
+
+        if pool_size is None:
+            pool_size = Config.get_drive_pool_size() or self.max_concurrency
+        self.pool_size = pool_size
+
+        # 요청 속도 제한 (사용자별 QPS 할당량) 및 재시도 설정
+        qps = Config.get_drive_rate_limit_qps()
+        self.rate_limiter = TokenBucket(qps, Config.get_drive_rate_limit_burst()) if qps > 0 else None
+        self.max_retries = Config.get_drive_max_retries()
+        self.retry_base_delay = Config.get_drive_retry_base_delay()
+        self.retry_max_delay = Config.get_drive_retry_max_delay()
+        self.retry_after_max = Config.get_drive_retry_after_max()
+        self._request_stats = {
+            "throttled": 0,
+            "server_errors": 0,
+            "retries": 0,
+            "retry_wait_seconds": 0.0
+        }
+        self._request_stats_lock = threading.Lock()
+
+        # 단계별 초기화 소요 시간 (초)
+        self.startup_timings: Dict[str, float] = {}
+        self._auth_lock = threading.Lock()
+
+        if not lazy:
+            self._ensure_authenticated()
+
+    def _ensure_authenticated(self):
+        """인증과 서비스 생성이 아직이면 실행 (여러 스레드에서 호출해도 한 번만 실행)"""
+        if self.pool is not None:
+            return
+
+        with self._auth_lock:
+            if self.pool is None:
+                self._authenticate()
+
+    async def ensure_ready(self) -> Dict[str, float]:
+        """
+        인증과 서비스 생성을 워커 스레드에서 마침 (이미 끝났으면 즉시 반환)
+
+        Returns:
+            Dict: 단계별 초기화 소요 시간 (초)
+        """
+        if self.pool is None:
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(self._executor, self._ensure_authenticated)
+        return dict(self.startup_timings)
 
     def _authenticate(self):
-        """OAuth 인증 처리"""
-        # 기존 토큰 로드
-        if self.token_path.exists():
-            self.creds = Credentials.from_authorized_user_file(
-                str(self.token_path), SCOPES
-            )
+        """OAuth 인증 처리 (같은 토큰 파일을 쓰는 클라이언트끼리 자격 증명 공유)"""
+        started = time.perf_counter()
 
-        # 토큰이 없거나 유효하지 않으면 새로 발급
-        if not self.creds or not self.creds.valid:
-            if self.creds and self.creds.expired and self.creds.refresh_token:
-                # 토큰 갱신
-                self.creds.refresh(Request())
-            else:
-                # 새로운 OAuth 플로우 시작
-                flow = InstalledAppFlow.from_client_secrets_file(
-                    str(self.credentials_path), SCOPES
-                )
-                self.creds = flow.run_local_server(port=0)
+        # 토큰 로드/갱신/발급과 이후의 선제 갱신은 CredentialsManager가 담당
+        self.credentials_manager = CredentialsManager.get(self.credentials_path, self.token_path)
+        self.creds = self.credentials_manager.load()
+
+        credentials_done = time.perf_counter()
+        self.startup_timings['credentials'] = credentials_done - started
 
-            # 토큰 저장
-            with open(self.token_path, 'w') as token_file:
-                token_file.write(self.creds.to_json())
+        # 디스커버리 문서는 패키지 포함본/디스크 캐시에서 읽어 한 번만 파싱
+        self._discovery = load_discovery_document('drive', 'v3', Config.get_cache_dir() / "discovery")
+        discovery_done = time.perf_counter()
+        self.startup_timings['discovery'] = discovery_done - credentials_done
 
         # Drive API 서비스 초기화
-        self.service = build('drive', 'v3', credentials=self.creds)
+        self.service = self._build_service()
+
+        # 워커 스레드용 연결 풀 (모든 연결이 같은 Credentials를 공유)
+        self.pool = DriveServicePool(
+            self.creds,
+            self._build_service,
+            size=self.pool_size,
+            timeout=Config.get_drive_pool_timeout()
+        )
+        self.startup_timings['service'] = time.perf_counter() - discovery_done
+
+        self.credentials_manager.add_listener(self._on_credentials_updated)
+
+    def _on_credentials_updated(self, credentials: Credentials):
+        """OAuth 재인증 등으로 자격 증명이 교체되면 서비스와 연결 풀에 반영"""
+        self.creds = credentials
+        self.service = self._build_service()
+        self.pool.set_credentials(credentials)
+
+    def _build_service(self, http: Optional[AuthorizedHttp] = None):
+        """
+        Drive API 서비스 객체 생성 (캐시된 디스커버리 문서 사용, 네트워크 요청 없음)
+
+        Args:
+            http: 사용할 인증된 HTTP 객체 (None이면 기본 연결 사용)
+        """
+        if http is None:
+            return build_from_document(self._discovery, credentials=self.creds)
+        return build_from_document(self._discovery, http=http)
+
+    def _call_with_service(self, func: Callable[..., Any], *args) -> Any:
+        """
+        워커 스레드에서 풀의 서비스 객체를 대여해 함수 호출
+
+        httplib2 연결은 스레드 안전하지 않으므로 호출 동안에는 대여한 연결을 독점하며,
+        청크 업로드/다운로드가 같은 연결을 쓰도록 현재 스레드에 HTTP 객체를 기록합니다.
+        """
+        self._ensure_authenticated()
+
+        with self.pool.lease() as pooled:
+            self._local.http = pooled.http
+            try:
+                return func(pooled.service, *args)
+            finally:
+                self._local.http = None
+
+    async def _run(self, func: Callable[..., Any], *args) -> Any:
+        """
+        Drive 작업을 워커 스레드에서 실행
+
+        Args:
+            func: func(service, *args) 형태로 호출될 동기 함수
+            *args: 추가 인자
+
+        Returns:
+            func의 반환값
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._executor,
+            partial(self._call_with_service, func, *args)
+        )
+
+    async def _execute(self, build_request: Callable[[Any], Any]) -> Any:
+        """
+        Drive API 요청을 워커 스레드에서 실행 (속도 제한 + 재시도)
+
+        Args:
+            build_request: 서비스 객체를 받아 HttpRequest를 반환하는 함수
+
+        Returns:
+            API 응답
+        """
+        return await self._call_api(lambda service: build_request(service).execute())
+
+    async def _call_api(self, func: Callable[..., Any], *args, cost: int = 1) -> Any:
+        """
+        요청 하나를 보내는 작업을 속도 제한을 지키며 실행하고, 재시도 가능한 오류면 백오프 후 재시도
+
+        Args:
+            func: func(service, *args) 형태로 호출될 동기 함수 (재시도해도 안전해야 함)
+            *args: 추가 인자
+            cost: 소모할 토큰 수 (배치 요청은 포함된 요청 수)
+
+        Returns:
+            func의 반환값
+        """
+        attempt = 0
+        while True:
+            await self._throttle(cost)
+            try:
+                return await self._run(func, *args)
+            except Exception as e:
+                delay = self._retry_delay(e, attempt)
+                if delay is None:
+                    raise
+                attempt += 1
+                await self._backoff(delay)
+
+    async def _throttle(self, cost: int = 1):
+        """토큰 버킷에서 요청 cost개만큼 예약하고 필요한 만큼 대기"""
+        if self.rate_limiter is not None:
+            await self.rate_limiter.acquire(cost)
+
+    async def _backoff(self, delay: float):
+        """재시도 전 대기 (통계 기록)"""
+        with self._request_stats_lock:
+            self._request_stats["retries"] += 1
+            self._request_stats["retry_wait_seconds"] += delay
+        await asyncio.sleep(delay)
+
+    def _retry_delay(self, error: Exception, attempt: int, max_retries: Optional[int] = None) -> Optional[float]:
+        """
+        재시도 전 대기 시간 계산
+
+        429/403 속도 제한, 5xx, 408, 네트워크 오류만 재시도합니다. 서버가 Retry-After를 주면
+        그 시간을 모두 기다리고(retry_after_max보다 길면 재시도하지 않음),
+        아니면 지수 백오프(base * 2^attempt, 최대 max_delay)에 지터를 더합니다.
+        속도 제한 응답이면 토큰 버킷도 같은 시간만큼 멈춰 다른 요청이 함께 물러나게 합니다.
+
+        Args:
+            error: 발생한 오류
+            attempt: 지금까지 재시도한 횟수
+            max_retries: 최대 재시도 횟수 (None이면 설정값)
+
+        Returns:
+            float: 대기 시간 (초, 재시도하지 않을 오류면 None)
+        """
+        if max_retries is None:
+            max_retries = self.max_retries
+
+        rate_limited = False
+        retry_after = None
+        if isinstance(error, HttpError):
+            status = error.resp.status
+            rate_limited = status == 429 or (
+                status == 403 and bool(self._error_reasons(error) & RATE_LIMIT_REASONS)
+            )
+            if not rate_limited and status not in RETRYABLE_STATUS:
+                return None
+            retry_after = self._retry_after(error)
+
+            with self._request_stats_lock:
+                key = "throttled" if rate_limited else "server_errors"
+                self._request_stats[key] += 1
+        elif not isinstance(error, RETRYABLE_ERRORS):
+            return None
+
+        if attempt >= max_retries:
+            return None
+
+        if retry_after is not None:
+            # 허용 시각 전에 다시 보내지 않도록 줄이지 않고 그대로 대기
+            if retry_after > self.retry_after_max:
+                return None
+            delay = retry_after
+        else:
+            # 지수 백오프 + equal jitter (절반은 고정, 절반은 무작위)
+            ceiling = min(self.retry_max_delay, self.retry_base_delay * (2 ** attempt))
+            delay = ceiling / 2 + random.uniform(0, ceiling / 2)
+
+        if rate_limited and self.rate_limiter is not None:
+            self.rate_limiter.pause(delay)
+
+        return delay
+
+    @staticmethod
+    def _error_reasons(error: HttpError) -> set:
+        """HttpError 응답 본문의 errors[].reason 목록"""
+        try:
+            body = json.loads(error.content)
+            return {item.get('reason') for item in body['error'].get('errors', [])}
+        except (ValueError, KeyError, TypeError, AttributeError):
+            return set()
+
+    @staticmethod
+    def _retry_after(error: HttpError) -> Optional[float]:
+        """Retry-After 헤더 (초 단위만 지원, 없으면 None)"""
+        value = error.resp.get('retry-after')
+        try:
+            return max(0.0, float(value)) if value is not None else None
+        except ValueError:
+            return None
+
+    def request_stats(self) -> Dict[str, Any]:
+        """
+        Drive 요청 계층 통계 반환
+
+        Returns:
+            Dict: 속도 제한 응답/서버 오류/재시도 횟수, 재시도 대기 시간, 토큰 버킷 대기 통계
+        """
+        with self._request_stats_lock:
+            stats = dict(self._request_stats)
+
+        if self.rate_limiter is not None:
+            limiter = self.rate_limiter.stats()
+            stats["limiter_waits"] = limiter["throttled"]
+            stats["limiter_wait_seconds"] = limiter["wait_seconds"]
+        return stats
+
+    def pool_stats(self) -> Dict[str, Any]:
+        """
+        HTTP 연결 풀 통계 반환
+
+        Returns:
+            Dict: 대여 횟수, 재사용 비율, 대기 시간, 새 연결(TLS 핸드셰이크) 수 등
+        """
+        if self.pool is None:
+            return {}
+        return self.pool.stats()
+
+    def close(self):
+        """워커 스레드 종료"""
+        self._executor.shutdown(wait=False)
 
     async def create_folder(self, folder_name: str, parent_id: Optional[str] = None) -> str:
         """
         폴더 생성 (이미 존재하면 기존 폴더 ID 반환)
 
+        "proj/sub/dir" 같은 중첩 경로를 지원하며, 캐시에 없는 구간만 Drive에서 조회/생성합니다.
+
         Args:
-            folder_name: 생성할 폴더 이름
+            folder_name: 생성할 폴더 이름 또는 경로
+            parent_id: 부모 폴더 ID (None이면 루트)
+
+        Returns:
+            str: 폴더 ID (중첩 경로면 마지막 폴더의 ID)
+
+        Raises:
+            Exception: 폴더 생성 실패 시
+        """
+        segments = [segment for segment in folder_name.split('/') if segment]
+        if not segments:
+            raise Exception(f"폴더 생성 실패: 잘못된 폴더 이름입니다: {folder_name}")
+
+        folder_id = parent_id
+        for segment in segments:
+            folder_id = await self._resolve_folder(segment, folder_id)
+
+        return folder_id
+
+    async def _resolve_folder(self, folder_name: str, parent_id: Optional[str] = None) -> str:
+        """
+        단일 폴더 이름을 ID로 해석 (캐시 → 검색 → 생성 순)
+
+        Args:
+            folder_name: 폴더 이름 (경로 구분자 없음)
             parent_id: 부모 폴더 ID (None이면 루트)
 
         Returns:
@@ -84,108 +500,469 @@ class DriveClient:
         Raises:
             Exception: 폴더 생성 실패 시
         """
+        cached_id = self.folder_cache.get(parent_id, folder_name)
+        if cached_id:
+            return cached_id
+
         try:
             # 기존 폴더 검색
-            query = f"name='{folder_name}' and mimeType='application/vnd.google-apps.folder' and trashed=false"
-            if parent_id:
-                query += f" and '{parent_id}' in parents"
+            query = self._folder_query(folder_name, parent_id)
 
-            results = self.service.files().list(
+            results = await self._execute(lambda service: service.files().list(
                 q=query,
                 spaces='drive',
                 fields='files(id, name)'
-            ).execute()
+            ))
 
             files = results.get('files', [])
 
             if files:
                 # 기존 폴더 반환
-                return files[0]['id']
-
-            # 새 폴더 생성
-            file_metadata = {
-                'name': folder_name,
-                'mimeType': 'application/vnd.google-apps.folder'
-            }
+                folder_id = files[0]['id']
+            else:
+                # 새 폴더 생성
+                file_metadata = {
+                    'name': folder_name,
+                    'mimeType': FOLDER_MIME_TYPE
+                }
 
-            if parent_id:
-                file_metadata['parents'] = [parent_id]
+                if parent_id:
+                    file_metadata['parents'] = [parent_id]
 
-            folder = self.service.files().create(
-                body=file_metadata,
-                fields='id'
-            ).execute()
+                folder = await self._execute(lambda service: service.files().create(
+                    body=file_metadata,
+                    fields=INDEX_FIELDS
+                ))
 
-            return folder.get('id')
+                folder_id = folder.get('id')
+                self._index_upsert(folder)
 
         except Exception as e:
+            self._invalidate_if_not_found(e, parent_id)
             raise Exception(f"폴더 생성 실패: {str(e)}")
 
+        self.folder_cache.set(parent_id, folder_name, folder_id)
+        return folder_id
+
+    def invalidate_folder(self, folder_id: str):
+        """
+        캐시된 폴더 ID 무효화
+
+        Args:
+            folder_id: 무효화할 폴더 ID
+        """
+        self.folder_cache.invalidate_id(folder_id)
+
+    def _invalidate_if_not_found(self, error: Exception, folder_id: Optional[str]) -> Optional[Dict]:
+        """
+        404 응답이면 해당 폴더 ID를 캐시에서 제거
+
+        Args:
+            error: 발생한 예외
+            folder_id: 요청에 사용한 폴더 ID
+
+        Returns:
+            Dict: 무효화된 캐시 항목 (parent_id, name, id). 캐시에 없었으면 None
+        """
+        if not folder_id or not isinstance(error, HttpError):
+            return None
+        if error.resp.status != 404:
+            return None
+
+        for entry in self.folder_cache.invalidate_id(folder_id):
+            if entry["id"] == folder_id:
+                return entry
+
+        return None
+
     async def upload_file(
         self,
-        content: str,
+        content: UploadContent,
         filename: str,
         folder_id: Optional[str] = None,
-        mime_type: str = "text/plain"
+        mime_type: str = "text/plain",
+        resumable: Optional[bool] = None,
+        progress_callback: Optional[ProgressCallback] = None,
+        overwrite: bool = False,
+        file_id: Optional[str] = None
     ) -> Dict[str, str]:
         """
         파일 업로드
 
+        크기가 재개 가능 업로드 기준(DRIVE_RESUMABLE_THRESHOLD) 이상이면 청크 단위로 업로드하며,
+        중단된 업로드는 다음 호출 시 마지막으로 확인된 바이트부터 이어서 전송합니다.
+
+        overwrite가 True면 대상 폴더에 같은 이름의 파일이 있을 때 새 파일을 만들지 않고,
+        로컬 MD5와 Drive의 md5Checksum이 같으면 업로드를 건너뛰고 다르면 내용만 갱신합니다.
+
         Args:
-            content: 파일 내용 (문자열)
+            content: 파일 내용 (문자열은 UTF-8로 인코딩, 바이트/스트림은 그대로 업로드)
             filename: 파일 이름
             folder_id: 업로드할 폴더 ID (None이면 루트)
             mime_type: MIME 타입
+            resumable: 재개 가능 업로드 사용 여부 (None이면 크기로 자동 결정)
+            progress_callback: 진행 상황 콜백 callback(sent_bytes, total_bytes)
+            overwrite: 같은 이름의 기존 파일을 갱신할지 여부
+            file_id: 내용을 갱신할 기존 파일 ID (지정하면 이름 검색 없이 바로 갱신)
 
         Returns:
             {
                 "file_id": "파일 ID",
                 "file_name": "파일 이름",
-                "web_view_link": "웹 링크"
+                "web_view_link": "웹 링크",
+                "status": "created" | "updated" | "unchanged"
             }
 
         Raises:
             Exception: 업로드 실패 시
         """
+        stream = self._to_stream(content)
+        size = self._stream_size(stream)
+        if resumable is None:
+            resumable = size >= self.resumable_threshold
+        # 전체 내용 해시는 이벤트 루프를 막지 않도록 스레드에서 계산
+        local_md5 = await asyncio.to_thread(self._stream_md5, stream) if overwrite and not file_id else None
+
+        async def attempt(target_folder_id: Optional[str]) -> Dict[str, str]:
+            if file_id:
+                return await send(target_folder_id, file_id)
+
+            existing = None
+            if overwrite:
+                existing = await self._find_existing(filename, target_folder_id, local_md5)
+
+            if existing is not None:
+                if existing.get('md5Checksum') == local_md5:
+                    await self._report_progress(progress_callback, size, size)
+                    return {
+                        "file_id": existing.get('id'),
+                        "file_name": existing.get('name'),
+                        "web_view_link": existing.get('webViewLink'),
+                        "status": "unchanged"
+                    }
+
+                try:
+                    return await send(target_folder_id, existing['id'])
+                except HttpError as e:
+                    if e.resp.status != 404:
+                        raise
+                    # 인덱스에 남아 있던 파일이 이미 삭제된 경우: 새로 생성
+                    self._index_remove(existing['id'])
+
+            return await send(target_folder_id, None)
+
+        async def send(target_folder_id: Optional[str], target_file_id: Optional[str]) -> Dict[str, str]:
+            if resumable:
+                result = await self._upload_resumable(
+                    stream, size, filename, target_folder_id, mime_type, progress_callback, target_file_id
+                )
+            else:
+                result = await self._call_api(
+                    self._upload, stream, filename, target_folder_id, mime_type, target_file_id
+                )
+                await self._report_progress(progress_callback, size, size)
+
+            if target_file_id and self.content_cache is not None:
+                self.content_cache.invalidate(target_file_id)
+            result["status"] = "updated" if target_file_id else "created"
+            return result
+
+        try:
+            return await attempt(folder_id)
+        except Exception as e:
+            stale_entry = self._invalidate_if_not_found(e, folder_id)
+            if stale_entry is None:
+                raise Exception(f"파일 업로드 실패: {str(e)}")
+
+        # 캐시된 폴더가 삭제된 경우: 폴더를 다시 해석한 뒤 한 번 재시도
+        folder_id = await self._resolve_folder(stale_entry["name"], stale_entry["parent_id"])
         try:
-            # 임시 파일 생성
-            temp_file = Path(f"/tmp/{filename}")
-            temp_file.parent.mkdir(parents=True, exist_ok=True)
+            return await attempt(folder_id)
+        except Exception as e:
+            raise Exception(f"파일 업로드 실패: {str(e)}")
+
+    async def _upload_resumable(
+        self,
+        stream: BinaryIO,
+        size: int,
+        filename: str,
+        folder_id: Optional[str],
+        mime_type: str,
+        progress_callback: Optional[ProgressCallback] = None,
+        file_id: Optional[str] = None
+    ) -> Dict[str, str]:
+        """
+        재개 가능(청크) 업로드 실행
 
-            with open(temp_file, 'w', encoding='utf-8') as f:
-                f.write(content)
+        세션 URI와 서버가 확인한 오프셋을 청크마다 저장하므로, 프로세스가 재시작되어도
+        같은 내용을 다시 업로드하면 중단된 지점부터 이어서 전송합니다.
+        file_id가 있으면 새 파일 대신 기존 파일의 내용을 갱신합니다.
+        """
+        # 큰 내용의 해시 계산이 이벤트 루프를 막지 않도록 스레드에서 실행
+        upload_key = await asyncio.to_thread(self._upload_key, stream, filename, folder_id, mime_type)
+
+        def build_request(service):
+            media = MediaIoBaseUpload(
+                stream,
+                mimetype=mime_type,
+                chunksize=self.upload_chunk_size,
+                resumable=True
+            )
+            return self._upload_request(service, media, filename, folder_id, file_id)
+
+        request = await self._run(build_request)
+
+        saved = self.upload_sessions.get(upload_key)
+        resumed = saved is not None and saved.get("size") == size
+        if resumed:
+            # 저장된 세션에서 재개: 먼저 서버에 실제 확인된 오프셋을 조회하도록 오류 상태로 표시
+            request.resumable_uri = saved["resumable_uri"]
+            request.resumable_progress = saved["offset"]
+            request._in_error_state = True
+            await self._report_progress(progress_callback, saved["offset"], size)
+
+        response = None
+        failures = 0
+        while response is None:
+            await self._throttle()
+            try:
+                status, response = await self._run(self._next_chunk, request)
+            except Exception as e:
+                if resumed and isinstance(e, HttpError) and e.resp.status in (404, 410):
+                    # 세션 만료: 처음부터 다시 업로드
+                    self.upload_sessions.remove(upload_key)
+                    return await self._upload_resumable(
+                        stream, size, filename, folder_id, mime_type, progress_callback, file_id
+                    )
+
+                delay = self._retry_delay(e, failures, self.upload_chunk_retries)
+                if delay is None:
+                    raise
+                failures += 1
+                # 대기 후 다음 호출에서 서버에 확인된 오프셋을 조회한 뒤 이어서 전송
+                await self._backoff(delay)
+                continue
+
+            resumed = False
+            failures = 0
+
+            if response is None:
+                self.upload_sessions.update(
+                    upload_key,
+                    resumable_uri=request.resumable_uri,
+                    offset=request.resumable_progress,
+                    size=size,
+                    filename=filename
+                )
+                await self._report_progress(progress_callback, request.resumable_progress, size)
+
+        self.upload_sessions.remove(upload_key)
+        self._index_upsert(response)
+        await self._report_progress(progress_callback, size, size)
+
+        return {
+            "file_id": response.get('id'),
+            "file_name": response.get('name'),
+            "web_view_link": response.get('webViewLink')
+        }
+
+    def _next_chunk(self, service, request):
+        """현재 워커의 HTTP 연결로 다음 청크 전송"""
+        return request.next_chunk(http=self._local.http)
+
+    @staticmethod
+    async def _report_progress(
+        progress_callback: Optional[ProgressCallback],
+        sent: int,
+        total: int
+    ):
+        """진행 상황 콜백 호출 (코루틴 콜백이면 대기)"""
+        if progress_callback is None:
+            return
+
+        result = progress_callback(sent, total)
+        if inspect.isawaitable(result):
+            await result
+
+    @staticmethod
+    def _stream_size(stream: BinaryIO) -> int:
+        """스트림 전체 크기 (현재 위치는 처음으로 되돌림)"""
+        stream.seek(0, io.SEEK_END)
+        size = stream.tell()
+        stream.seek(0)
+        return size
+
+    @staticmethod
+    def _upload_key(
+        stream: BinaryIO,
+        filename: str,
+        folder_id: Optional[str],
+        mime_type: str
+    ) -> str:
+        """업로드 세션 식별 키 (대상 위치 + 내용 해시)"""
+        digest = hashlib.sha256()
+        digest.update(f"{folder_id or ''}\0{filename}\0{mime_type}\0".encode('utf-8'))
 
-            # 메타데이터 구성
-            file_metadata = {'name': filename}
-            if folder_id:
-                file_metadata['parents'] = [folder_id]
+        stream.seek(0)
+        for block in iter(lambda: stream.read(1024 * 1024), b''):
+            digest.update(block)
+        stream.seek(0)
+
+        return digest.hexdigest()
 
-            # 파일 업로드
-            media = MediaFileUpload(str(temp_file), mimetype=mime_type)
-            file = self.service.files().create(
-                body=file_metadata,
+    def _upload(
+        self,
+        service,
+        stream: BinaryIO,
+        filename: str,
+        folder_id: Optional[str],
+        mime_type: str,
+        file_id: Optional[str] = None
+    ) -> Dict[str, str]:
+        """파일 업로드 요청 실행 (디스크를 거치지 않고 메모리에서 바로 전송)"""
+        media = MediaIoBaseUpload(stream, mimetype=mime_type)
+        file = self._upload_request(service, media, filename, folder_id, file_id).execute()
+        self._index_upsert(file)
+
+        return {
+            "file_id": file.get('id'),
+            "file_name": file.get('name'),
+            "web_view_link": file.get('webViewLink')
+        }
+
+    @staticmethod
+    def _upload_request(
+        service,
+        media: MediaIoBaseUpload,
+        filename: str,
+        folder_id: Optional[str],
+        file_id: Optional[str] = None
+    ):
+        """업로드 요청 생성 (file_id가 있으면 기존 파일 내용 갱신, 없으면 새 파일 생성)"""
+        if file_id:
+            return service.files().update(
+                fileId=file_id,
                 media_body=media,
-                fields='id, name, webViewLink'
-            ).execute()
+                fields=INDEX_FIELDS
+            )
 
-            # 임시 파일 삭제
-            temp_file.unlink()
+        file_metadata = {'name': filename}
+        if folder_id:
+            file_metadata['parents'] = [folder_id]
 
-            return {
-                "file_id": file.get('id'),
-                "file_name": file.get('name'),
-                "web_view_link": file.get('webViewLink')
-            }
+        return service.files().create(
+            body=file_metadata,
+            media_body=media,
+            fields=INDEX_FIELDS
+        )
 
-        except Exception as e:
-            raise Exception(f"파일 업로드 실패: {str(e)}")
+    async def _find_existing(
+        self,
+        filename: str,
+        folder_id: Optional[str],
+        md5: Optional[str] = None
+    ) -> Optional[Dict]:
+        """
+        대상 폴더에서 같은 이름의 기존 파일 조회 (덮어쓰기 업로드용)
+
+        md5Checksum이 없는 파일(Google 문서 등)은 내용을 비교할 수 없으므로 제외합니다.
+        인덱스에서 찾은 파일의 md5Checksum이 md5와 같으면 업로드를 건너뛰게 되므로,
+        인덱스가 마지막 동기화 이후의 변경을 놓쳤을 수 있어 Drive에서 실제 파일을 다시 확인합니다.
 
-    async def download_file(self, file_id: str) -> str:
+        Args:
+            filename: 파일 이름
+            folder_id: 대상 폴더 ID (None이면 루트)
+            md5: 업로드할 내용의 MD5
+        """
+        file = None
+        if folder_id and await self._use_index():
+            file = self.metadata_index.find_by_name(filename, folder_id)
+            if file is not None and md5 is not None and file.get('md5Checksum') == md5:
+                file = await self._live_file(file['id'], filename, folder_id)
+
+        if file is None:
+            results = await self._execute(lambda service: service.files().list(
+                q=self._search_query(filename, folder_id or 'root'),
+                spaces='drive',
+                fields='files(id, name, md5Checksum, webViewLink)',
+                orderBy=LIST_ORDER_BY,
+                pageSize=1
+            ))
+            files = results.get('files', [])
+            file = files[0] if files else None
+
+        if file is None or not file.get('md5Checksum'):
+            return None
+        return file
+
+    async def _live_file(self, file_id: str, filename: str, folder_id: str) -> Optional[Dict]:
+        """
+        인덱스에서 찾은 파일을 Drive에서 다시 조회하고 인덱스도 갱신
+
+        Returns:
+            Dict: 파일 정보 (삭제/휴지통 이동/이름 변경/이동되어 더 이상 대상이 아니면 None)
+        """
+        try:
+            file = await self._execute(
+                lambda service: service.files().get(fileId=file_id, fields=INDEX_FIELDS)
+            )
+        except HttpError as e:
+            if e.resp.status != 404:
+                raise
+            self._index_remove(file_id)
+            return None
+
+        if file.get('trashed'):
+            self._index_remove(file_id)
+            return None
+
+        self._index_upsert(file)
+        if file.get('name') != filename or folder_id not in (file.get('parents') or []):
+            return None
+        return file
+
+    @staticmethod
+    def _stream_md5(stream: BinaryIO) -> str:
+        """스트림 내용의 MD5 (Drive md5Checksum과 비교용, 현재 위치는 처음으로 되돌림)"""
+        digest = hashlib.md5()
+
+        stream.seek(0)
+        for block in iter(lambda: stream.read(1024 * 1024), b''):
+            digest.update(block)
+        stream.seek(0)
+
+        return digest.hexdigest()
+
+    @staticmethod
+    def _to_stream(content: UploadContent) -> BinaryIO:
+        """
+        업로드 내용을 바이너리 스트림으로 변환
+
+        문자열은 한 번만 인코딩하고, 스트림은 복사 없이 그대로 사용합니다.
+        (스트림은 처음 위치부터 업로드됩니다)
+        """
+        if isinstance(content, str):
+            return io.BytesIO(content.encode('utf-8'))
+        if isinstance(content, (bytes, bytearray, memoryview)):
+            return io.BytesIO(content)
+        return content
+
+    async def download_file(
+        self,
+        file_id: str,
+        progress_callback: Optional[ProgressCallback] = None,
+        use_cache: bool = True
+    ) -> str:
         """
         파일 다운로드
 
+        내용 캐시가 있으면 md5Checksum/version으로 재검증한 뒤, 바뀌지 않았으면 캐시된 내용을 반환합니다.
+        (재검증은 로컬 메타데이터 인덱스 또는 가벼운 메타데이터 조회로 처리)
+
         Args:
             file_id: 다운로드할 파일 ID
+            progress_callback: 진행 상황 콜백 callback(received_bytes, total_bytes)
+            use_cache: False면 캐시를 사용하지 않고 항상 다운로드
 
         Returns:
             str: 파일 내용 (문자열)
@@ -193,30 +970,190 @@ class DriveClient:
         Raises:
             Exception: 다운로드 실패 시
         """
+        version_tag = None
+        if use_cache and self.content_cache is not None:
+            version_tag = await self._content_version(file_id)
+
+        if version_tag is None:
+            parts = [
+                text async for text in self.stream_text(file_id, progress_callback=progress_callback)
+            ]
+            return "".join(parts)
+
+        data = self.content_cache.get(file_id, version_tag)
+        if data is None:
+            chunks = [
+                chunk async for chunk in self.stream_file(file_id, progress_callback=progress_callback)
+            ]
+            data = b"".join(chunks)
+            self.content_cache.put(file_id, version_tag, data)
+        else:
+            await self._report_progress(progress_callback, len(data), len(data))
+
+        try:
+            return data.decode('utf-8')
+        except UnicodeDecodeError as e:
+            raise Exception(f"파일 다운로드 실패: {str(e)}")
+
+    async def _content_version(self, file_id: str) -> Optional[str]:
+        """
+        캐시 키로 사용할 파일 버전 태그 조회
+
+        Returns:
+            str: "md5:<md5Checksum>" 또는 "v:<version>" (조회 실패 시 None)
+        """
+        if await self._use_index():
+            file = self.metadata_index.get(file_id)
+            if file and file.get('md5Checksum'):
+                return f"md5:{file['md5Checksum']}"
+
+        try:
+            metadata = await self.get_file_metadata(file_id, fields='md5Checksum, version')
+        except Exception:
+            return None
+
+        if metadata.get('md5Checksum'):
+            return f"md5:{metadata['md5Checksum']}"
+        if metadata.get('version'):
+            return f"v:{metadata['version']}"
+        return None
+
+    def cache_stats(self) -> Dict[str, Any]:
+        """
+        내용 캐시 통계 반환
+
+        Returns:
+            Dict: 적중/미스/제거 횟수와 계층별 사용량 (캐시 비활성화 시 {"enabled": False})
+        """
+        if self.content_cache is None:
+            return {"enabled": False}
+        return {"enabled": True, **self.content_cache.stats()}
+
+    async def stream_file(
+        self,
+        file_id: str,
+        chunk_size: Optional[int] = None,
+        progress_callback: Optional[ProgressCallback] = None
+    ) -> AsyncIterator[bytes]:
+        """
+        파일을 청크 단위로 스트리밍 다운로드
+
+        전체 파일을 메모리에 모으지 않고, 청크를 받는 즉시 반환합니다.
+
+        Args:
+            file_id: 다운로드할 파일 ID
+            chunk_size: 청크 크기 (바이트, None이면 설정값 사용)
+            progress_callback: 진행 상황 콜백 callback(received_bytes, total_bytes)
+
+        Yields:
+            bytes: 파일 내용 청크
+
+        Raises:
+            Exception: 다운로드 실패 시
+        """
+        sink = _ChunkSink()
+
+        def build_downloader(service):
+            request = service.files().get_media(fileId=file_id)
+            downloader = MediaIoBaseDownload(
+                sink, request, chunksize=chunk_size or self.download_chunk_size
+            )
+            return request, downloader
+
         try:
-            request = self.service.files().get_media(fileId=file_id)
-            file_io = io.BytesIO()
-            downloader = MediaIoBaseDownload(file_io, request)
+            request, downloader = await self._run(build_downloader)
 
             done = False
             while not done:
-                status, done = downloader.next_chunk()
+                status, done = await self._call_api(self._next_download_chunk, request, downloader)
 
-            file_io.seek(0)
-            content = file_io.read().decode('utf-8')
+                for chunk in sink.drain():
+                    yield chunk
 
-            return content
+                if status is not None:
+                    await self._report_progress(
+                        progress_callback, status.resumable_progress, status.total_size
+                    )
 
         except Exception as e:
             raise Exception(f"파일 다운로드 실패: {str(e)}")
 
-    async def search_file(self, filename: str, folder_id: Optional[str] = None) -> Optional[Dict]:
+    async def stream_text(
+        self,
+        file_id: str,
+        chunk_size: Optional[int] = None,
+        encoding: str = 'utf-8',
+        progress_callback: Optional[ProgressCallback] = None
+    ) -> AsyncIterator[str]:
+        """
+        텍스트 파일을 청크 단위로 스트리밍 다운로드 (점진적 디코딩)
+
+        청크 경계에서 잘린 멀티바이트 문자는 다음 청크와 합쳐 디코딩합니다.
+
+        Args:
+            file_id: 다운로드할 파일 ID
+            chunk_size: 청크 크기 (바이트, None이면 설정값 사용)
+            encoding: 텍스트 인코딩
+            progress_callback: 진행 상황 콜백 callback(received_bytes, total_bytes)
+
+        Yields:
+            str: 디코딩된 텍스트 조각
+
+        Raises:
+            Exception: 다운로드 실패 시
+        """
+        decoder = codecs.getincrementaldecoder(encoding)()
+
+        async for chunk in self.stream_file(file_id, chunk_size, progress_callback):
+            text = decoder.decode(chunk)
+            if text:
+                yield text
+
+        text = decoder.decode(b'', final=True)
+        if text:
+            yield text
+
+    def _next_download_chunk(self, service, request, downloader):
+        """현재 워커의 HTTP 연결로 다음 다운로드 청크 수신"""
+        request.http = self._local.http
+        return downloader.next_chunk()
+
+    async def get_file_metadata(self, file_id: str, fields: str = METADATA_FIELDS) -> Dict:
+        """
+        파일 메타데이터 조회
+
+        Args:
+            file_id: 조회할 파일 ID
+            fields: 조회할 필드
+
+        Returns:
+            Dict: 파일 메타데이터
+
+        Raises:
+            Exception: 조회 실패 시
+        """
+        try:
+            return await self._execute(
+                lambda service: service.files().get(fileId=file_id, fields=fields)
+            )
+        except Exception as e:
+            raise Exception(f"파일 정보 조회 실패: {str(e)}")
+
+    async def search_file(
+        self,
+        filename: str,
+        folder_id: Optional[str] = None,
+        force_remote: bool = False
+    ) -> Optional[Dict]:
         """
         파일 이름으로 검색
 
+        로컬 메타데이터 인덱스가 있으면 인덱스에서 먼저 찾고, 없을 때만 Drive에 조회합니다.
+
         Args:
             filename: 검색할 파일 이름
             folder_id: 검색할 폴더 ID (None이면 전체)
+            force_remote: True면 인덱스를 사용하지 않고 항상 Drive에 조회
 
         Returns:
             Dict: 파일 정보 (없으면 None)
@@ -230,17 +1167,20 @@ class DriveClient:
         Raises:
             Exception: 검색 실패 시
         """
+        if await self._use_index(force_remote):
+            file = self.metadata_index.find_by_name(filename, folder_id)
+            if file:
+                return self._project(file, 'id, name, mimeType, webViewLink')
+
         try:
-            query = f"name='{filename}' and trashed=false"
-            if folder_id:
-                query += f" and '{folder_id}' in parents"
+            query = self._search_query(filename, folder_id)
 
-            results = self.service.files().list(
+            results = await self._execute(lambda service: service.files().list(
                 q=query,
                 spaces='drive',
                 fields='files(id, name, mimeType, webViewLink)',
                 pageSize=1
-            ).execute()
+            ))
 
             files = results.get('files', [])
 
@@ -250,21 +1190,28 @@ class DriveClient:
             return None
 
         except Exception as e:
+            self._invalidate_if_not_found(e, folder_id)
             raise Exception(f"파일 검색 실패: {str(e)}")
 
     async def list_files(
         self,
         folder_id: Optional[str] = None,
         query: Optional[str] = None,
-        max_results: int = 100
+        max_results: int = 100,
+        fields: str = LIST_FIELDS,
+        order_by: str = LIST_ORDER_BY,
+        force_remote: bool = False
     ) -> List[Dict]:
         """
-        파일 목록 조회
+        파일 목록 조회 (여러 페이지를 따라가며 max_results개까지)
 
         Args:
             folder_id: 조회할 폴더 ID (None이면 전체)
             query: 추가 검색 쿼리 (선택)
             max_results: 최대 결과 수
+            fields: 파일별로 조회할 필드
+            order_by: 정렬 기준
+            force_remote: True면 인덱스를 사용하지 않고 항상 Drive에 조회
 
         Returns:
             List[Dict]: 파일 목록
@@ -272,6 +1219,145 @@ class DriveClient:
         Raises:
             Exception: 조회 실패 시
         """
+        return [
+            file async for file in self.iter_files(
+                folder_id=folder_id,
+                query=query,
+                fields=fields,
+                order_by=order_by,
+                max_results=max_results,
+                force_remote=force_remote
+            )
+        ]
+
+    async def iter_files(
+        self,
+        folder_id: Optional[str] = None,
+        query: Optional[str] = None,
+        fields: str = LIST_FIELDS,
+        order_by: str = LIST_ORDER_BY,
+        max_results: Optional[int] = None,
+        page_size: int = MAX_PAGE_SIZE,
+        force_remote: bool = False
+    ) -> AsyncIterator[Dict]:
+        """
+        파일 목록을 페이지 단위로 따라가며 하나씩 반환
+
+        현재 페이지를 소비하는 동안 다음 페이지를 미리 요청합니다.
+
+        Args:
+            folder_id: 조회할 폴더 ID (None이면 전체)
+            query: 추가 검색 쿼리 (선택)
+            fields: 파일별로 조회할 필드
+            order_by: 정렬 기준
+            max_results: 전체 최대 결과 수 (None이면 제한 없음)
+            page_size: 요청당 페이지 크기 (최대 1000)
+            force_remote: True면 인덱스를 사용하지 않고 항상 Drive에 조회
+
+        Yields:
+            Dict: 파일 정보
+
+        Raises:
+            Exception: 조회 실패 시
+        """
+        remaining = max_results
+
+        def fetch(page_token: Optional[str]) -> "asyncio.Future":
+            size = page_size if remaining is None else min(page_size, remaining)
+            return asyncio.ensure_future(self.list_files_page(
+                folder_id=folder_id,
+                query=query,
+                page_size=size,
+                page_token=page_token,
+                fields=fields,
+                order_by=order_by,
+                force_remote=force_remote
+            ))
+
+        if remaining is not None and remaining <= 0:
+            return
+
+        pending = fetch(None)
+        try:
+            while pending is not None:
+                page = await pending
+                pending = None
+
+                files = page["files"]
+                if remaining is not None:
+                    files = files[:remaining]
+                    remaining -= len(files)
+
+                # 다음 페이지 미리 요청
+                if page["next_page_token"] and (remaining is None or remaining > 0):
+                    pending = fetch(page["next_page_token"])
+
+                for file in files:
+                    yield file
+        finally:
+            if pending is not None and not pending.done():
+                pending.cancel()
+
+    async def list_files_page(
+        self,
+        folder_id: Optional[str] = None,
+        query: Optional[str] = None,
+        page_size: int = 100,
+        page_token: Optional[str] = None,
+        fields: str = LIST_FIELDS,
+        order_by: str = LIST_ORDER_BY,
+        force_remote: bool = False
+    ) -> Dict:
+        """
+        파일 목록 한 페이지 조회
+
+        추가 쿼리가 없고 인덱스가 필드/정렬을 지원하면 로컬 인덱스에서 바로 반환합니다.
+        (이때 next_page_token은 "local:"로 시작하며, 페이지 사이에 인덱스가 바뀌어도 마지막 파일 다음부터 이어서 조회)
+        로컬 페이지 토큰을 받았는데 인덱스를 쓸 수 없으면 같은 페이지를 반복하지 않도록 오류를 냅니다.
+
+        Args:
+            folder_id: 조회할 폴더 ID (None이면 전체)
+            query: 추가 검색 쿼리 (선택)
+            page_size: 페이지 크기 (최대 1000)
+            page_token: 이전 페이지의 next_page_token (None이면 첫 페이지)
+            fields: 파일별로 조회할 필드
+            order_by: 정렬 기준
+            force_remote: True면 인덱스를 사용하지 않고 항상 Drive에 조회
+
+        Returns:
+            {
+                "files": [파일 정보, ...],
+                "next_page_token": "다음 페이지 토큰 (마지막 페이지면 None)"
+            }
+
+        Raises:
+            Exception: 조회 실패 시
+        """
+        page_size = max(1, min(page_size, MAX_PAGE_SIZE))
+        local_token = page_token is not None and page_token.startswith(LOCAL_PAGE_TOKEN_PREFIX)
+        if (
+            (page_token is None or local_token)
+            and query is None
+            and self._index_supports(fields, order_by)
+            and await self._use_index(force_remote)
+        ):
+            after = self._decode_local_token(page_token, order_by) if local_token else None
+            files = self.metadata_index.list_files(
+                parent_id=folder_id,
+                order_by=order_by,
+                limit=page_size + 1,
+                after=after
+            )
+            has_more = len(files) > page_size
+            files = files[:page_size]
+            return {
+                "files": [self._project(file, fields) for file in files],
+                "next_page_token": self._encode_local_token(files[-1], order_by) if has_more else None
+            }
+        if local_token:
+            # 로컬 커서는 Drive 페이지 토큰으로 바꿀 수 없음 (처음부터 다시 조회하면 같은 페이지가 반복됨)
+            raise Exception("파일 목록 조회 실패: 로컬 인덱스 페이지 토큰을 사용할 수 없습니다. 첫 페이지부터 다시 조회하세요.")
+
         try:
             base_query = "trashed=false"
 
@@ -281,19 +1367,48 @@ class DriveClient:
             if query:
                 base_query += f" and {query}"
 
-            results = self.service.files().list(
+            results = await self._execute(lambda service: service.files().list(
                 q=base_query,
                 spaces='drive',
-                fields='files(id, name, mimeType, createdTime, webViewLink)',
-                pageSize=max_results,
-                orderBy='createdTime desc'
-            ).execute()
+                fields=f'nextPageToken, files({fields})',
+                pageSize=page_size,
+                pageToken=page_token,
+                orderBy=order_by
+            ))
 
-            return results.get('files', [])
+            return {
+                "files": results.get('files', []),
+                "next_page_token": results.get('nextPageToken')
+            }
 
         except Exception as e:
+            self._invalidate_if_not_found(e, folder_id)
             raise Exception(f"파일 목록 조회 실패: {str(e)}")
 
+    def _encode_local_token(self, file: Dict, order_by: str) -> str:
+        """로컬 인덱스 페이지 토큰 생성 (정렬 기준 + 마지막 파일의 정렬 키)"""
+        key = [order_by, *self.metadata_index.sort_key(file, order_by)]
+        encoded = base64.urlsafe_b64encode(json.dumps(key).encode('utf-8')).decode('ascii')
+        return f"{LOCAL_PAGE_TOKEN_PREFIX}{encoded}"
+
+    @staticmethod
+    def _decode_local_token(page_token: str, order_by: str) -> tuple:
+        """
+        로컬 인덱스 페이지 토큰 해석
+
+        Raises:
+            Exception: 형식이 잘못되었거나 다른 정렬 기준으로 만든 토큰인 경우
+        """
+        try:
+            encoded = page_token[len(LOCAL_PAGE_TOKEN_PREFIX):]
+            token_order_by, value, file_id = json.loads(base64.urlsafe_b64decode(encoded.encode('ascii')))
+        except (ValueError, TypeError):
+            raise Exception("파일 목록 조회 실패: 잘못된 페이지 토큰입니다.")
+
+        if token_order_by != order_by:
+            raise Exception("파일 목록 조회 실패: 페이지 토큰의 정렬 기준이 요청과 다릅니다.")
+        return (value, file_id)
+
     async def delete_file(self, file_id: str):
         """
         파일 삭제
@@ -305,10 +1420,613 @@ class DriveClient:
             Exception: 삭제 실패 시
         """
         try:
-            self.service.files().delete(fileId=file_id).execute()
+            await self._execute(lambda service: service.files().delete(fileId=file_id))
         except Exception as e:
             raise Exception(f"파일 삭제 실패: {str(e)}")
 
+        self.folder_cache.invalidate_id(file_id)
+        self._index_remove(file_id)
+        if self.content_cache is not None:
+            self.content_cache.invalidate(file_id)
+
+    async def _execute_batch(self, build_requests: List[Callable[[Any], Any]]) -> List[Dict]:
+        """
+        여러 요청을 Drive 배치 요청으로 실행
+
+        BATCH_LIMIT(100)개씩 나누어 배치를 만들고, 각 배치는 별도 워커에서 동시에 실행합니다.
+        속도 제한이나 서버 오류로 실패한 항목만 모아 백오프 후 다시 배치로 보냅니다.
+
+        Args:
+            build_requests: 서비스 객체를 받아 HttpRequest를 반환하는 함수 목록
+
+        Returns:
+            List[Dict]: 요청 순서대로의 결과
+            [
+                {"response": API 응답 또는 None, "error": 오류 또는 None}
+            ]
+        """
+        results: List[Dict] = [
+            {"response": None, "error": None} for _ in build_requests
+        ]
+
+        pending = list(range(len(build_requests)))
+        attempt = 0
+        while pending:
+            round_results = await self._execute_batch_round([build_requests[i] for i in pending])
+            for index, result in zip(pending, round_results):
+                results[index] = result
+
+            # 재시도 가능한 오류로 실패한 항목만 다시 전송
+            delays = [
+                (index, self._retry_delay(results[index]["error"], attempt))
+                for index in pending if results[index]["error"] is not None
+            ]
+            pending = [index for index, delay in delays if delay is not None]
+            if pending:
+                attempt += 1
+                await self._backoff(max(delay for _, delay in delays if delay is not None))
+
+        return results
+
+    async def _execute_batch_round(self, build_requests: List[Callable[[Any], Any]]) -> List[Dict]:
+        """요청 목록을 BATCH_LIMIT개씩 나눈 배치들로 한 번 실행"""
+        results: List[Dict] = [
+            {"response": None, "error": None} for _ in build_requests
+        ]
+
+        batches = [
+            (start, build_requests[start:start + BATCH_LIMIT])
+            for start in range(0, len(build_requests), BATCH_LIMIT)
+        ]
+
+        async def run(start: int, items: List[Callable[[Any], Any]]):
+            # Drive는 배치 안의 요청을 각각 할당량에 포함하므로 요청 수만큼 토큰 사용
+            await self._throttle(len(items))
+            await self._run(self._run_batch, items, start, results)
+
+        outcomes = await asyncio.gather(
+            *(run(start, items) for start, items in batches),
+            return_exceptions=True
+        )
+
+        # 배치 자체가 실패한 경우 해당 배치의 모든 항목에 오류 기록
+        for (start, items), outcome in zip(batches, outcomes):
+            if isinstance(outcome, Exception):
+                for index in range(start, start + len(items)):
+                    results[index]["error"] = outcome
+
+        return results
+
+    @staticmethod
+    def _run_batch(service, build_requests: List[Callable[[Any], Any]], offset: int, results: List[Dict]):
+        """배치 요청 하나를 현재 워커에서 실행"""
+        def callback(request_id, response, exception):
+            index = int(request_id)
+            results[index]["response"] = response
+            results[index]["error"] = exception
+
+        batch = service.new_batch_http_request(callback=callback)
+        for index, build_request in enumerate(build_requests):
+            batch.add(build_request(service), request_id=str(offset + index))
+        batch.execute()
+
+    async def delete_files(self, file_ids: List[str]) -> List[Dict]:
+        """
+        여러 파일을 배치 요청으로 삭제
+
+        Args:
+            file_ids: 삭제할 파일 ID 목록
+
+        Returns:
+            List[Dict]: 파일별 결과
+            [
+                {"file_id": "파일 ID", "success": True/False, "error": "오류 메시지 (실패 시)"}
+            ]
+        """
+        results = await self._execute_batch([
+            (lambda service, file_id=file_id: service.files().delete(fileId=file_id))
+            for file_id in file_ids
+        ])
+
+        items = []
+        for file_id, result in zip(file_ids, results):
+            if result["error"] is None:
+                self.folder_cache.invalidate_id(file_id)
+                self._index_remove(file_id)
+                if self.content_cache is not None:
+                    self.content_cache.invalidate(file_id)
+                items.append({"file_id": file_id, "success": True})
+            else:
+                items.append({"file_id": file_id, "success": False, "error": str(result["error"])})
+
+        return items
+
+    async def search_files(self, filenames: List[str], folder_id: Optional[str] = None) -> List[Dict]:
+        """
+        여러 파일 이름을 배치 요청으로 검색
+
+        Args:
+            filenames: 검색할 파일 이름 목록
+            folder_id: 검색할 폴더 ID (None이면 전체)
+
+        Returns:
+            List[Dict]: 이름별 결과
+            [
+                {"filename": "파일 이름", "file": 파일 정보 또는 None, "error": "오류 메시지 (실패 시)"}
+            ]
+        """
+        results = await self._execute_batch([
+            (lambda service, filename=filename: service.files().list(
+                q=self._search_query(filename, folder_id),
+                spaces='drive',
+                fields='files(id, name, mimeType, webViewLink)',
+                pageSize=1
+            ))
+            for filename in filenames
+        ])
+
+        items = []
+        for filename, result in zip(filenames, results):
+            if result["error"] is None:
+                files = result["response"].get('files', [])
+                items.append({"filename": filename, "file": files[0] if files else None})
+            else:
+                self._invalidate_if_not_found(result["error"], folder_id)
+                items.append({"filename": filename, "file": None, "error": str(result["error"])})
+
+        return items
+
+    async def resolve_filenames(self, filenames: List[str], folder_id: Optional[str] = None) -> List[Dict]:
+        """
+        여러 파일 이름을 파일 정보로 해석
+
+        폴더가 지정되면 폴더 목록을 한 번만 조회해 이름을 맞추고(같은 이름이면 가장 최근 파일),
+        폴더가 없으면 이름별 배치 검색을 사용합니다.
+
+        Args:
+            filenames: 파일 이름 목록
+            folder_id: 검색할 폴더 ID (None이면 전체)
+
+        Returns:
+            List[Dict]: 이름별 결과 (search_files와 같은 형식)
+            [
+                {"filename": "파일 이름", "file": 파일 정보 또는 None, "error": "오류 메시지 (실패 시)"}
+            ]
+        """
+        if not folder_id:
+            return await self.search_files(filenames, folder_id)
+
+        wanted = set(filenames)
+        found: Dict[str, Dict] = {}
+        try:
+            async for file in self.iter_files(folder_id=folder_id, fields='id, name, mimeType, webViewLink'):
+                if file['name'] in wanted and file['name'] not in found:
+                    found[file['name']] = file
+        except Exception as e:
+            return [{"filename": filename, "file": None, "error": str(e)} for filename in filenames]
+
+        return [{"filename": filename, "file": found.get(filename)} for filename in filenames]
+
+    async def download_files(
+        self,
+        file_ids: List[str],
+        max_concurrency: Optional[int] = None,
+        max_total_bytes: Optional[int] = None,
+        use_cache: bool = True
+    ) -> List[Dict]:
+        """
+        여러 파일을 동시에 다운로드
+
+        전체 크기 제한이 있으면 먼저 배치 요청으로 파일 크기를 조회해 요청 순서대로 예산을 배정합니다.
+        예산을 넘는 파일은 예산만큼만 받아 잘라서 반환하고, 예산이 바닥난 뒤의 파일은 받지 않습니다.
+        (크기를 알 수 없는 파일은 받은 뒤 요청 순서대로 잘라 제한을 맞춥니다)
+
+        Args:
+            file_ids: 파일 ID 목록
+            max_concurrency: 동시에 받을 파일 수 (None이면 max_concurrency 설정값)
+            max_total_bytes: 전체 내용 최대 바이트 수 (None이면 제한 없음)
+            use_cache: 내용 캐시 사용 여부
+
+        Returns:
+            List[Dict]: 요청 순서대로의 결과
+            [
+                {
+                    "file_id": "파일 ID",
+                    "content": "파일 내용 (실패/생략 시 None)",
+                    "size": 내용 바이트 수,
+                    "truncated": 크기 제한으로 잘렸는지 여부,
+                    "error": "오류 메시지 (실패/생략 시)"
+                }
+            ]
+        """
+        semaphore = asyncio.Semaphore(max(1, max_concurrency or self.max_concurrency))
+
+        def failed(file_id: str, error: str) -> Dict:
+            return {"file_id": file_id, "content": None, "size": 0, "truncated": False, "error": error}
+
+        # 파일별 예산: None이면 전체, 정수면 그 바이트까지만 받음, 오류 문자열이면 받지 않음
+        budgets: List[Union[None, int, str]] = [None] * len(file_ids)
+        if max_total_bytes is not None:
+            budgets = await self._byte_budgets(file_ids, max(0, max_total_bytes))
+
+        async def fetch(file_id: str, budget: Union[None, int, str]) -> Dict:
+            if isinstance(budget, str):
+                return failed(file_id, budget)
+            async with semaphore:
+                try:
+                    if budget is None:
+                        content = await self.download_file(file_id, use_cache=use_cache)
+                    else:
+                        content = await self._download_prefix(file_id, budget)
+                except Exception as e:
+                    return failed(file_id, str(e))
+            return {"file_id": file_id, "content": content, "truncated": budget is not None}
+
+        results = list(await asyncio.gather(*(
+            fetch(file_id, budget) for file_id, budget in zip(file_ids, budgets)
+        )))
+
+        # 크기를 미리 알 수 없었던 파일까지 포함해 요청 순서대로 제한 적용
+        total = 0
+        for result in results:
+            if result["content"] is None:
+                continue
+            data = result["content"].encode('utf-8')
+            if max_total_bytes is not None and total + len(data) > max_total_bytes:
+                # 멀티바이트 문자가 잘리지 않도록 디코딩 후 다시 크기 계산
+                result["content"] = data[:max(0, max_total_bytes - total)].decode('utf-8', errors='ignore')
+                data = result["content"].encode('utf-8')
+                result["truncated"] = True
+            total += len(data)
+            result["size"] = len(data)
+
+        return results
+
+    async def _byte_budgets(self, file_ids: List[str], max_total_bytes: int) -> List[Union[None, int, str]]:
+        """
+        전체 크기 제한 안에서 파일별 다운로드 예산 배정 (요청 순서대로)
+
+        Returns:
+            List: 파일별 None(전체 다운로드), 정수(앞에서부터 받을 바이트 수), 문자열(받지 않는 이유)
+        """
+        results = await self._execute_batch([
+            (lambda service, file_id=file_id: service.files().get(fileId=file_id, fields='id, size'))
+            for file_id in file_ids
+        ])
+
+        budgets: List[Union[None, int, str]] = []
+        remaining = max_total_bytes
+        for result in results:
+            if result["error"] is not None:
+                budgets.append(f"파일 다운로드 실패: {str(result['error'])}")
+            elif remaining <= 0:
+                budgets.append("전체 크기 제한을 초과해 읽지 않았습니다")
+            elif result["response"].get('size') is None:
+                # 크기를 알 수 없으면 전체를 받고 나중에 자름
+                budgets.append(None)
+            elif int(result["response"]['size']) <= remaining:
+                remaining -= int(result["response"]['size'])
+                budgets.append(None)
+            else:
+                budgets.append(remaining)
+                remaining = 0
+        return budgets
+
+    async def _download_prefix(self, file_id: str, max_bytes: int) -> str:
+        """
+        파일 앞부분 max_bytes 바이트만 받아 텍스트로 반환 (필요한 만큼만 청크 요청)
+
+        Raises:
+            Exception: 다운로드 실패 시
+        """
+        chunks = []
+        received = 0
+        stream = self.stream_file(file_id, chunk_size=max(1, min(self.download_chunk_size, max_bytes)))
+        try:
+            async for chunk in stream:
+                chunks.append(chunk)
+                received += len(chunk)
+                if received >= max_bytes:
+                    break
+        finally:
+            await stream.aclose()
+
+        # 끝에서 잘린 멀티바이트 문자는 버림 (그 밖의 잘못된 바이트는 오류)
+        try:
+            return codecs.getincrementaldecoder('utf-8')().decode(b"".join(chunks)[:max_bytes])
+        except UnicodeDecodeError as e:
+            raise Exception(f"파일 다운로드 실패: {str(e)}")
+
+    async def create_folders(self, folder_names: List[str], parent_id: Optional[str] = None) -> List[Dict]:
+        """
+        여러 폴더를 배치 요청으로 생성 (이미 존재하면 기존 폴더 ID 반환)
+
+        캐시에 없는 폴더만 한 번의 배치로 검색하고, 없는 폴더만 다시 한 번의 배치로 생성합니다.
+        "a/b" 같은 중첩 경로는 create_folder로 개별 처리합니다.
+
+        Args:
+            folder_names: 생성할 폴더 이름 목록
+            parent_id: 부모 폴더 ID (None이면 루트)
+
+        Returns:
+            List[Dict]: 폴더별 결과
+            [
+                {"name": "폴더 이름", "folder_id": "폴더 ID", "created": True/False, "error": "오류 메시지 (실패 시)"}
+            ]
+        """
+        items = {name: {"name": name, "folder_id": None, "created": False} for name in folder_names}
+
+        pending = []
+        for name in items:
+            if '/' in name:
+                try:
+                    items[name]["folder_id"] = await self.create_folder(name, parent_id)
+                except Exception as e:
+                    items[name]["error"] = str(e)
+                continue
+
+            cached_id = self.folder_cache.get(parent_id, name)
+            if cached_id:
+                items[name]["folder_id"] = cached_id
+            else:
+                pending.append(name)
+
+        # 1단계: 기존 폴더 검색
+        search_results = await self._execute_batch([
+            (lambda service, name=name: service.files().list(
+                q=self._folder_query(name, parent_id),
+                spaces='drive',
+                fields='files(id, name)'
+            ))
+            for name in pending
+        ])
+
+        missing = []
+        for name, result in zip(pending, search_results):
+            if result["error"] is not None:
+                items[name]["error"] = str(result["error"])
+                continue
+
+            files = result["response"].get('files', [])
+            if files:
+                items[name]["folder_id"] = files[0]['id']
+                self.folder_cache.set(parent_id, name, files[0]['id'])
+            else:
+                missing.append(name)
+
+        # 2단계: 없는 폴더 생성
+        def folder_metadata(name: str) -> Dict:
+            metadata = {'name': name, 'mimeType': FOLDER_MIME_TYPE}
+            if parent_id:
+                metadata['parents'] = [parent_id]
+            return metadata
+
+        create_results = await self._execute_batch([
+            (lambda service, name=name: service.files().create(
+                body=folder_metadata(name),
+                fields=INDEX_FIELDS
+            ))
+            for name in missing
+        ])
+
+        for name, result in zip(missing, create_results):
+            if result["error"] is not None:
+                items[name]["error"] = str(result["error"])
+                continue
+
+            folder_id = result["response"].get('id')
+            items[name]["folder_id"] = folder_id
+            items[name]["created"] = True
+            self.folder_cache.set(parent_id, name, folder_id)
+            self._index_upsert(result["response"])
+
+        return list(items.values())
+
+    async def find_files_by_prefix(
+        self,
+        prefix: str,
+        folder_id: Optional[str] = None,
+        max_results: int = 100,
+        force_remote: bool = False
+    ) -> List[Dict]:
+        """
+        이름 접두어로 파일 검색
+
+        Args:
+            prefix: 파일 이름 접두어
+            folder_id: 검색할 폴더 ID (None이면 전체)
+            max_results: 최대 결과 수
+            force_remote: True면 인덱스를 사용하지 않고 항상 Drive에 조회
+
+        Returns:
+            List[Dict]: 파일 목록
+
+        Raises:
+            Exception: 검색 실패 시
+        """
+        if await self._use_index(force_remote):
+            files = self.metadata_index.list_files(parent_id=folder_id, prefix=prefix, limit=max_results)
+            return [self._project(file, LIST_FIELDS) for file in files]
+
+        # Drive의 name contains는 단어 접두어 일치이므로 결과를 한 번 더 거른다
+        escaped = prefix.replace("\\", "\\\\").replace("'", "\\'")
+        files = await self.list_files(
+            folder_id=folder_id,
+            query=f"name contains '{escaped}'",
+            max_results=max_results,
+            force_remote=True
+        )
+        return [file for file in files if file.get('name', '').startswith(prefix)]
+
+    async def sync_metadata_index(self, force_bootstrap: bool = False) -> Dict[str, int]:
+        """
+        로컬 메타데이터 인덱스 동기화
+
+        처음에는 전체 목록을 한 번 적재하고, 이후에는 changes.list로 변경분만 반영합니다.
+        변경분에서 삭제되거나 내용이 바뀐 파일은 내용 캐시에서도 제거합니다.
+        동시에 호출되면 앞선 동기화가 끝날 때까지 기다린 뒤 실행합니다.
+
+        Args:
+            force_bootstrap: True면 인덱스를 비우고 전체 목록을 다시 적재
+
+        Returns:
+            {"updated": 반영된 파일 수, "removed": 제거된 파일 수}
+
+        Raises:
+            Exception: 동기화 실패 시
+        """
+        if self.metadata_index is None:
+            raise Exception("메타데이터 인덱스가 비활성화되어 있습니다.")
+
+        async with self._sync_guard():
+            return await self._sync_metadata_index(force_bootstrap)
+
+    async def _sync_metadata_index(self, force_bootstrap: bool = False) -> Dict[str, int]:
+        """메타데이터 인덱스 동기화 실행 (_sync_guard 안에서 호출)"""
+        try:
+            if force_bootstrap:
+                self.metadata_index.clear()
+
+            page_token = self.metadata_index.get_page_token()
+
+            if page_token is None:
+                # 목록 적재 중 발생한 변경을 놓치지 않도록 시작 토큰을 먼저 받는다
+                start = await self._execute(lambda service: service.changes().getStartPageToken())
+                updated = 0
+                batch = []
+                async for file in self.iter_files(fields=INDEX_FIELDS, force_remote=True):
+                    batch.append(file)
+                    if len(batch) >= MAX_PAGE_SIZE:
+                        self.metadata_index.apply(batch)
+                        updated += len(batch)
+                        batch = []
+                self.metadata_index.apply(batch)
+                updated += len(batch)
+
+                self.metadata_index.set_page_token(start['startPageToken'])
+                return {"updated": updated, "removed": 0}
+
+            updated = 0
+            removed = 0
+            while page_token:
+                response = await self._execute(lambda service, token=page_token: service.changes().list(
+                    pageToken=token,
+                    spaces='drive',
+                    pageSize=MAX_PAGE_SIZE,
+                    includeRemoved=True,
+                    fields=CHANGES_FIELDS
+                ))
+
+                for change in response.get('changes', []):
+                    file = change.get('file')
+                    if change.get('removed') or not file or file.get('trashed'):
+                        self.metadata_index.remove(change['fileId'])
+                        self.folder_cache.invalidate_id(change['fileId'])
+                        if self.content_cache is not None:
+                            self.content_cache.invalidate(change['fileId'])
+                        removed += 1
+                    else:
+                        self._evict_if_changed(file)
+                        self.metadata_index.upsert(file)
+                        updated += 1
+
+                if 'newStartPageToken' in response:
+                    self.metadata_index.set_page_token(response['newStartPageToken'])
+                    break
+                page_token = response.get('nextPageToken')
+
+            return {"updated": updated, "removed": removed}
+
+        except Exception as e:
+            raise Exception(f"메타데이터 인덱스 동기화 실패: {str(e)}")
+
+    @asynccontextmanager
+    async def _sync_guard(self):
+        """
+        인덱스 동기화를 한 번에 하나만 실행
+
+        잠금은 워커 스레드를 차지하지 않도록 이벤트 루프에서 짧게 기다리며 다시 시도합니다.
+        (취소되어도 잠금이 남지 않음)
+        """
+        while not self._sync_lock.acquire(blocking=False):
+            await asyncio.sleep(SYNC_LOCK_POLL_INTERVAL)
+        try:
+            yield
+        finally:
+            self._sync_lock.release()
+
+    def _evict_if_changed(self, file: Dict):
+        """변경분의 파일 내용이 인덱스에 기록된 것과 다르면 내용 캐시에서 제거"""
+        if self.content_cache is None:
+            return
+
+        previous = self.metadata_index.get(file['id'])
+        if previous is None or not file.get('md5Checksum') or previous.get('md5Checksum') != file['md5Checksum']:
+            self.content_cache.invalidate(file['id'])
+
+    async def _use_index(self, force_remote: bool = False) -> bool:
+        """
+        로컬 인덱스로 조회할 수 있는지 확인 (필요하면 먼저 동기화)
+
+        다른 요청이 이미 동기화 중이면 기다리지 않고 현재 인덱스를 사용합니다. (아직 적재 전이면 대기)
+        동기화에 실패하면 False를 반환하여 Drive 조회로 대체합니다.
+        """
+        if force_remote or self.metadata_index is None:
+            return False
+
+        if self.metadata_index.seconds_since_sync() > self.index_sync_interval:
+            if self._sync_lock.locked() and self.metadata_index.is_bootstrapped():
+                return True
+            try:
+                async with self._sync_guard():
+                    # 기다리는 동안 다른 요청이 동기화를 마쳤으면 다시 하지 않음
+                    if self.metadata_index.seconds_since_sync() > self.index_sync_interval:
+                        await self._sync_metadata_index()
+            except Exception:
+                return self.metadata_index.is_bootstrapped()
+
+        return True
+
+    def _index_supports(self, fields: str, order_by: str) -> bool:
+        """요청한 필드와 정렬을 로컬 인덱스가 제공할 수 있는지 확인"""
+        if self.metadata_index is None or not self.metadata_index.supports_order_by(order_by):
+            return False
+        indexed = {field.strip() for field in INDEX_FIELDS.split(',')}
+        return all(field.strip() in indexed for field in fields.split(','))
+
+    @staticmethod
+    def _project(file: Dict, fields: str) -> Dict:
+        """인덱스 결과에서 요청한 필드만 추림"""
+        wanted = [field.strip() for field in fields.split(',')]
+        return {field: file[field] for field in wanted if field in file}
+
+    def _index_upsert(self, file: Optional[Dict]):
+        """이 클라이언트가 만든/수정한 파일을 인덱스에 즉시 반영"""
+        if self.metadata_index is not None and file and file.get('id'):
+            self.metadata_index.upsert(file)
+
+    def _index_remove(self, file_id: str):
+        """이 클라이언트가 삭제한 파일을 인덱스에서 즉시 제거"""
+        if self.metadata_index is not None:
+            self.metadata_index.remove(file_id)
+
+    @staticmethod
+    def _search_query(filename: str, folder_id: Optional[str] = None) -> str:
+        """파일 이름 검색 쿼리 생성"""
+        query = f"name='{filename}' and trashed=false"
+        if folder_id:
+            query += f" and '{folder_id}' in parents"
+        return query
+
+    @staticmethod
+    def _folder_query(folder_name: str, parent_id: Optional[str] = None) -> str:
+        """폴더 검색 쿼리 생성"""
+        query = f"name='{folder_name}' and mimeType='{FOLDER_MIME_TYPE}' and trashed=false"
+        if parent_id:
+            query += f" and '{parent_id}' in parents"
+        return query
+
     def get_service(self):
         """Drive API 서비스 객체 반환"""
+        self._ensure_authenticated()
         return self.service
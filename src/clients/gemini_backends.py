@@ -0,0 +1,166 @@
+"""Gemini 모델 백엔드 (실제 API / 오프라인 스텁)"""
+import datetime
+import time
+from types import SimpleNamespace
+from typing import Optional, Dict, Any, List
+
+
+class GenaiBackend:
+    """google.generativeai SDK 백엔드"""
+
+    name = "genai"
+
+    def __init__(self, api_key: str):
+        """
+        Args:
+            api_key: Gemini API 키
+
+        Raises:
+            RuntimeError: SDK 설정 실패 시
+        """
+        import google.generativeai as genai
+
+        try:
+            genai.configure(api_key=api_key)
+        except Exception as e:
+            raise RuntimeError(f"Gemini API 설정 실패: {str(e)}")
+        self._genai = genai
+
+    def create_model(
+        self,
+        model_name: str,
+        system_instruction: Optional[str],
+        generation_config: Optional[Dict[str, Any]]
+    ) -> Any:
+        """시스템 지시문을 가진 모델 생성"""
+        return self._genai.GenerativeModel(
+            model_name,
+            generation_config=generation_config or None,
+            system_instruction=system_instruction
+        )
+
+    def create_cached_content(self, model_name: str, system_instruction: str, ttl: float) -> Any:
+        """
+        시스템 지시문을 서버 측 캐시로 등록 (블로킹 API 호출)
+
+        Raises:
+            Exception: 모델이 컨텍스트 캐시를 지원하지 않거나 지시문이 최소 토큰 수보다 짧은 경우
+        """
+        model = model_name if model_name.startswith("models/") else f"models/{model_name}"
+        return self._genai.caching.CachedContent.create(
+            model=model,
+            system_instruction=system_instruction,
+            ttl=self._ttl(ttl)
+        )
+
+    def renew_cached_content(self, cached_content: Any, ttl: float):
+        """캐시 유효 시간 연장 (블로킹 API 호출)"""
+        cached_content.update(ttl=self._ttl(ttl))
+
+    @staticmethod
+    def _ttl(ttl: float) -> datetime.timedelta:
+        """SDK가 받는 TTL 형식으로 변환 (float 초는 변환하지 못해 TypeError 발생)"""
+        return datetime.timedelta(seconds=ttl)
+
+    def model_from_cache(self, cached_content: Any, generation_config: Optional[Dict[str, Any]]) -> Any:
+        """캐시된 지시문을 사용하는 모델 생성"""
+        return self._genai.GenerativeModel.from_cached_content(
+            cached_content,
+            generation_config=generation_config or None
+        )
+
+    def count_tokens(self, model_name: str, text: str) -> int:
+        """텍스트 토큰 수 (블로킹 API 호출)"""
+        return self._genai.GenerativeModel(model_name).count_tokens(text).total_tokens
+
+
+class StubModel:
+    """
+    고정된 응답을 스트리밍하는 모델 (API 호출 없음)
+
+    사용량(usage_metadata)은 문자 수로 추정하며, 캐시된 지시문은 cached_content_token_count로 집계합니다.
+    """
+
+    def __init__(self, backend: "StubBackend", system_instruction: Optional[str], cached: bool = False):
+        self.backend = backend
+        self.system_instruction = system_instruction
+        self.cached = cached
+
+    def generate_content(self, contents: Any, stream: bool = False, request_options: Optional[Dict] = None):
+        prompt = contents if isinstance(contents, str) else " ".join(
+            part for part in contents if isinstance(part, str)
+        )
+        instruction_tokens = self.backend.count_tokens("", self.system_instruction or "")
+        prompt_tokens = self.backend.count_tokens("", prompt)
+
+        text = self.backend.response_text
+        chunks = [text[i:i + 32] for i in range(0, len(text), 32)] or [""]
+        usage = SimpleNamespace(
+            prompt_token_count=instruction_tokens + prompt_tokens,
+            cached_content_token_count=instruction_tokens if self.cached else 0,
+            candidates_token_count=self.backend.count_tokens("", text)
+        )
+
+        self.backend.calls.append({"system_instruction": self.system_instruction, "contents": contents})
+        return StubResponse(chunks, usage)
+
+
+class StubResponse:
+    """스트리밍 응답 대역 (반복하면 청크, 끝나면 usage_metadata)"""
+
+    def __init__(self, chunks: List[str], usage: Any):
+        self._chunks = chunks
+        self.usage_metadata = usage
+        self.text = "".join(chunks)
+
+    def __iter__(self):
+        for chunk in self._chunks:
+            yield SimpleNamespace(text=chunk, usage_metadata=None)
+
+
+class StubBackend:
+    """
+    오프라인 백엔드 (개발/테스트용, GEMINI_BACKEND=stub)
+
+    모든 요청에 response_text를 응답하고, 컨텍스트 캐시는 메모리에서 흉내 냅니다.
+    """
+
+    name = "stub"
+
+    def __init__(self, response_text: str = "스텁 응답입니다.\n```python\nprint('stub')\n```"):
+        """
+        Args:
+            response_text: 모든 요청에 돌려줄 응답
+        """
+        self.response_text = response_text
+        self.calls: List[Dict[str, Any]] = []
+        self.cached_contents: List[Any] = []
+
+    def create_model(
+        self,
+        model_name: str,
+        system_instruction: Optional[str],
+        generation_config: Optional[Dict[str, Any]]
+    ) -> Any:
+        return StubModel(self, system_instruction)
+
+    def create_cached_content(self, model_name: str, system_instruction: str, ttl: float) -> Any:
+        cached_content = SimpleNamespace(
+            name=f"cachedContents/stub-{len(self.cached_contents)}",
+            system_instruction=system_instruction,
+            expire_time=time.time() + ttl,
+            renewals=0
+        )
+        self.cached_contents.append(cached_content)
+        return cached_content
+
+    def renew_cached_content(self, cached_content: Any, ttl: float):
+        cached_content.expire_time = time.time() + ttl
+        cached_content.renewals += 1
+
+    def model_from_cache(self, cached_content: Any, generation_config: Optional[Dict[str, Any]]) -> Any:
+        return StubModel(self, cached_content.system_instruction, cached=True)
+
+    def count_tokens(self, model_name: str, text: str) -> int:
+        # 대략 4자당 1토큰
+        return (len(text) + 3) // 4
@@ -1,24 +1,227 @@
 """Gemini API 클라이언트"""
+import asyncio
 import re
 import base64
-import google.generativeai as genai
-from typing import Optional, Dict
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Optional, Dict, List, Any, AsyncIterator, Callable, Tuple
 from PIL import Image
 import io
+import json
+import time
+
+from src.clients.gemini_backends import GenaiBackend, StubBackend
+from src.managers.response_cache import ResponseCache
+from src.managers.semantic_cache import SemanticCache, HashingEmbedder, GeminiEmbedder
+from src.utils.config import Config
+from src.utils.logger import setup_logger
+from src.utils.rate_limiter import TokenBucket
+from src.utils.tokens import estimate_tokens
+
+
+logger = setup_logger('gemini_client')
+
+
+# 코드 블록 첫 줄이 이 중 하나면 언어 표시로 보고 코드에서 제외
+CODE_LANGUAGES = [
+    "python", "javascript", "java", "cpp", "c",
+    "go", "rust", "typescript", "ruby", "php"
+]
+
+# 기본 모델
+DEFAULT_MODEL = 'gemini-2.0-flash'
+
+# 스트림 종료 표시
+_STREAM_END = object()
+
+# 모든 요청에 공통인 고정 지시문 (요청마다 프롬프트에 붙이지 않고 모델의 system_instruction으로 전달)
+_BASE_INSTRUCTION = """당신은 실행 가능한 완전한 애플리케이션을 생성하는 AI입니다.
+
+**중요 규칙:**
+1. 사용자가 "웹", "앱", "프로그램", "사이트" 등을 요청하면 **반드시 Streamlit 또는 Flask 웹 애플리케이션**으로 만들어야 합니다
+2. requirements.txt에 필요한 모든 라이브러리를 명시하세요
+3. README.md에 실행 방법을 상세히 작성하세요
+4. 코드는 바로 실행 가능해야 합니다 (복사/붙여넣기 필요 없이)
+5. 한글 주석으로 설명을 달아주세요
+
+**웹앱 생성 시:**
+- Streamlit 사용 (간단한 경우)
+- Flask 사용 (복잡한 경우)
+- 파일 업로드, 입력 폼 등 UI 포함
+- 결과를 웹에서 바로 확인 가능하도록 구현
+
+**출력 형식:**
+```python
+# main.py 또는 app.py
+코드 내용
+```
+
+```
+# requirements.txt
+필요한 라이브러리
+```
+
+```markdown
+# README.md
+실행 방법
+```
+3. 코드 블록(```) 사용
+4. 실행 가능하고 완전한 코드 작성
+"""
+
+# 지시문 세트 이름 → system_instruction
+SYSTEM_INSTRUCTIONS = {
+    "default": _BASE_INSTRUCTION,
+    # 웹 UI: 한국어 요청 이해와 초보자용 설명 강조
+    "korean": _BASE_INSTRUCTION + """
+**한국어 요청 처리:**
+1. 한국어 요청을 정확히 이해하고 코드로 변환
+2. 상세한 한글 주석 포함
+3. 초보자도 이해할 수 있게 설명
+4. 실행 가능한 완전한 코드 작성
+5. 코드 블록(```)으로 감싸기
+"""
+}
+
+
+class _Flight:
+    """
+    진행 중인 생성 요청 하나 (같은 요청을 동시에 보낸 호출자들이 공유)
+
+    작업 스레드가 받은 청크를 기록해 두므로 늦게 합류한 호출자도 처음부터 모든 청크를 받습니다.
+    """
+
+    def __init__(self):
+        self.future: Optional[Future] = None
+        self.cancel_event = threading.Event()
+        self.waiters = 0
+        self.stored = False
+        self._chunks: List[str] = []
+        self._listeners: List[Callable[[str], Any]] = []
+        self._lock = threading.Lock()
+
+    def publish(self, text: str):
+        """작업 스레드가 받은 청크를 기록하고 구독자에게 전달"""
+        with self._lock:
+            self._chunks.append(text)
+            for listener in self._listeners:
+                listener(text)
+
+    def subscribe(self, listener: Callable[[str], Any]):
+        """지금까지 받은 청크를 전달한 뒤 이후 청크도 받도록 등록"""
+        with self._lock:
+            for text in self._chunks:
+                listener(text)
+            self._listeners.append(listener)
+
+    def unsubscribe(self, listener: Callable[[str], Any]):
+        with self._lock:
+            if listener in self._listeners:
+                self._listeners.remove(listener)
+
+    def claim_store(self) -> bool:
+        """결과를 캐시에 저장할 호출자 하나만 True"""
+        with self._lock:
+            if self.stored:
+                return False
+            self.stored = True
+            return True
+
+
+class StreamingCodeExtractor:
+    """
+    스트리밍 응답에서 첫 번째 코드 블록 내용을 점진적으로 추출
+
+    _extract_code와 같은 규칙(첫 ``` 블록, 첫 줄이 언어 이름이면 제외)을 청크 단위로 적용하며,
+    청크 경계에 걸친 ``` 표시를 잘못 내보내지 않도록 끝의 백틱은 다음 청크까지 보류합니다.
+    """
+
+    def __init__(self):
+        self.text = ""
+        self.code = ""
+        self._state = "before"  # before → header → code → done
+        self._pos = 0
+
+    def feed(self, chunk: str) -> str:
+        """
+        응답 청크 추가
+
+        Args:
+            chunk: 새로 받은 응답 텍스트
+
+        Returns:
+            str: 이번 청크로 새로 확정된 코드 (없으면 빈 문자열)
+        """
+        self.text += chunk
+        delta = ""
+
+        if self._state == "before":
+            start = self.text.find("```", self._pos)
+            if start == -1:
+                self._pos = max(0, len(self.text) - 2)
+                return ""
+            self._pos = start + 3
+            self._state = "header"
+
+        if self._state == "header":
+            newline = self.text.find("\n", self._pos)
+            if newline == -1:
+                return ""
+            first_line = self.text[self._pos:newline].strip()
+            if first_line and first_line.lower() not in CODE_LANGUAGES:
+                # 언어 표시가 아니면 첫 줄도 코드에 포함
+                newline = self._pos - 1
+            self._pos = newline + 1
+            self._state = "code"
+
+        if self._state == "code":
+            end = self.text.find("```", self._pos)
+            if end != -1:
+                delta = self.text[self._pos:end]
+                self._pos = end + 3
+                self._state = "done"
+            else:
+                # 닫는 ```가 청크 경계에 걸쳐 있을 수 있으므로 끝의 백틱은 보류
+                stop = len(self.text)
+                while stop > self._pos and stop > len(self.text) - 2 and self.text[stop - 1] == "`":
+                    stop -= 1
+                delta = self.text[self._pos:stop]
+                self._pos = stop
+
+        self.code += delta
+        return delta
 
 
 class GeminiClient:
     """Gemini API 클라이언트 클래스"""
 
-    def __init__(self, api_key: str):
+    def __init__(
+        self,
+        api_key: str,
+        max_concurrency: Optional[int] = None,
+        timeout: Optional[float] = None,
+        response_cache: Optional[ResponseCache] = None,
+        semantic_cache: Optional[SemanticCache] = None,
+        model_name: str = DEFAULT_MODEL,
+        generation_config: Optional[Dict[str, Any]] = None,
+        backend: Optional[Any] = None
+    ):
         """
         Gemini 클라이언트 초기화
 
         Args:
             api_key: Gemini API 키
+            max_concurrency: 동시에 실행할 생성 요청 수 (None이면 설정값 사용)
+            timeout: 생성 요청 하나의 최대 시간 (초, None이면 설정값 사용)
+            response_cache: 응답 캐시 (None이면 설정에 따라 기본 캐시 사용)
+            semantic_cache: 의미 기반 프롬프트 캐시 (None이면 설정에 따라 기본 캐시 사용)
+            model_name: 사용할 모델 이름
+            generation_config: 생성 설정 (temperature 등, 선택)
+            backend: 모델 백엔드 (None이면 설정에 따라 GenaiBackend 또는 StubBackend)
 
         Raises:
             ValueError: API 키가 제공되지 않은 경우
+            RuntimeError: Gemini API 설정 실패 시
         """
         if not api_key:
             raise ValueError("Gemini API 키가 필요합니다.")
@@ -26,26 +229,97 @@ class GeminiClient:
         self.api_key = api_key
         self.conversation_history = []
 
-        try:
-            genai.configure(api_key=api_key)
-            self.model = genai.GenerativeModel('gemini-2.0-flash')
-        except Exception as e:
-            raise RuntimeError(f"Gemini API 설정 실패: {str(e)}")
+        self.max_concurrency = max(1, max_concurrency or Config.get_gemini_max_concurrency())
+        self.timeout = timeout or Config.get_gemini_request_timeout()
+
+        # 블로킹 SDK 호출 전용 스레드 풀 (이벤트 루프를 막지 않고, 초과 요청은 대기열에서 기다림)
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.max_concurrency,
+            thread_name_prefix="gemini"
+        )
+
+        # 캐시 키 → 진행 중인 생성 (같은 요청이 동시에 들어오면 API 호출 하나를 공유)
+        self._flights: Dict[str, _Flight] = {}
+        self._flights_lock = threading.Lock()
+        self._flight_stats = {
+            "started": 0,
+            "coalesced": 0,
+            "abandoned": 0
+        }
+
+        # 같은 요청(모델, 프롬프트, 이미지, 생성 설정)의 응답 캐시
+        if response_cache is None and Config.get_response_cache_enabled():
+            response_cache = ResponseCache(
+                cache_dir=Config.get_cache_dir() / "responses",
+                ttl=Config.get_response_cache_ttl(),
+                max_memory_entries=Config.get_response_cache_memory_entries(),
+                max_disk_bytes=Config.get_response_cache_disk_bytes()
+            )
+        self.response_cache = response_cache
+
+        # 표현만 다른 비슷한 요청의 응답 캐시 (선택, numpy 필요)
+        if semantic_cache is None and Config.get_semantic_cache_enabled():
+            semantic_cache = self._create_semantic_cache()
+        self.semantic_cache = semantic_cache
+
+        self.model_name = model_name
+        self.generation_config = generation_config or {}
+
+        if backend is None:
+            backend = StubBackend() if Config.get_gemini_backend() == "stub" else GenaiBackend(api_key)
+        self.backend = backend
+
+        # 고정 지시문을 서버 측 컨텍스트 캐시로 등록할지 (None이면 system_instruction만 사용)
+        self.context_cache_ttl = Config.get_gemini_context_cache_ttl() if Config.get_gemini_context_cache_enabled() else None
+        self.context_cache_min_tokens = Config.get_gemini_context_cache_min_tokens()
+
+        # (모델, 지시문 세트) → {"model", "cached_content", "expires_at", "instruction_tokens", "renewing"}
+        # 모델 생성/캐시 등록은 네트워크 호출이므로 잠금 밖에서 하고, 생성 중인 항목은 Future로 공유
+        self._models: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        self._models_pending: Dict[Tuple[str, str], Future] = {}
+        self._models_lock = threading.Lock()
+        self._token_stats = {
+            "requests": 0,
+            "prompt_tokens": 0,
+            "cached_tokens": 0,
+            "output_tokens": 0
+        }
+        self._token_lock = threading.Lock()
+
+        # 일괄 생성 요청 속도 제한 (분당 요청 수, 여러 일괄 요청이 함께 사용)
+        batch_rpm = Config.get_gemini_batch_rate_limit_rpm()
+        self._batch_limiter = TokenBucket(batch_rpm / 60, Config.get_gemini_batch_concurrency()) if batch_rpm > 0 else None
 
     async def generate_code(
         self,
         prompt: str,
         language: Optional[str] = None,
         context: Optional[str] = None,
-        image_base64: Optional[str] = None
+        image_base64: Optional[str] = None,
+        timeout: Optional[float] = None,
+        use_cache: bool = True,
+        semantic_text: Optional[str] = None,
+        instruction_set: str = "default",
+        rate_limiter: Optional[TokenBucket] = None
     ) -> Dict[str, str]:
         """
         코드 생성 (비동기)
 
+        SDK 호출은 전용 스레드 풀에서 실행되므로 생성 중에도 이벤트 루프는 다른 요청을 처리합니다.
+        같은 요청(또는 의미 기반 캐시 사용 시 의미가 같은 요청)의 응답이 캐시에 있으면 API를 호출하지 않고,
+        같은 요청이 이미 생성 중이면 새로 호출하지 않고 그 결과를 함께 기다립니다.
+
         Args:
             prompt: 코드 생성 요청 프롬프트
             language: 프로그래밍 언어 (선택)
             context: 이전 컨텍스트 (선택)
+            image_base64: 함께 전달할 이미지 (Base64, 선택)
+            timeout: 최대 시간 (초, None이면 클라이언트 기본값)
+            use_cache: False면 캐시를 조회하지 않고 새로 생성 (결과는 캐시에 갱신)
+            semantic_text: 의미 기반 캐시에서 비교할 요청 원문 (None이면 prompt).
+                prompt가 템플릿으로 감싼 요청이면 원문을 지정해야 템플릿이 유사도를 좌우하지 않음
+            instruction_set: 모델에 system_instruction으로 전달할 지시문 세트 (SYSTEM_INSTRUCTIONS의 키)
+            rate_limiter: API를 새로 호출할 때만 토큰을 받는 요청 수 제한 (선택, 캐시 적중이나 합류 시에는 사용하지 않음)
 
         Returns:
             {
@@ -55,95 +329,662 @@ class GeminiClient:
             }
 
         Raises:
+            asyncio.CancelledError: 요청이 취소된 경우 (함께 기다리는 요청이 없으면 진행 중인 생성도 중단)
+            TimeoutError: timeout 안에 생성이 끝나지 않은 경우
             Exception: 코드 생성 실패 시
         """
         try:
-            full_prompt = self._build_prompt(prompt, language, context)
+            contents, cache_key, semantic_scope = self._build_contents(
+                prompt, language, context, image_base64, semantic_text, instruction_set
+            )
+            semantic_text = semantic_text or prompt
 
-            # 이미지가 있으면 멀티모달 입력으로 처리
-            if image_base64:
-                # Base64 디코딩
-                image_data = base64.b64decode(image_base64.split(',')[1] if ',' in image_base64 else image_base64)
-                image = Image.open(io.BytesIO(image_data))
+            response_text = await self._lookup_caches(cache_key, semantic_text, semantic_scope) if use_cache else None
+            if response_text is None:
+                if rate_limiter is not None and not self._in_flight(cache_key):
+                    await rate_limiter.acquire()
+                flight = self._join_flight(cache_key, contents, timeout or self.timeout, instruction_set)
+                try:
+                    response_text = await self._await_flight(flight, timeout or self.timeout)
+                finally:
+                    self._leave_flight(cache_key, flight)
+                if flight.claim_store():
+                    await self._store_caches(cache_key, semantic_text, semantic_scope, response_text)
 
-                # 이미지와 텍스트를 함께 전달
-                response = self.model.generate_content([full_prompt, image])
-            else:
-                # 텍스트만 전달
-                response = self.model.generate_content(full_prompt)
-
-            code = self._extract_code(response.text)
-            detected_language = language or self._detect_language(response.text)
-            explanation = self._extract_explanation(response.text, code)
-
-            # 대화 이력 저장
-            self.conversation_history.append({
-                "role": "user",
-                "content": prompt
-            })
-            self.conversation_history.append({
-                "role": "assistant",
-                "content": code
-            })
-
-            return {
-                "code": code,
-                "language": detected_language,
-                "explanation": explanation
-            }
+            return self._finish(prompt, language, response_text)
+        except asyncio.TimeoutError:
+            raise TimeoutError(f"코드 생성 시간 초과 ({timeout or self.timeout}초)")
         except Exception as e:
             raise Exception(f"코드 생성 실패: {str(e)}")
 
-    def _build_prompt(
+    async def stream_code(
         self,
-        user_request: str,
+        prompt: str,
         language: Optional[str] = None,
-        context: Optional[str] = None
+        context: Optional[str] = None,
+        image_base64: Optional[str] = None,
+        timeout: Optional[float] = None,
+        use_cache: bool = True,
+        semantic_text: Optional[str] = None,
+        instruction_set: str = "default"
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        코드 생성 (스트리밍)
+
+        응답 청크를 받는 즉시 반환하고, 마지막에 generate_code와 같은 최종 결과를 반환합니다.
+        같은 요청이 이미 생성 중이면 그 생성에 합류해 지금까지 받은 청크부터 차례로 반환하며,
+        반복을 중간에 멈추면(연결 종료, 취소 등) 함께 기다리는 요청이 없을 때만 진행 중인 생성을 중단합니다.
+        캐시에 응답이 있으면 전체 응답을 청크 하나로 바로 반환합니다.
+
+        Args:
+            prompt: 코드 생성 요청 프롬프트
+            language: 프로그래밍 언어 (선택)
+            context: 이전 컨텍스트 (선택)
+            image_base64: 함께 전달할 이미지 (Base64, 선택)
+            timeout: 전체 최대 시간 (초, None이면 클라이언트 기본값)
+            use_cache: False면 캐시를 조회하지 않고 새로 생성 (결과는 캐시에 갱신)
+            semantic_text: 의미 기반 캐시에서 비교할 요청 원문 (None이면 prompt)
+            instruction_set: 모델에 system_instruction으로 전달할 지시문 세트 (SYSTEM_INSTRUCTIONS의 키)
+
+        Yields:
+            {"type": "chunk", "text": "응답 조각", "code": "이번 조각에서 추출된 코드"}
+            {"type": "done", "code": "...", "language": "...", "explanation": "..."}
+
+        Raises:
+            TimeoutError: timeout 안에 생성이 끝나지 않은 경우
+            Exception: 코드 생성 실패 시
+        """
+        timeout = timeout or self.timeout
+        loop = asyncio.get_running_loop()
+        queue: asyncio.Queue = asyncio.Queue()
+
+        def post(item: Any):
+            try:
+                loop.call_soon_threadsafe(queue.put_nowait, item)
+            except RuntimeError:
+                # 소비하던 이벤트 루프가 이미 닫힌 경우 (중단된 요청)
+                pass
+
+        try:
+            contents, cache_key, semantic_scope = self._build_contents(
+                prompt, language, context, image_base64, semantic_text, instruction_set
+            )
+        except Exception as e:
+            raise Exception(f"코드 생성 실패: {str(e)}")
+        semantic_text = semantic_text or prompt
+
+        response_text = await self._lookup_caches(cache_key, semantic_text, semantic_scope) if use_cache else None
+        if response_text is not None:
+            yield {"type": "chunk", "text": response_text, "code": StreamingCodeExtractor().feed(response_text)}
+            yield {"type": "done", **self._finish(prompt, language, response_text)}
+            return
+
+        flight = self._join_flight(cache_key, contents, timeout, instruction_set)
+        flight.subscribe(post)
+        flight.future.add_done_callback(lambda _: post(_STREAM_END))
+
+        extractor = StreamingCodeExtractor()
+        deadline = loop.time() + timeout
+        try:
+            while True:
+                try:
+                    item = await asyncio.wait_for(queue.get(), max(0.0, deadline - loop.time()))
+                except asyncio.TimeoutError:
+                    raise TimeoutError(f"코드 생성 시간 초과 ({timeout}초)")
+
+                if item is _STREAM_END:
+                    break
+                yield {"type": "chunk", "text": item, "code": extractor.feed(item)}
+
+            try:
+                response_text = flight.future.result()
+            except Exception as e:
+                raise Exception(f"코드 생성 실패: {str(e)}")
+            if flight.claim_store():
+                await self._store_caches(cache_key, semantic_text, semantic_scope, response_text)
+
+            yield {"type": "done", **self._finish(prompt, language, response_text)}
+        finally:
+            flight.unsubscribe(post)
+            self._leave_flight(cache_key, flight)
+
+    async def generate_batch(
+        self,
+        items: List[Dict[str, Any]],
+        concurrency: Optional[int] = None,
+        context: Optional[str] = None,
+        timeout: Optional[float] = None,
+        use_cache: bool = True,
+        instruction_set: str = "default"
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        여러 요청을 동시에 생성하고 끝나는 순서대로 결과 반환
+
+        동시에 concurrency개까지 generate_code로 생성하며, API 호출이 설정된 분당 요청 수를 넘지 않도록 시작을 늦춥니다
+        (캐시에 응답이 있거나 같은 요청이 이미 생성 중인 항목은 제한에 포함하지 않음).
+        항목 하나가 실패해도 나머지는 계속 생성하며, 반복을 중간에 멈추면 남은 생성은 취소합니다.
+
+        Args:
+            items: 요청 목록 [{"prompt": "...", "language": "python"(선택)}, ...]
+            concurrency: 동시에 생성할 항목 수 (None이면 설정값)
+            context: 모든 항목에 공통인 이전 컨텍스트 (선택)
+            timeout: 항목 하나의 최대 시간 (초, None이면 클라이언트 기본값)
+            use_cache: False면 캐시를 조회하지 않고 새로 생성
+            instruction_set: 지시문 세트
+
+        Yields:
+            성공: {"index": 항목 위치, "success": True, "code", "language", "explanation"}
+            실패: {"index": 항목 위치, "success": False, "error": "오류 메시지"}
+        """
+        semaphore = asyncio.Semaphore(max(1, concurrency or Config.get_gemini_batch_concurrency()))
+
+        async def run(index: int, item: Dict[str, Any]) -> Dict[str, Any]:
+            async with semaphore:
+                try:
+                    if not isinstance(item, dict) or not item.get("prompt"):
+                        raise ValueError("'prompt'가 필요합니다.")
+                    result = await self.generate_code(
+                        prompt=item["prompt"],
+                        language=item.get("language"),
+                        context=context,
+                        timeout=timeout,
+                        use_cache=use_cache,
+                        instruction_set=instruction_set,
+                        rate_limiter=self._batch_limiter
+                    )
+                    return {"index": index, "success": True, **result}
+                except Exception as e:
+                    return {"index": index, "success": False, "error": str(e)}
+
+        tasks = [asyncio.ensure_future(run(index, item)) for index, item in enumerate(items)]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    def _build_contents(
+        self,
+        prompt: str,
+        language: Optional[str],
+        context: Optional[str],
+        image_base64: Optional[str],
+        semantic_text: Optional[str] = None,
+        instruction_set: str = "default"
+    ) -> Tuple[Any, str, Optional[str]]:
+        """
+        모델 입력과 캐시 키 구성
+
+        Returns:
+            (모델 입력 (이미지가 있으면 [프롬프트, 이미지]), 캐시 키,
+             의미 기반 캐시 범위 (이미지가 있으면 None))
+
+        Raises:
+            ValueError: 알 수 없는 지시문 세트인 경우
+        """
+        if instruction_set not in SYSTEM_INSTRUCTIONS:
+            raise ValueError(f"알 수 없는 지시문 세트입니다: {instruction_set}")
+        instruction = SYSTEM_INSTRUCTIONS[instruction_set]
+
+        full_prompt = self._build_prompt(prompt, language, context)
+        generation_config = json.dumps(self.generation_config, sort_keys=True, default=str)
+
+        # 앞뒤 공백과 줄 끝 공백만 다른 요청(웹 UI 재전송 등)은 같은 키
+        normalized_prompt = "\n".join(line.rstrip() for line in full_prompt.strip().splitlines())
+
+        # 이미지가 있으면 멀티모달 입력으로 처리
+        if image_base64:
+            # Base64 디코딩
+            image_data = base64.b64decode(image_base64.split(',')[1] if ',' in image_base64 else image_base64)
+            image = Image.open(io.BytesIO(image_data))
+
+            # 이미지와 텍스트를 함께 전달
+            cache_key = ResponseCache.make_key(self.model_name, instruction, normalized_prompt, image_data, generation_config)
+            return [full_prompt, image], cache_key, None
+
+        # 텍스트만 전달
+        cache_key = ResponseCache.make_key(self.model_name, instruction, normalized_prompt, None, generation_config)
+
+        # 요청 원문을 뺀 나머지(시스템 프롬프트, 언어, 컨텍스트, 템플릿)가 모두 같은 항목끼리만 비교
+        template = full_prompt.replace(semantic_text or prompt, "\0")
+        semantic_scope = SemanticCache.make_scope(self.model_name, instruction, language, template, generation_config)
+        return full_prompt, cache_key, semantic_scope
+
+    async def _lookup_caches(
+        self,
+        cache_key: str,
+        semantic_text: str,
+        semantic_scope: Optional[str]
+    ) -> Optional[str]:
+        """응답 캐시, 의미 기반 캐시 순서로 조회한 응답 텍스트 (없으면 None)"""
+        if self.response_cache is not None:
+            cached = self.response_cache.get(cache_key)
+            if cached and cached.get("text"):
+                return cached["text"]
+
+        if self.semantic_cache is None or semantic_scope is None:
+            return None
+
+        try:
+            # 임베딩 계산(API 호출일 수 있음)은 이벤트 루프 밖에서
+            found = await asyncio.to_thread(self.semantic_cache.lookup, semantic_text, semantic_scope)
+        except Exception:
+            # 임베딩 실패 시 캐시 없이 생성
+            return None
+        return found[0].get("text") if found else None
+
+    async def _store_caches(
+        self,
+        cache_key: str,
+        semantic_text: str,
+        semantic_scope: Optional[str],
+        response_text: str
+    ):
+        """응답 텍스트를 캐시에 저장 (빈 응답은 저장하지 않음)"""
+        if not response_text:
+            return
+
+        if self.response_cache is not None:
+            self.response_cache.put(cache_key, {"text": response_text})
+
+        if self.semantic_cache is not None and semantic_scope is not None:
+            try:
+                await asyncio.to_thread(self.semantic_cache.add, semantic_text, semantic_scope, {"text": response_text})
+            except Exception:
+                pass
+
+    @staticmethod
+    def _create_semantic_cache() -> Optional[SemanticCache]:
+        """설정값으로 의미 기반 캐시 생성 (numpy가 없으면 None)"""
+        if Config.get_semantic_cache_embedder() == "hashing":
+            embedder = HashingEmbedder()
+        else:
+            embedder = GeminiEmbedder(Config.get_semantic_cache_embedding_model())
+
+        try:
+            return SemanticCache(
+                embedder,
+                threshold=Config.get_semantic_cache_threshold(),
+                max_entries=Config.get_semantic_cache_max_entries(),
+                ttl=Config.get_response_cache_ttl(),
+                cache_file=Config.get_cache_dir() / "semantic_cache.npz"
+            )
+        except ImportError:
+            return None
+
+    def cache_stats(self) -> Dict[str, Any]:
+        """
+        응답 캐시 통계
+
+        Returns:
+            Dict: 응답 캐시 통계와 의미 기반 캐시 통계(semantic). 사용하지 않는 캐시는 {"enabled": False}
+        """
+        if self.response_cache is None:
+            stats = {"enabled": False}
+        else:
+            stats = {"enabled": True, **self.response_cache.stats()}
+
+        if self.semantic_cache is None:
+            stats["semantic"] = {"enabled": False}
+        else:
+            stats["semantic"] = {"enabled": True, **self.semantic_cache.stats()}
+        return stats
+
+    def _finish(self, prompt: str, language: Optional[str], response_text: str) -> Dict[str, str]:
+        """응답에서 코드/언어/설명을 추출하고 대화 이력에 저장"""
+        code = self._extract_code(response_text)
+        detected_language = language or self._detect_language(response_text)
+        explanation = self._extract_explanation(response_text, code)
+
+        # 대화 이력 저장
+        self.conversation_history.append({
+            "role": "user",
+            "content": prompt
+        })
+        self.conversation_history.append({
+            "role": "assistant",
+            "content": code
+        })
+
+        return {
+            "code": code,
+            "language": detected_language,
+            "explanation": explanation
+        }
+
+    def _join_flight(self, key: str, contents: Any, timeout: float, instruction_set: str = "default") -> _Flight:
+        """
+        같은 키로 진행 중인 생성에 합류하거나, 없으면 전용 스레드 풀에서 새로 시작
+
+        Args:
+            key: 요청 키 (캐시 키)
+            contents: 모델 입력 (프롬프트 또는 [프롬프트, 이미지])
+            timeout: SDK 요청 최대 시간 (초)
+            instruction_set: 지시문 세트
+
+        Returns:
+            _Flight: 진행 중인 생성 (끝나면 반드시 _leave_flight 호출)
+        """
+        with self._flights_lock:
+            flight = self._flights.get(key)
+            if flight is not None and not flight.future.done() and not flight.cancel_event.is_set():
+                flight.waiters += 1
+                self._flight_stats["coalesced"] += 1
+                return flight
+
+            flight = _Flight()
+            flight.waiters = 1
+            flight.future = self._executor.submit(
+                self._generate_sync, contents, timeout, flight.cancel_event, flight.publish, instruction_set
+            )
+            self._flights[key] = flight
+            self._flight_stats["started"] += 1
+
+        flight.future.add_done_callback(lambda _: self._forget_flight(key, flight))
+        return flight
+
+    def _in_flight(self, key: str) -> bool:
+        """같은 키로 합류할 수 있는 생성이 진행 중인지 확인"""
+        with self._flights_lock:
+            flight = self._flights.get(key)
+            return flight is not None and not flight.future.done() and not flight.cancel_event.is_set()
+
+    def _leave_flight(self, key: str, flight: _Flight):
+        """
+        생성을 기다리던 호출자 하나가 떠남
+
+        마지막 호출자가 결과를 받기 전에 떠나면(취소, 시간 초과) 대기열의 작업은 실행하지 않고,
+        이미 실행 중인 작업은 다음 스트림 청크에서 중단하므로 스레드가 곧바로 다음 요청에 쓰입니다.
+        """
+        with self._flights_lock:
+            flight.waiters -= 1
+            if flight.waiters > 0 or flight.future.done():
+                return
+            flight.cancel_event.set()
+            flight.future.cancel()
+            if self._flights.get(key) is flight:
+                del self._flights[key]
+            self._flight_stats["abandoned"] += 1
+
+    def _forget_flight(self, key: str, flight: _Flight):
+        """끝난 생성을 진행 중 목록에서 제거 (이후 같은 요청은 캐시 또는 새 호출로 처리)"""
+        with self._flights_lock:
+            if self._flights.get(key) is flight:
+                del self._flights[key]
+
+    @staticmethod
+    async def _await_flight(flight: _Flight, timeout: float) -> str:
+        """
+        현재 이벤트 루프에서 공유 생성의 결과를 기다림
+
+        asyncio.wrap_future와 달리 기다리던 쪽이 취소되어도 공유 작업은 취소하지 않습니다
+        (중단 여부는 _leave_flight가 남은 호출자 수로 결정).
+
+        Args:
+            flight: 진행 중인 생성
+            timeout: 최대 시간 (초)
+
+        Returns:
+            str: 응답 텍스트
+        """
+        loop = asyncio.get_running_loop()
+        waiter = loop.create_future()
+
+        def settle(future: Future):
+            if waiter.done():
+                return
+            if future.cancelled():
+                waiter.cancel()
+                return
+            error = future.exception()
+            if isinstance(error, asyncio.CancelledError):
+                waiter.cancel()
+            elif error is not None:
+                waiter.set_exception(error)
+            else:
+                waiter.set_result(future.result())
+
+        def on_done(future: Future):
+            try:
+                loop.call_soon_threadsafe(settle, future)
+            except RuntimeError:
+                # 기다리던 이벤트 루프가 이미 닫힌 경우 (중단된 요청)
+                pass
+
+        flight.future.add_done_callback(on_done)
+        return await asyncio.wait_for(waiter, timeout)
+
+    def request_stats(self) -> Dict[str, int]:
+        """
+        생성 요청 통계
+
+        Returns:
+            Dict: 실제 API 호출 수(started), 진행 중인 호출에 합류한 요청 수(coalesced),
+                기다리는 요청이 모두 떠나 중단된 호출 수(abandoned), 진행 중인 호출 수(in_flight)
+        """
+        with self._flights_lock:
+            stats = dict(self._flight_stats)
+            stats["in_flight"] = len(self._flights)
+        return stats
+
+    def _generate_sync(
+        self,
+        contents: Any,
+        timeout: float,
+        cancel_event: threading.Event,
+        on_chunk: Optional[Callable[[str], Any]] = None,
+        instruction_set: str = "default"
     ) -> str:
-        """프롬프트 구성"""
-        system_prompt = """당신은 실행 가능한 완전한 애플리케이션을 생성하는 AI입니다.
+        """
+        스트리밍으로 응답을 받아 합침 (작업 스레드에서 실행)
 
-**중요 규칙:**
-1. 사용자가 "웹", "앱", "프로그램", "사이트" 등을 요청하면 **반드시 Streamlit 또는 Flask 웹 애플리케이션**으로 만들어야 합니다
-2. requirements.txt에 필요한 모든 라이브러리를 명시하세요
-3. README.md에 실행 방법을 상세히 작성하세요
-4. 코드는 바로 실행 가능해야 합니다 (복사/붙여넣기 필요 없이)
-5. 한글 주석으로 설명을 달아주세요
+        Args:
+            contents: 모델 입력
+            timeout: SDK 요청 최대 시간 (초)
+            cancel_event: 설정되면 다음 청크에서 중단
+            on_chunk: 청크 텍스트를 받을 때마다 호출할 함수 (선택)
+            instruction_set: 지시문 세트
 
-**웹앱 생성 시:**
-- Streamlit 사용 (간단한 경우)
-- Flask 사용 (복잡한 경우)
-- 파일 업로드, 입력 폼 등 UI 포함
-- 결과를 웹에서 바로 확인 가능하도록 구현
+        Returns:
+            str: 전체 응답 텍스트
+        """
+        if cancel_event.is_set():
+            raise asyncio.CancelledError()
 
-**출력 형식:**
-```python
-# main.py 또는 app.py
-코드 내용
-```
+        response = self._get_model(instruction_set).generate_content(
+            contents,
+            stream=True,
+            request_options={"timeout": timeout}
+        )
 
-```
-# requirements.txt
-필요한 라이브러리
-```
+        parts: List[str] = []
+        for chunk in response:
+            if cancel_event.is_set():
+                raise asyncio.CancelledError()
+            try:
+                text = chunk.text
+            except ValueError:
+                # 텍스트가 없는 청크 (안전 필터 등으로 후보가 비어 있는 경우)
+                continue
+            parts.append(text)
+            if on_chunk is not None and text:
+                on_chunk(text)
 
-```markdown
-# README.md
-실행 방법
-```
-3. 코드 블록(```) 사용
-4. 실행 가능하고 완전한 코드 작성
-"""
+        self._record_usage(getattr(response, "usage_metadata", None))
+
+        if not parts:
+            # 전체 응답 기준으로 차단 사유 등을 포함한 오류 발생
+            return response.text
+        return "".join(parts)
+
+    def _get_model(self, instruction_set: str) -> Any:
+        """
+        (모델, 지시문 세트)별 모델 반환 (작업 스레드에서 호출, 블로킹)
+
+        처음 사용할 때 만들어 재사용합니다. 컨텍스트 캐시를 사용하고 지시문이 최소 토큰 수 이상이면
+        지시문을 서버 측 캐시로 등록하며, 유효 시간이 절반 넘게 지나면 연장합니다.
+        캐시를 지원하지 않는 모델이거나 등록/연장에 실패하면 system_instruction만 사용합니다.
+        네트워크 호출은 잠금 밖에서 하며, 같은 지시문 세트를 동시에 처음 요청하면 한 번만 만들어 공유합니다.
+        """
+        key = (self.model_name, instruction_set)
+        renew = False
+        with self._models_lock:
+            entry = self._models.get(key)
+            if entry is None:
+                pending = self._models_pending.get(key)
+                leader = pending is None
+                if leader:
+                    pending = Future()
+                    self._models_pending[key] = pending
+            elif (entry["cached_content"] is not None and not entry["renewing"]
+                    and time.time() >= entry["expires_at"] - self.context_cache_ttl / 2):
+                # 연장은 한 요청만 (연장하는 동안 다른 요청은 아직 유효한 기존 캐시 사용)
+                entry["renewing"] = renew = True
+
+        if entry is None:
+            if not leader:
+                return pending.result()["model"]
+            try:
+                entry = self._create_model_entry(instruction_set)
+            except BaseException as e:
+                with self._models_lock:
+                    del self._models_pending[key]
+                pending.set_exception(e)
+                raise
+            with self._models_lock:
+                self._models[key] = entry
+                del self._models_pending[key]
+            pending.set_result(entry)
+            return entry["model"]
+
+        if renew:
+            return self._renew_model_entry(key, entry, instruction_set)["model"]
+        return entry["model"]
+
+    def _renew_model_entry(self, key: Tuple[str, str], entry: Dict[str, Any], instruction_set: str) -> Dict[str, Any]:
+        """
+        컨텍스트 캐시 유효 시간 연장 (캐시가 이미 만료/삭제되었으면 다시 등록, 잠금 밖에서 호출)
+
+        다시 등록하지도 못하면 만료되는 캐시를 계속 쓰지 않도록 항목을 제거하므로 다음 요청이 새로 만듭니다.
+        """
+        try:
+            self.backend.renew_cached_content(entry["cached_content"], self.context_cache_ttl)
+        except Exception as e:
+            logger.warning(f"컨텍스트 캐시 연장 실패, 다시 등록합니다 ({instruction_set}): {e}")
+            try:
+                new_entry = self._create_model_entry(instruction_set)
+            except BaseException:
+                with self._models_lock:
+                    if self._models.get(key) is entry:
+                        del self._models[key]
+                    entry["renewing"] = False
+                raise
+            with self._models_lock:
+                self._models[key] = new_entry
+                entry["renewing"] = False
+            return new_entry
+
+        with self._models_lock:
+            entry["expires_at"] = time.time() + self.context_cache_ttl
+            entry["renewing"] = False
+        return entry
+
+    def _create_model_entry(self, instruction_set: str) -> Dict[str, Any]:
+        """지시문 세트의 모델 생성 (컨텍스트 캐시 등록 시도 포함, 잠금 밖에서 호출)"""
+        instruction = SYSTEM_INSTRUCTIONS[instruction_set]
+        if self.context_cache_ttl:
+            try:
+                instruction_tokens = self.backend.count_tokens(self.model_name, instruction)
+            except Exception as e:
+                logger.warning(f"지시문 토큰 수 조회 실패 ({instruction_set}): {e}")
+                instruction_tokens = None
+        else:
+            # 캐시를 쓰지 않으면 토큰 수는 통계용이므로 API 호출 없이 추정
+            instruction_tokens = estimate_tokens(instruction)
+
+        entry = {
+            "model": None,
+            "cached_content": None,
+            "expires_at": None,
+            "instruction_tokens": instruction_tokens,
+            "renewing": False
+        }
+
+        if (self.context_cache_ttl and instruction_tokens is not None
+                and instruction_tokens >= self.context_cache_min_tokens):
+            try:
+                cached_content = self.backend.create_cached_content(
+                    self.model_name, instruction, self.context_cache_ttl
+                )
+                entry["model"] = self.backend.model_from_cache(cached_content, self.generation_config)
+                entry["cached_content"] = cached_content
+                entry["expires_at"] = time.time() + self.context_cache_ttl
+                return entry
+            except Exception as e:
+                logger.warning(f"컨텍스트 캐시 등록 실패, system_instruction만 사용합니다 ({instruction_set}): {e}")
+
+        entry["model"] = self.backend.create_model(self.model_name, instruction, self.generation_config)
+        return entry
+
+    def _record_usage(self, usage: Any):
+        """응답의 토큰 사용량 집계"""
+        if usage is None:
+            return
+        with self._token_lock:
+            self._token_stats["requests"] += 1
+            self._token_stats["prompt_tokens"] += getattr(usage, "prompt_token_count", 0) or 0
+            self._token_stats["cached_tokens"] += getattr(usage, "cached_content_token_count", 0) or 0
+            self._token_stats["output_tokens"] += getattr(usage, "candidates_token_count", 0) or 0
+
+    def token_stats(self) -> Dict[str, Any]:
+        """
+        토큰 사용량 통계
+
+        Returns:
+            Dict: API 호출 수, 입력/캐시/출력 토큰 합계, 입력 중 캐시로 할인된 비율(cached_ratio),
+                지시문 세트별 토큰 수와 컨텍스트 캐시 사용 여부(instructions)
+        """
+        with self._token_lock:
+            stats = dict(self._token_stats)
+
+        stats["uncached_prompt_tokens"] = stats["prompt_tokens"] - stats["cached_tokens"]
+        stats["cached_ratio"] = stats["cached_tokens"] / stats["prompt_tokens"] if stats["prompt_tokens"] else 0.0
+        stats["backend"] = getattr(self.backend, "name", type(self.backend).__name__)
+
+        with self._models_lock:
+            stats["instructions"] = {
+                instruction_set: {
+                    "tokens": entry["instruction_tokens"],
+                    "context_cache": entry["cached_content"] is not None
+                }
+                for (model_name, instruction_set), entry in self._models.items()
+                if model_name == self.model_name
+            }
+        return stats
+
+    def shutdown(self):
+        """스레드 풀 종료 (대기 중인 요청은 취소)"""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def _build_prompt(
+        self,
+        user_request: str,
+        language: Optional[str] = None,
+        context: Optional[str] = None
+    ) -> str:
+        """요청별 프롬프트 구성 (고정 지시문은 모델의 system_instruction으로 전달)"""
 
-        parts = [system_prompt]
+        parts = []
 
         if language:
-            parts.append(f"\n프로그래밍 언어: {language}")
+            parts.append(f"프로그래밍 언어: {language}")
 
         if context:
-            parts.append(f"\n컨텍스트:\n{context}")
+            parts.append(f"컨텍스트:\n{context}")
 
-        parts.append(f"\n사용자 요청:\n{user_request}")
+        parts.append(f"사용자 요청:\n{user_request}")
 
         return "\n".join(parts)
 
@@ -160,10 +1001,7 @@ class GeminiClient:
                 # 첫 줄이 언어 이름인 경우 제거
                 if "\n" in code_block:
                     first_line = code_block.split("\n")[0].strip()
-                    if first_line.lower() in [
-                        "python", "javascript", "java", "cpp", "c",
-                        "go", "rust", "typescript", "ruby", "php"
-                    ]:
+                    if first_line.lower() in CODE_LANGUAGES:
                         code_block = "\n".join(code_block.split("\n")[1:])
 
                 return code_block
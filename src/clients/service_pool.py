@@ -0,0 +1,182 @@
+"""Drive API 서비스 풀 (스레드 안전한 HTTP 연결 재사용)"""
+import queue
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Any, Dict, Iterator, List, Optional
+import httplib2
+from google_auth_httplib2 import AuthorizedHttp
+
+
+class _CountingHttp(httplib2.Http):
+    """새로 연결(TCP/TLS 핸드셰이크)한 횟수를 세는 httplib2.Http"""
+
+    def __init__(self, on_connect: Callable[[], None], **kwargs):
+        super().__init__(**kwargs)
+        self._on_connect = on_connect
+
+    def _conn_request(self, conn, request_uri, method, body, headers):
+        if conn.sock is None:
+            self._on_connect()
+        return super()._conn_request(conn, request_uri, method, body, headers)
+
+
+class PooledService:
+    """풀에서 대여한 Drive 서비스와 그 서비스가 사용하는 인증된 HTTP 객체"""
+
+    def __init__(self, service: Any, http: AuthorizedHttp):
+        self.service = service
+        self.http = http
+        self.uses = 0
+
+
+class DriveServicePool:
+    """
+    인증된 HTTP 연결과 Drive 서비스 객체의 풀
+
+    httplib2 연결은 스레드 안전하지 않으므로 한 번에 한 스레드만 대여(checkout)하고,
+    반납(checkin)된 연결은 keep-alive 상태로 다음 요청에 재사용합니다.
+    모든 연결은 같은 Credentials 객체를 공유합니다.
+    """
+
+    def __init__(
+        self,
+        credentials: Any,
+        build_service: Callable[[AuthorizedHttp], Any],
+        size: int = 8,
+        timeout: Optional[float] = None
+    ):
+        """
+        서비스 풀 초기화
+
+        Args:
+            credentials: 모든 연결이 공유할 Google OAuth Credentials
+            build_service: 인증된 HTTP 객체로 Drive 서비스를 만드는 함수
+            size: 최대 연결 수
+            timeout: 대여 대기 최대 시간 (초, None이면 무제한)
+        """
+        self.credentials = credentials
+        self.size = max(1, size)
+        self.timeout = timeout
+        self._build_service = build_service
+
+        # 가장 최근에 반납된(연결이 살아 있을 가능성이 높은) 항목부터 재사용
+        self._idle: "queue.LifoQueue[PooledService]" = queue.LifoQueue()
+        self._all: List[PooledService] = []
+        self._created = 0
+        self._lock = threading.Lock()
+
+        self._stats = {
+            "checkouts": 0,
+            "reuses": 0,
+            "waits": 0,
+            "wait_seconds": 0.0,
+            "max_wait_seconds": 0.0,
+            "handshakes": 0
+        }
+
+    def checkout(self) -> PooledService:
+        """
+        서비스 대여 (유휴 항목이 없고 최대 크기에 도달했으면 반납될 때까지 대기)
+
+        Returns:
+            PooledService: 대여한 서비스
+
+        Raises:
+            TimeoutError: timeout 안에 대여하지 못한 경우
+        """
+        started = time.monotonic()
+
+        try:
+            pooled = self._idle.get_nowait()
+        except queue.Empty:
+            pooled = self._create()
+            if pooled is None:
+                try:
+                    pooled = self._idle.get(timeout=self.timeout)
+                except queue.Empty:
+                    raise TimeoutError(f"Drive 연결 대여 대기 시간 초과 ({self.timeout}초)")
+
+        waited = time.monotonic() - started
+        with self._lock:
+            self._stats["checkouts"] += 1
+            if pooled.uses:
+                self._stats["reuses"] += 1
+            if waited > 0.001:
+                self._stats["waits"] += 1
+            self._stats["wait_seconds"] += waited
+            self._stats["max_wait_seconds"] = max(self._stats["max_wait_seconds"], waited)
+
+        pooled.uses += 1
+        return pooled
+
+    def checkin(self, pooled: PooledService):
+        """
+        서비스 반납
+
+        Args:
+            pooled: checkout으로 대여한 서비스
+        """
+        self._idle.put(pooled)
+
+    @contextmanager
+    def lease(self) -> Iterator[PooledService]:
+        """with 문으로 대여/반납"""
+        pooled = self.checkout()
+        try:
+            yield pooled
+        finally:
+            self.checkin(pooled)
+
+    def _create(self) -> Optional[PooledService]:
+        """최대 크기 안에서 새 연결 생성 (가득 찼으면 None)"""
+        with self._lock:
+            if self._created >= self.size:
+                return None
+            self._created += 1
+
+        try:
+            http = AuthorizedHttp(self.credentials, http=_CountingHttp(self._count_handshake))
+            pooled = PooledService(self._build_service(http), http)
+        except Exception:
+            with self._lock:
+                self._created -= 1
+            raise
+
+        with self._lock:
+            self._all.append(pooled)
+        return pooled
+
+    def set_credentials(self, credentials: Any):
+        """
+        모든 연결의 자격 증명 교체 (대여 중인 연결은 다음 요청부터 적용)
+
+        Args:
+            credentials: 새 Credentials
+        """
+        with self._lock:
+            self.credentials = credentials
+            for pooled in self._all:
+                pooled.http.credentials = credentials
+
+    def _count_handshake(self):
+        with self._lock:
+            self._stats["handshakes"] += 1
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        풀 통계 반환
+
+        Returns:
+            Dict: 대여/재사용 횟수, 대기 시간, 새 연결(핸드셰이크) 수, 재사용 비율
+        """
+        with self._lock:
+            stats = dict(self._stats)
+            stats["size"] = self.size
+            stats["created"] = self._created
+
+        stats["idle"] = self._idle.qsize()
+        checkouts = stats["checkouts"]
+        stats["reuse_ratio"] = stats["reuses"] / checkouts if checkouts else 0.0
+        stats["avg_wait_seconds"] = stats["wait_seconds"] / checkouts if checkouts else 0.0
+        return stats
@@ -1,4 +1,12 @@
 """Managers package"""
+from .code_index import CodeSearchIndex
 from .context_manager import ContextManager
+from .content_cache import ContentCache
+from .folder_cache import FolderCache
+from .folder_sync import FolderSync
+from .metadata_index import DriveMetadataIndex
+from .response_cache import ResponseCache
+from .semantic_cache import SemanticCache
+from .upload_sessions import UploadSessionStore
 
-__all__ = ['ContextManager']
+__all__ = ['CodeSearchIndex', 'ContextManager', 'ContentCache', 'FolderCache', 'FolderSync', 'DriveMetadataIndex', 'ResponseCache', 'SemanticCache', 'UploadSessionStore']
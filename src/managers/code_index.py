@@ -0,0 +1,414 @@
+"""Drive에 저장된 코드 파일 전문 검색 인덱스 (SQLite 트라이그램)"""
+import asyncio
+import re
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Optional, Dict, List, Iterable, Set, Any
+
+try:
+    from re import _parser as sre_parse
+except ImportError:  # Python 3.10 이하
+    import sre_parse
+
+
+# 검색 결과별 최대 스니펫 줄 수 / 스니펫 한 줄 최대 길이
+MAX_SNIPPETS = 3
+MAX_SNIPPET_LENGTH = 200
+
+# 원격 목록 조회 필드
+INDEX_FIELDS = 'id, name, mimeType, size, md5Checksum'
+
+FOLDER_MIME_TYPE = 'application/vnd.google-apps.folder'
+
+# 텍스트로 색인할 파일 (MIME 타입이 text/*가 아니어도 확장자로 판단)
+TEXT_MIME_TYPES = {
+    'application/json',
+    'application/javascript',
+    'application/xml',
+    'application/x-sh',
+    'application/x-python',
+    'application/x-yaml',
+    'application/sql'
+}
+TEXT_EXTENSIONS = {
+    '.py', '.js', '.jsx', '.ts', '.tsx', '.java', '.kt', '.go', '.rs', '.c', '.h', '.cpp', '.hpp',
+    '.cs', '.rb', '.php', '.swift', '.scala', '.sh', '.sql', '.html', '.css', '.scss', '.vue',
+    '.json', '.yaml', '.yml', '.toml', '.ini', '.cfg', '.xml', '.md', '.txt', '.csv'
+}
+
+
+class CodeSearchIndex:
+    """
+    파일 내용의 트라이그램(3글자 조각) 역색인
+
+    부분 문자열/정규식 검색 시 쿼리에 반드시 포함되는 트라이그램으로 후보 파일을 먼저 좁힌 뒤,
+    로컬에 보관한 내용에서만 실제로 매칭하므로 검색할 때마다 파일을 다운로드하지 않습니다.
+    """
+
+    def __init__(self, db_path: Optional[Path] = None):
+        """
+        코드 검색 인덱스 초기화
+
+        Args:
+            db_path: SQLite 파일 경로 (None이면 메모리 DB)
+        """
+        self.db_path = Path(db_path) if db_path else None
+        if self.db_path:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            str(self.db_path) if self.db_path else ':memory:',
+            check_same_thread=False
+        )
+        self._conn.row_factory = sqlite3.Row
+        self._create_tables()
+
+    def _create_tables(self):
+        """테이블 생성"""
+        with self._lock, self._conn:
+            self._conn.executescript("""
+                CREATE TABLE IF NOT EXISTS documents (
+                    file_id TEXT PRIMARY KEY,
+                    name TEXT NOT NULL,
+                    md5_checksum TEXT,
+                    content TEXT NOT NULL
+                );
+
+                CREATE TABLE IF NOT EXISTS trigrams (
+                    trigram TEXT NOT NULL,
+                    file_id TEXT NOT NULL,
+                    PRIMARY KEY (trigram, file_id)
+                ) WITHOUT ROWID;
+                CREATE INDEX IF NOT EXISTS idx_trigrams_file ON trigrams(file_id);
+
+                CREATE TABLE IF NOT EXISTS state (
+                    key TEXT PRIMARY KEY,
+                    value TEXT
+                );
+            """)
+
+    # ------------------------------------------------------------------
+    # 쓰기
+    # ------------------------------------------------------------------
+
+    def update(self, file_id: str, name: str, content: str, md5_checksum: Optional[str] = None) -> bool:
+        """
+        파일 내용 색인 (md5가 같으면 건너뜀)
+
+        Args:
+            file_id: Drive 파일 ID
+            name: 파일 이름
+            content: 파일 내용
+            md5_checksum: Drive md5Checksum (변경 감지용)
+
+        Returns:
+            bool: 색인을 새로 만들었는지 여부
+        """
+        with self._lock, self._conn:
+            row = self._conn.execute(
+                "SELECT md5_checksum FROM documents WHERE file_id = ?", (file_id,)
+            ).fetchone()
+            if row and md5_checksum and row['md5_checksum'] == md5_checksum:
+                self._conn.execute("UPDATE documents SET name = ? WHERE file_id = ?", (name, file_id))
+                return False
+
+            self._conn.execute(
+                "INSERT OR REPLACE INTO documents (file_id, name, md5_checksum, content) VALUES (?, ?, ?, ?)",
+                (file_id, name, md5_checksum, content)
+            )
+            self._conn.execute("DELETE FROM trigrams WHERE file_id = ?", (file_id,))
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO trigrams (trigram, file_id) VALUES (?, ?)",
+                ((trigram, file_id) for trigram in self._trigrams(content))
+            )
+            return True
+
+    def remove(self, file_id: str):
+        """
+        파일 색인 삭제
+
+        Args:
+            file_id: Drive 파일 ID
+        """
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM documents WHERE file_id = ?", (file_id,))
+            self._conn.execute("DELETE FROM trigrams WHERE file_id = ?", (file_id,))
+
+    def checksums(self) -> Dict[str, Optional[str]]:
+        """
+        색인된 파일별 md5Checksum (증분 갱신 시 비교용)
+
+        Returns:
+            Dict: 파일 ID → md5Checksum
+        """
+        with self._lock:
+            rows = self._conn.execute("SELECT file_id, md5_checksum FROM documents").fetchall()
+        return {row['file_id']: row['md5_checksum'] for row in rows}
+
+    @staticmethod
+    def _trigrams(text: str) -> Set[str]:
+        """소문자 기준 트라이그램 집합"""
+        text = text.lower()
+        return {text[i:i + 3] for i in range(len(text) - 2)}
+
+    # ------------------------------------------------------------------
+    # Drive 폴더 증분 색인
+    # ------------------------------------------------------------------
+
+    async def refresh(
+        self,
+        drive_client: Any,
+        folder_id: str,
+        max_file_bytes: int = 1024 * 1024,
+        max_concurrency: int = 8
+    ) -> Dict[str, int]:
+        """
+        Drive 폴더(하위 폴더 포함)와 색인 동기화
+
+        목록(메타데이터)만 조회해 md5Checksum이 바뀌었거나 새로 생긴 텍스트 파일만 다운로드하고,
+        폴더에서 사라진 파일은 색인에서 삭제합니다.
+
+        Args:
+            drive_client: Drive API 클라이언트
+            folder_id: 색인할 Drive 폴더 ID
+            max_file_bytes: 색인할 파일 최대 크기 (바이트)
+            max_concurrency: 동시에 다운로드할 파일 수
+
+        Returns:
+            {"indexed": 새로 색인한 파일 수, "removed": 삭제한 수, "unchanged": 변경 없는 수, "failed": 실패 수}
+        """
+        remote = await self._list_remote(drive_client, folder_id)
+        indexed = self.checksums()
+
+        targets = [
+            (path, file) for path, file in remote.items()
+            if self._is_indexable(file, max_file_bytes)
+        ]
+        changed = [(path, file) for path, file in targets if indexed.get(file['id']) != file['md5Checksum']]
+
+        downloads = await drive_client.download_files(
+            [file['id'] for _, file in changed],
+            max_concurrency=max_concurrency
+        )
+        failed = 0
+        for (path, file), download in zip(changed, downloads):
+            if download.get('error'):
+                failed += 1
+                continue
+            self.update(file['id'], path, download['content'], file['md5Checksum'])
+
+        current_ids = {file['id'] for _, file in targets}
+        removed = [file_id for file_id in indexed if file_id not in current_ids]
+        for file_id in removed:
+            self.remove(file_id)
+
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO state (key, value) VALUES (?, ?)",
+                (f"refreshed_at:{folder_id}", str(time.time()))
+            )
+
+        return {
+            "indexed": len(changed) - failed,
+            "removed": len(removed),
+            "unchanged": len(targets) - len(changed),
+            "failed": failed
+        }
+
+    def refreshed_at(self, folder_id: str) -> Optional[float]:
+        """
+        폴더를 마지막으로 동기화한 시각
+
+        Args:
+            folder_id: Drive 폴더 ID
+
+        Returns:
+            float: epoch 초 (동기화한 적 없으면 None)
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value FROM state WHERE key = ?", (f"refreshed_at:{folder_id}",)
+            ).fetchone()
+        return float(row['value']) if row else None
+
+    @staticmethod
+    async def _list_remote(drive_client: Any, folder_id: str) -> Dict[str, Dict]:
+        """Drive 폴더 아래 전체 파일 (상대 경로 → 파일 정보)"""
+        files: Dict[str, Dict] = {}
+
+        async def walk(current_id: str, prefix: str):
+            children = []
+            async for item in drive_client.iter_files(folder_id=current_id, fields=INDEX_FIELDS, order_by='name'):
+                path = f"{prefix}{item['name']}"
+                if item.get('mimeType') == FOLDER_MIME_TYPE:
+                    children.append(walk(item['id'], f"{path}/"))
+                elif path not in files:
+                    files[path] = item
+            await asyncio.gather(*children)
+
+        await walk(folder_id, "")
+        return files
+
+    @staticmethod
+    def _is_indexable(file: Dict, max_file_bytes: int) -> bool:
+        """내용을 비교할 수 있는(md5Checksum이 있는) 크기 제한 이하의 텍스트 파일인지"""
+        if not file.get('md5Checksum'):
+            return False
+        if int(file.get('size') or 0) > max_file_bytes:
+            return False
+
+        mime_type = file.get('mimeType') or ''
+        if mime_type.startswith('text/') or mime_type in TEXT_MIME_TYPES:
+            return True
+        return Path(file['name']).suffix.lower() in TEXT_EXTENSIONS
+
+    # ------------------------------------------------------------------
+    # 검색
+    # ------------------------------------------------------------------
+
+    def search(
+        self,
+        query: str,
+        regex: bool = False,
+        case_sensitive: bool = False,
+        limit: int = 20
+    ) -> List[Dict]:
+        """
+        부분 문자열 또는 정규식으로 검색
+
+        매칭된 줄 수가 많은 파일, 파일 이름에도 쿼리가 포함된 파일을 먼저 반환합니다.
+
+        Args:
+            query: 검색어 (regex가 True면 정규식)
+            regex: 정규식 검색 여부
+            case_sensitive: 대소문자 구분 여부
+            limit: 최대 결과 수
+
+        Returns:
+            List[Dict]: 검색 결과
+            [
+                {
+                    "file_id": "파일 ID",
+                    "name": "파일 이름",
+                    "score": 점수,
+                    "match_count": 매칭된 줄 수,
+                    "snippets": [{"line": 줄 번호, "text": "줄 내용"}, ...]
+                }
+            ]
+
+        Raises:
+            ValueError: 잘못된 정규식인 경우
+        """
+        flags = 0 if case_sensitive else re.IGNORECASE
+        try:
+            pattern = re.compile(query if regex else re.escape(query), flags)
+        except re.error as e:
+            raise ValueError(f"잘못된 정규식입니다: {e}")
+
+        literals = self._required_literals(query) if regex else [query]
+        candidates = self._candidates(literals)
+
+        results = []
+        for document in self._documents(candidates):
+            matches = self._match_lines(pattern, document['content'])
+            if not matches:
+                continue
+
+            score = float(len(matches))
+            if pattern.search(document['name']):
+                score += 10
+            results.append({
+                "file_id": document['file_id'],
+                "name": document['name'],
+                "score": score,
+                "match_count": len(matches),
+                "snippets": matches[:MAX_SNIPPETS]
+            })
+
+        results.sort(key=lambda item: (-item["score"], item["name"]))
+        return results[:limit]
+
+    def _candidates(self, literals: List[str]) -> Optional[List[str]]:
+        """필수 문자열의 트라이그램을 모두 가진 파일 ID (좁힐 수 없으면 None = 전체)"""
+        trigrams: Set[str] = set()
+        for literal in literals:
+            trigrams |= self._trigrams(literal)
+        if not trigrams:
+            return None
+
+        placeholders = ",".join("?" for _ in trigrams)
+        with self._lock:
+            rows = self._conn.execute(
+                f"""
+                SELECT file_id FROM trigrams
+                WHERE trigram IN ({placeholders})
+                GROUP BY file_id
+                HAVING COUNT(*) = ?
+                """,
+                (*trigrams, len(trigrams))
+            ).fetchall()
+        return [row['file_id'] for row in rows]
+
+    def _documents(self, file_ids: Optional[Iterable[str]]) -> List[sqlite3.Row]:
+        """후보 파일 내용 조회 (None이면 전체)"""
+        with self._lock:
+            if file_ids is None:
+                return self._conn.execute("SELECT * FROM documents").fetchall()
+
+            file_ids = list(file_ids)
+            if not file_ids:
+                return []
+            placeholders = ",".join("?" for _ in file_ids)
+            return self._conn.execute(
+                f"SELECT * FROM documents WHERE file_id IN ({placeholders})", file_ids
+            ).fetchall()
+
+    @staticmethod
+    def _match_lines(pattern: "re.Pattern", content: str) -> List[Dict]:
+        """패턴이 매칭된 줄 목록"""
+        matches = []
+        for number, line in enumerate(content.splitlines(), start=1):
+            if pattern.search(line):
+                matches.append({"line": number, "text": line.strip()[:MAX_SNIPPET_LENGTH]})
+        return matches
+
+    @staticmethod
+    def _required_literals(query: str) -> List[str]:
+        """
+        정규식에 반드시 포함되는 리터럴 문자열 추출
+
+        최상위에서 연속된 일반 문자만 모으며, 대안(|)이나 반복 등 해석이 어려운 부분에서는 끊습니다.
+        """
+        try:
+            parsed = sre_parse.parse(query)
+        except Exception:
+            return []
+
+        literals = []
+        current = []
+        for op, value in parsed:
+            if op is sre_parse.LITERAL:
+                current.append(chr(value))
+                continue
+            if current:
+                literals.append("".join(current))
+                current = []
+            if op is sre_parse.BRANCH:
+                # 최상위 대안이 있으면 어느 리터럴도 필수가 아님
+                return []
+        if current:
+            literals.append("".join(current))
+
+        return [literal for literal in literals if len(literal) >= 3]
+
+    def close(self):
+        """DB 연결 종료"""
+        with self._lock:
+            self._conn.close()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM documents").fetchone()[0]
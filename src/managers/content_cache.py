@@ -0,0 +1,226 @@
+"""Drive 파일 내용 캐시 (메모리 LRU + 디스크)"""
+import os
+import re
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Optional, Dict, Tuple
+
+
+class ContentCache:
+    """(파일 ID, 버전 태그) → 파일 내용 캐시
+
+    버전 태그는 md5Checksum(일반 파일) 또는 version(Google 문서)으로,
+    파일이 바뀌면 태그가 달라지므로 별도의 만료 없이 항상 최신 내용만 반환됩니다.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Optional[Path] = None,
+        max_memory_bytes: int = 32 * 1024 * 1024,
+        max_disk_bytes: int = 256 * 1024 * 1024
+    ):
+        """
+        내용 캐시 초기화
+
+        Args:
+            cache_dir: 디스크 캐시 디렉토리 (None이면 메모리에만 보관)
+            max_memory_bytes: 메모리 계층 최대 크기 (바이트)
+            max_disk_bytes: 디스크 계층 최대 크기 (바이트)
+        """
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self.max_memory_bytes = max_memory_bytes
+        self.max_disk_bytes = max_disk_bytes
+
+        self._memory: "OrderedDict[Tuple[str, str], bytes]" = OrderedDict()
+        self._memory_bytes = 0
+        self._disk_bytes = 0
+        self._lock = threading.Lock()
+
+        self._stats = {
+            "memory_hits": 0,
+            "disk_hits": 0,
+            "misses": 0,
+            "memory_evictions": 0,
+            "disk_evictions": 0
+        }
+
+        if self.cache_dir:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            self._disk_bytes = sum(path.stat().st_size for path in self.cache_dir.glob("*.bin"))
+
+    def get(self, file_id: str, version_tag: str) -> Optional[bytes]:
+        """
+        캐시된 내용 조회
+
+        Args:
+            file_id: 파일 ID
+            version_tag: 버전 태그 (md5Checksum 또는 version)
+
+        Returns:
+            bytes: 파일 내용 (없으면 None)
+        """
+        key = (file_id, version_tag)
+
+        with self._lock:
+            data = self._memory.get(key)
+            if data is not None:
+                self._memory.move_to_end(key)
+                self._stats["memory_hits"] += 1
+                return data
+
+        path = self._disk_path(file_id, version_tag)
+        if path is not None and path.exists():
+            try:
+                data = path.read_bytes()
+                os.utime(path)
+            except OSError:
+                data = None
+
+            if data is not None:
+                with self._lock:
+                    self._stats["disk_hits"] += 1
+                    self._put_memory(key, data)
+                return data
+
+        with self._lock:
+            self._stats["misses"] += 1
+        return None
+
+    def put(self, file_id: str, version_tag: str, data: bytes):
+        """
+        내용 저장 (같은 파일의 이전 버전은 제거)
+
+        Args:
+            file_id: 파일 ID
+            version_tag: 버전 태그 (md5Checksum 또는 version)
+            data: 파일 내용
+        """
+        self.invalidate(file_id)
+
+        with self._lock:
+            self._put_memory((file_id, version_tag), data)
+
+        path = self._disk_path(file_id, version_tag)
+        if path is None or len(data) > self.max_disk_bytes:
+            return
+
+        try:
+            temp_file = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+            temp_file.write_bytes(data)
+            os.replace(temp_file, path)
+        except OSError:
+            return
+
+        with self._lock:
+            self._disk_bytes += len(data)
+        self._evict_disk()
+
+    def invalidate(self, file_id: str):
+        """
+        파일의 모든 버전 제거
+
+        Args:
+            file_id: 파일 ID
+        """
+        with self._lock:
+            for key in [key for key in self._memory if key[0] == file_id]:
+                self._memory_bytes -= len(self._memory.pop(key))
+
+        if not self.cache_dir:
+            return
+
+        for path in self.cache_dir.glob(f"{self._safe(file_id)}.*.bin"):
+            try:
+                size = path.stat().st_size
+                path.unlink()
+            except OSError:
+                continue
+            with self._lock:
+                self._disk_bytes -= size
+
+    def clear(self):
+        """캐시 전체 초기화"""
+        with self._lock:
+            self._memory.clear()
+            self._memory_bytes = 0
+
+        if self.cache_dir:
+            for path in self.cache_dir.glob("*.bin"):
+                try:
+                    path.unlink()
+                except OSError:
+                    continue
+            with self._lock:
+                self._disk_bytes = 0
+
+    def stats(self) -> Dict[str, int]:
+        """
+        캐시 통계 반환
+
+        Returns:
+            Dict: 적중/미스/제거 횟수와 계층별 사용량
+        """
+        with self._lock:
+            return {
+                **self._stats,
+                "memory_entries": len(self._memory),
+                "memory_bytes": self._memory_bytes,
+                "max_memory_bytes": self.max_memory_bytes,
+                "disk_bytes": self._disk_bytes,
+                "max_disk_bytes": self.max_disk_bytes
+            }
+
+    def _put_memory(self, key: Tuple[str, str], data: bytes):
+        """메모리 계층에 저장 후 용량 초과분 제거 (잠금 안에서 호출)"""
+        if len(data) > self.max_memory_bytes:
+            return
+
+        previous = self._memory.pop(key, None)
+        if previous is not None:
+            self._memory_bytes -= len(previous)
+
+        self._memory[key] = data
+        self._memory_bytes += len(data)
+
+        while self._memory_bytes > self.max_memory_bytes:
+            _, evicted = self._memory.popitem(last=False)
+            self._memory_bytes -= len(evicted)
+            self._stats["memory_evictions"] += 1
+
+    def _evict_disk(self):
+        """디스크 계층 용량 초과 시 가장 오래 사용하지 않은 파일부터 제거"""
+        with self._lock:
+            if self._disk_bytes <= self.max_disk_bytes:
+                return
+
+        entries = []
+        for path in self.cache_dir.glob("*.bin"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+
+        for _, size, path in sorted(entries):
+            with self._lock:
+                if self._disk_bytes <= self.max_disk_bytes:
+                    return
+            try:
+                path.unlink()
+            except OSError:
+                continue
+            with self._lock:
+                self._disk_bytes -= size
+                self._stats["disk_evictions"] += 1
+
+    def _disk_path(self, file_id: str, version_tag: str) -> Optional[Path]:
+        """디스크 캐시 파일 경로"""
+        if not self.cache_dir:
+            return None
+        return self.cache_dir / f"{self._safe(file_id)}.{self._safe(version_tag)}.bin"
+
+    @staticmethod
+    def _safe(value: str) -> str:
+        """파일 이름에 쓸 수 없는 문자 치환"""
+        return re.sub(r'[^A-Za-z0-9_-]', '_', value)
@@ -1,20 +1,37 @@
 """컨텍스트 관리자"""
 import json
+import re
 from datetime import datetime
 from pathlib import Path
-from typing import Optional, Dict, List
+from typing import Optional, Dict, List, Callable, Tuple
+
+from src.utils.config import Config
+from src.utils.tokens import estimate_tokens
+
+
+# 빈 줄 뒤에 들여쓰지 않은 줄이 오는 곳 (최상위 함수/클래스/문단 경계)
+_BLOCK_BOUNDARY = re.compile(r'\n\s*\n(?=\S)')
+
+# 응답 일부만 넣을 때 뒤에 붙이는 표시
+_TRUNCATED_MARK = "\n..."
 
 
 class ContextManager:
     """대화 이력 및 컨텍스트 관리"""
 
-    def __init__(self, session_id: Optional[str] = None, context_dir: Optional[Path] = None):
+    def __init__(
+        self,
+        session_id: Optional[str] = None,
+        context_dir: Optional[Path] = None,
+        token_counter: Optional[Callable[[str], int]] = None
+    ):
         """
         컨텍스트 관리자 초기화
 
         Args:
             session_id: 세션 ID (None이면 자동 생성)
             context_dir: 컨텍스트 저장 디렉토리 (None이면 기본 경로 사용)
+            token_counter: 텍스트 토큰 수 함수 (None이면 로컬 근사치 estimate_tokens)
         """
         if context_dir is None:
             project_root = Path(__file__).parent.parent.parent
@@ -34,6 +51,10 @@ class ContextManager:
             "last_updated": None
         }
 
+        self.token_counter = token_counter or estimate_tokens
+        # 이력 위치 → (대화 항목, 사용자 메시지 토큰 수, 응답 토큰 수)
+        self._token_counts: Dict[int, Tuple[Dict, int, int]] = {}
+
     def add_interaction(
         self,
         user_message: str,
@@ -105,36 +126,106 @@ class ContextManager:
             self.metadata = session_data.get('metadata', {})
             self.history = session_data['history']
             self.session_file = session_file
+            self._token_counts = {}
         except Exception as e:
             raise Exception(f"세션 로드 실패: {e}")
 
-    def get_context(self, max_interactions: int = 5) -> str:
+    def get_context(self, max_interactions: Optional[int] = None, max_tokens: Optional[int] = None) -> str:
         """
-        최근 대화 이력 반환
+        토큰 예산 안의 최근 대화 이력 반환
+
+        최신 대화부터 예산이 허락하는 만큼 통째로 담고, 다 들어가지 않는 첫 대화는 응답을
+        코드 블록(최상위 함수/클래스, ``` 블록) 단위로 앞에서부터 담은 뒤 그보다 오래된 대화는 생략합니다.
+        대화별 토큰 수는 한 번만 계산해 두므로 담는 대화 수에만 비례해 시간이 걸립니다.
 
         Args:
-            max_interactions: 반환할 최대 대화 수
+            max_interactions: 담을 최대 대화 수 (None이면 제한 없음)
+            max_tokens: 토큰 예산 (None이면 설정값)
 
         Returns:
-            str: 포맷팅된 컨텍스트 문자열
+            str: 포맷팅된 컨텍스트 문자열 (담을 대화가 없으면 빈 문자열)
         """
         if not self.history:
             return ""
 
-        recent_history = self.history[-max_interactions:]
-        context_lines = ["이전 대화:"]
+        header = "이전 대화:"
+        budget = max_tokens if max_tokens is not None else Config.get_context_max_tokens()
+        remaining = budget - self.token_counter(header)
+        overhead = self.token_counter(self._format_interaction("", ""))
+
+        oldest = max(0, len(self.history) - max_interactions) if max_interactions else 0
+        selected: List[str] = []
+
+        for index in range(len(self.history) - 1, oldest - 1, -1):
+            interaction = self.history[index]
+            user_tokens, assistant_tokens = self._interaction_tokens(index)
+
+            cost = overhead + user_tokens + assistant_tokens
+            if cost <= remaining:
+                selected.append(self._format_interaction(interaction['user'], interaction['assistant']))
+                remaining -= cost
+                continue
+
+            partial = self._fit_response(interaction['assistant'], remaining - overhead - user_tokens)
+            if partial is not None:
+                selected.append(self._format_interaction(interaction['user'], partial))
+            break
+
+        if not selected:
+            return ""
+
+        return "\n".join([header] + selected[::-1])
+
+    def _interaction_tokens(self, index: int) -> Tuple[int, int]:
+        """대화 하나의 (사용자 메시지, 응답) 토큰 수 (계산 결과 재사용)"""
+        interaction = self.history[index]
+        cached = self._token_counts.get(index)
+        if cached is not None and cached[0] is interaction:
+            return cached[1], cached[2]
 
-        for interaction in recent_history:
-            user_msg = interaction['user']
-            assistant_msg = interaction['assistant']
-            # 응답이 너무 길면 요약
-            if len(assistant_msg) > 200:
-                assistant_msg = assistant_msg[:200] + "..."
+        user_tokens = self.token_counter(interaction['user'])
+        assistant_tokens = self.token_counter(interaction['assistant'])
+        self._token_counts[index] = (interaction, user_tokens, assistant_tokens)
+        return user_tokens, assistant_tokens
 
-            context_lines.append(f"\n사용자: {user_msg}")
-            context_lines.append(f"AI: {assistant_msg}")
+    def _fit_response(self, response: str, budget: int) -> Optional[str]:
+        """
+        응답을 앞에서부터 통째인 코드 블록 단위로 budget 안에 맞춤
 
-        return "\n".join(context_lines)
+        Returns:
+            str: 줄인 응답 (블록이 하나도 들어가지 않으면 생략 표시만), budget이 생략 표시보다 작으면 None
+        """
+        budget -= self.token_counter(_TRUNCATED_MARK)
+        if budget < 0:
+            return None
+
+        kept: List[str] = []
+        for block in self._split_blocks(response):
+            tokens = self.token_counter(block + "\n\n")
+            if tokens > budget:
+                break
+            kept.append(block)
+            budget -= tokens
+
+        return "\n\n".join(kept) + _TRUNCATED_MARK
+
+    @staticmethod
+    def _split_blocks(text: str) -> List[str]:
+        """최상위 코드 블록 단위로 분할 (``` 블록 안의 빈 줄에서는 나누지 않음)"""
+        blocks: List[str] = []
+        in_fence = False
+        for piece in _BLOCK_BOUNDARY.split(text):
+            if in_fence and blocks:
+                blocks[-1] += "\n\n" + piece
+            else:
+                blocks.append(piece)
+            if piece.count("```") % 2:
+                in_fence = not in_fence
+        return blocks
+
+    @staticmethod
+    def _format_interaction(user_message: str, assistant_response: str) -> str:
+        return f"\n사용자: {user_message}\nAI: {assistant_response}"
 
     def get_summary(self) -> Dict:
         """
@@ -179,4 +270,5 @@ class ContextManager:
     def clear_history(self):
         """현재 세션의 대화 이력 초기화"""
         self.history = []
+        self._token_counts = {}
         self.metadata["last_updated"] = datetime.now().isoformat()
@@ -0,0 +1,180 @@
+"""Drive 폴더 ID 해석 캐시"""
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Optional, Dict, List, Tuple
+
+
+class FolderCache:
+    """(부모 폴더 ID, 폴더 이름) → 폴더 ID 캐시 (메모리 LRU + 디스크 영속화)"""
+
+    def __init__(
+        self,
+        cache_file: Optional[Path] = None,
+        ttl: float = 86400,
+        max_entries: int = 1024
+    ):
+        """
+        폴더 캐시 초기화
+
+        Args:
+            cache_file: 캐시 저장 파일 경로 (None이면 메모리에만 유지)
+            ttl: 항목 유효 시간 (초)
+            max_entries: 최대 항목 수 (초과 시 가장 오래 사용하지 않은 항목 제거)
+        """
+        self.cache_file = Path(cache_file) if cache_file else None
+        self.ttl = ttl
+        self.max_entries = max_entries
+
+        self._entries: "OrderedDict[Tuple[str, str], Tuple[str, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+        self._load()
+
+    @staticmethod
+    def _key(parent_id: Optional[str], folder_name: str) -> Tuple[str, str]:
+        """캐시 키 생성 (루트는 빈 문자열)"""
+        return (parent_id or "", folder_name)
+
+    def get(self, parent_id: Optional[str], folder_name: str) -> Optional[str]:
+        """
+        캐시된 폴더 ID 조회
+
+        Args:
+            parent_id: 부모 폴더 ID (None이면 루트)
+            folder_name: 폴더 이름
+
+        Returns:
+            str: 폴더 ID (없거나 만료되었으면 None)
+        """
+        key = self._key(parent_id, folder_name)
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+
+            folder_id, stored_at = entry
+            if time.time() - stored_at > self.ttl:
+                del self._entries[key]
+                return None
+
+            self._entries.move_to_end(key)
+            return folder_id
+
+    def set(self, parent_id: Optional[str], folder_name: str, folder_id: str):
+        """
+        폴더 ID 저장
+
+        Args:
+            parent_id: 부모 폴더 ID (None이면 루트)
+            folder_name: 폴더 이름
+            folder_id: 폴더 ID
+        """
+        key = self._key(parent_id, folder_name)
+
+        with self._lock:
+            self._entries[key] = (folder_id, time.time())
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+        self.save()
+
+    def invalidate_id(self, folder_id: str) -> List[Dict[str, str]]:
+        """
+        폴더 ID 무효화 (404 응답 등으로 더 이상 존재하지 않는 폴더)
+
+        해당 폴더를 가리키는 항목과, 그 폴더를 부모로 하는 하위 항목을 모두 제거합니다.
+
+        Args:
+            folder_id: 무효화할 폴더 ID
+
+        Returns:
+            List[Dict]: 제거된 항목 목록
+            [
+                {"parent_id": "부모 ID", "name": "폴더 이름", "id": "폴더 ID"}
+            ]
+        """
+        removed = []
+        stale_ids = {folder_id}
+
+        with self._lock:
+            # 하위 경로까지 연쇄적으로 제거
+            changed = True
+            while changed:
+                changed = False
+                for key, (cached_id, _) in list(self._entries.items()):
+                    if cached_id in stale_ids or key[0] in stale_ids:
+                        del self._entries[key]
+                        removed.append({
+                            "parent_id": key[0] or None,
+                            "name": key[1],
+                            "id": cached_id
+                        })
+                        if cached_id not in stale_ids:
+                            stale_ids.add(cached_id)
+                            changed = True
+
+        if removed:
+            self.save()
+
+        return removed
+
+    def clear(self):
+        """캐시 전체 초기화"""
+        with self._lock:
+            self._entries.clear()
+        self.save()
+
+    def save(self):
+        """캐시를 디스크에 저장 (임시 파일 작성 후 교체)"""
+        if not self.cache_file:
+            return
+
+        with self._lock:
+            data = [
+                {"parent_id": key[0], "name": key[1], "id": folder_id, "stored_at": stored_at}
+                for key, (folder_id, stored_at) in self._entries.items()
+            ]
+
+        try:
+            self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+            temp_file = self.cache_file.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+            with open(temp_file, 'w', encoding='utf-8') as f:
+                json.dump(data, f, ensure_ascii=False)
+            os.replace(temp_file, self.cache_file)
+        except OSError:
+            # 캐시 저장 실패는 치명적이지 않으므로 무시
+            pass
+
+    def _load(self):
+        """디스크에서 캐시 로드 (만료된 항목은 제외)"""
+        if not self.cache_file or not self.cache_file.exists():
+            return
+
+        try:
+            with open(self.cache_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+
+        now = time.time()
+        for item in data:
+            try:
+                if now - item["stored_at"] > self.ttl:
+                    continue
+                key = (item["parent_id"], item["name"])
+                self._entries[key] = (item["id"], item["stored_at"])
+            except (KeyError, TypeError):
+                continue
+
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._entries)
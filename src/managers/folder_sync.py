@@ -0,0 +1,406 @@
+"""로컬 폴더 ↔ Drive 폴더 동기화"""
+import asyncio
+import hashlib
+import json
+import mimetypes
+import os
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Optional, Dict, Any, Tuple
+
+
+# 동기화 방향
+SYNC_DIRECTIONS = ('pull', 'push', 'both')
+
+# 원격 목록 조회 필드
+SYNC_FIELDS = 'id, name, mimeType, md5Checksum, modifiedTime'
+
+FOLDER_MIME_TYPE = 'application/vnd.google-apps.folder'
+
+
+class SyncManifest:
+    """
+    마지막 동기화 시점의 파일 상태 기록
+
+    경로별로 Drive 파일 ID, 내용 MD5, 로컬 파일 크기/수정 시각을 보관하므로
+    다음 동기화에서는 바뀐 파일만 해시를 다시 계산하고 전송합니다.
+    """
+
+    def __init__(self, manifest_file: Optional[Path] = None):
+        """
+        매니페스트 초기화
+
+        Args:
+            manifest_file: 저장 파일 경로 (None이면 메모리에만 유지)
+        """
+        self.manifest_file = Path(manifest_file) if manifest_file else None
+        self.entries: Dict[str, Dict] = {}
+        self._lock = threading.Lock()
+        self._load()
+
+    def get(self, path: str) -> Optional[Dict]:
+        """경로의 마지막 동기화 상태 (없으면 None)"""
+        with self._lock:
+            entry = self.entries.get(path)
+            return dict(entry) if entry else None
+
+    def set(self, path: str, file_id: str, md5: str, local_stat: os.stat_result):
+        """
+        동기화 완료 상태 기록
+
+        Args:
+            path: 동기화 루트 기준 상대 경로 (/ 구분)
+            file_id: Drive 파일 ID
+            md5: 내용 MD5 (로컬과 Drive가 같은 값)
+            local_stat: 로컬 파일의 os.stat 결과
+        """
+        with self._lock:
+            self.entries[path] = {
+                "file_id": file_id,
+                "md5": md5,
+                "size": local_stat.st_size,
+                "mtime_ns": local_stat.st_mtime_ns,
+                "synced_at": time.time()
+            }
+
+    def save(self):
+        """매니페스트를 디스크에 저장 (임시 파일 작성 후 교체)"""
+        if not self.manifest_file:
+            return
+
+        with self._lock:
+            data = dict(self.entries)
+
+        try:
+            self.manifest_file.parent.mkdir(parents=True, exist_ok=True)
+            temp_file = self.manifest_file.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+            with open(temp_file, 'w', encoding='utf-8') as f:
+                json.dump(data, f, ensure_ascii=False)
+            os.replace(temp_file, self.manifest_file)
+        except OSError:
+            # 저장 실패 시 다음 동기화에서 해시를 다시 계산할 뿐이므로 무시
+            pass
+
+    def _load(self):
+        """디스크에서 매니페스트 로드"""
+        if not self.manifest_file or not self.manifest_file.exists():
+            return
+
+        try:
+            with open(self.manifest_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+
+        if isinstance(data, dict):
+            self.entries = data
+
+
+class FolderSync:
+    """로컬 디렉토리와 Drive 폴더를 해시 기반으로 비교해 바뀐 파일만 전송"""
+
+    def __init__(
+        self,
+        drive_client: Any,
+        manifest_dir: Optional[Path] = None,
+        max_concurrency: int = 4
+    ):
+        """
+        폴더 동기화 초기화
+
+        Args:
+            drive_client: Drive API 클라이언트
+            manifest_dir: 매니페스트 저장 디렉토리 (None이면 메모리에만 유지)
+            max_concurrency: 동시에 전송할 파일 수
+        """
+        self.drive_client = drive_client
+        self.manifest_dir = Path(manifest_dir) if manifest_dir else None
+        self.max_concurrency = max(1, max_concurrency)
+
+    async def sync(
+        self,
+        local_dir: Path,
+        folder_id: str,
+        direction: str = 'both'
+    ) -> Dict[str, Any]:
+        """
+        로컬 디렉토리와 Drive 폴더 동기화
+
+        - pull: Drive에서 바뀐 파일만 내려받음
+        - push: 로컬에서 바뀐 파일만 올림 (같은 경로의 Drive 파일은 내용만 갱신)
+        - both: 마지막 동기화 이후 한쪽만 바뀌었으면 그쪽 기준으로, 양쪽 모두 바뀌었으면
+          modifiedTime이 더 최근인 쪽 기준으로 맞춤
+
+        삭제는 전파하지 않습니다.
+
+        Args:
+            local_dir: 로컬 디렉토리
+            folder_id: Drive 폴더 ID
+            direction: 동기화 방향 (pull, push, both)
+
+        Returns:
+            {
+                "downloaded": [상대 경로, ...],
+                "uploaded": [상대 경로, ...],
+                "unchanged": 변경 없는 파일 수,
+                "skipped": [{"path": 상대 경로, "reason": 사유}, ...],
+                "errors": [{"path": 상대 경로, "error": 오류 메시지}, ...]
+            }
+
+        Raises:
+            ValueError: 잘못된 방향인 경우
+        """
+        if direction not in SYNC_DIRECTIONS:
+            raise ValueError(f"지원하지 않는 동기화 방향입니다: {direction} ({', '.join(SYNC_DIRECTIONS)})")
+
+        local_dir = Path(local_dir)
+        local_dir.mkdir(parents=True, exist_ok=True)
+        manifest = SyncManifest(self._manifest_file(local_dir, folder_id))
+
+        remote, remote_folders = await self._list_remote(folder_id)
+        local = self._list_local(local_dir)
+
+        if direction != 'pull':
+            # 병렬 업로드가 같은 폴더를 중복 생성하지 않도록 필요한 하위 폴더를 먼저 순서대로 생성
+            for parent_path in sorted({path.rpartition('/')[0] for path in local} - set(remote_folders) - {''}):
+                remote_folders[parent_path] = await self.drive_client.create_folder(parent_path, folder_id)
+
+        result = {"downloaded": [], "uploaded": [], "unchanged": 0, "skipped": [], "errors": []}
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def run(path: str):
+            async with semaphore:
+                try:
+                    action = await self._sync_path(
+                        path, local_dir, folder_id, remote.get(path), remote_folders,
+                        path in local, manifest, direction
+                    )
+                except Exception as e:
+                    result["errors"].append({"path": path, "error": str(e)})
+                    return
+
+            if action == 'download':
+                result["downloaded"].append(path)
+            elif action == 'upload':
+                result["uploaded"].append(path)
+            elif action == 'unchanged':
+                result["unchanged"] += 1
+            elif action:
+                result["skipped"].append({"path": path, "reason": action})
+
+        await asyncio.gather(*(run(path) for path in sorted(set(remote) | local)))
+        manifest.save()
+
+        result["downloaded"].sort()
+        result["uploaded"].sort()
+        return result
+
+    async def _sync_path(
+        self,
+        path: str,
+        local_dir: Path,
+        folder_id: str,
+        remote_file: Optional[Dict],
+        remote_folders: Dict[str, str],
+        exists_locally: bool,
+        manifest: SyncManifest,
+        direction: str
+    ) -> Optional[str]:
+        """
+        경로 하나 동기화
+
+        Returns:
+            str: 'download', 'upload', 'unchanged', 건너뛴 사유 또는 None(해당 방향에서 할 일 없음)
+        """
+        local_path = local_dir / path
+        entry = manifest.get(path)
+
+        if remote_file is not None and not remote_file.get('md5Checksum'):
+            return "Google 문서 형식은 동기화할 수 없습니다"
+
+        local_md5 = None
+        if exists_locally:
+            local_stat = local_path.stat()
+            if entry and entry["size"] == local_stat.st_size and entry["mtime_ns"] == local_stat.st_mtime_ns:
+                # 마지막 동기화 이후 로컬 파일이 그대로면 해시 재계산 생략
+                local_md5 = entry["md5"]
+            else:
+                local_md5 = await asyncio.to_thread(self._file_md5, local_path)
+
+        remote_md5 = remote_file.get('md5Checksum') if remote_file else None
+
+        if local_md5 is not None and local_md5 == remote_md5:
+            manifest.set(path, remote_file['id'], local_md5, local_path.stat())
+            return 'unchanged'
+
+        if direction == 'pull':
+            return 'download' if await self._pull(path, local_path, remote_file, manifest) else None
+        if direction == 'push':
+            return 'upload' if await self._push(path, local_path, folder_id, remote_file, remote_folders, manifest) else None
+
+        # 양방향: 마지막 동기화 기록과 비교해 어느 쪽이 바뀌었는지 판단
+        base_md5 = entry["md5"] if entry else None
+        local_changed = local_md5 is not None and local_md5 != base_md5
+        remote_changed = remote_md5 is not None and remote_md5 != base_md5
+
+        if local_changed and remote_changed:
+            # 양쪽 모두 바뀐 경우 더 최근에 수정된 쪽 기준
+            local_mtime = local_path.stat().st_mtime
+            remote_mtime = self._parse_time(remote_file.get('modifiedTime'))
+            if remote_mtime is not None and remote_mtime > local_mtime:
+                local_changed = False
+            else:
+                remote_changed = False
+
+        if remote_changed or local_md5 is None:
+            await self._pull(path, local_path, remote_file, manifest)
+            return 'download'
+
+        await self._push(path, local_path, folder_id, remote_file, remote_folders, manifest)
+        return 'upload'
+
+    async def _pull(
+        self,
+        path: str,
+        local_path: Path,
+        remote_file: Optional[Dict],
+        manifest: SyncManifest
+    ) -> bool:
+        """Drive 파일 내려받기 (임시 파일에 쓴 뒤 교체). 원격 파일이 없으면 False"""
+        if remote_file is None:
+            return False
+
+        local_path.parent.mkdir(parents=True, exist_ok=True)
+        temp_file = local_path.with_name(f".{local_path.name}.{os.getpid()}.download")
+        digest = hashlib.md5()
+
+        try:
+            # 디스크 쓰기는 이벤트 루프를 막지 않도록 스레드에서 실행
+            f = await asyncio.to_thread(open, temp_file, 'wb')
+            try:
+                async for chunk in self.drive_client.stream_file(remote_file['id']):
+                    await asyncio.to_thread(self._write_chunk, f, digest, chunk)
+            finally:
+                await asyncio.to_thread(f.close)
+            await asyncio.to_thread(os.replace, temp_file, local_path)
+        finally:
+            if temp_file.exists():
+                temp_file.unlink()
+
+        manifest.set(path, remote_file['id'], digest.hexdigest(), local_path.stat())
+        return True
+
+    async def _push(
+        self,
+        path: str,
+        local_path: Path,
+        folder_id: str,
+        remote_file: Optional[Dict],
+        remote_folders: Dict[str, str],
+        manifest: SyncManifest
+    ) -> bool:
+        """로컬 파일 올리기 (원격 파일이 있으면 내용만 갱신). 로컬 파일이 없으면 False"""
+        if not local_path.exists():
+            return False
+
+        parent_path, _, filename = path.rpartition('/')
+        target_folder_id = remote_folders[parent_path] if parent_path else folder_id
+
+        mime_type = mimetypes.guess_type(filename)[0] or 'application/octet-stream'
+        local_stat = local_path.stat()
+
+        with open(local_path, 'rb') as f:
+            md5 = await asyncio.to_thread(self._stream_md5, f)
+            result = await self.drive_client.upload_file(
+                f,
+                filename,
+                folder_id=None if remote_file else target_folder_id,
+                mime_type=mime_type,
+                file_id=remote_file['id'] if remote_file else None
+            )
+
+        manifest.set(path, result['file_id'], md5, local_stat)
+        return True
+
+    async def _list_remote(self, folder_id: str) -> Tuple[Dict[str, Dict], Dict[str, str]]:
+        """
+        Drive 폴더 아래 전체 파일 목록 (하위 폴더 포함)
+
+        동기화 판단이 오래된 목록에 의존하지 않도록 메타데이터 인덱스를 거치지 않고 항상 Drive에 조회합니다.
+
+        Returns:
+            (상대 경로 → 파일 정보, 상대 경로 → 폴더 ID)
+        """
+        files: Dict[str, Dict] = {}
+        folders: Dict[str, str] = {}
+
+        async def walk(current_id: str, prefix: str):
+            children = []
+            async for item in self.drive_client.iter_files(
+                folder_id=current_id, fields=SYNC_FIELDS, order_by='name', force_remote=True
+            ):
+                path = f"{prefix}{item['name']}"
+                if item.get('mimeType') == FOLDER_MIME_TYPE:
+                    folders[path] = item['id']
+                    children.append(walk(item['id'], f"{path}/"))
+                elif path not in files:
+                    # 같은 이름이 여러 개면 첫 번째 파일만 사용
+                    files[path] = item
+            await asyncio.gather(*children)
+
+        await walk(folder_id, "")
+        return files, folders
+
+    @staticmethod
+    def _list_local(local_dir: Path) -> set:
+        """로컬 디렉토리 아래 전체 파일의 상대 경로 (숨김 파일/폴더 제외)"""
+        paths = set()
+        for root, dirs, filenames in os.walk(local_dir):
+            dirs[:] = [name for name in dirs if not name.startswith('.')]
+            for filename in filenames:
+                if filename.startswith('.'):
+                    continue
+                relative = Path(root, filename).relative_to(local_dir)
+                paths.add(relative.as_posix())
+        return paths
+
+    def _manifest_file(self, local_dir: Path, folder_id: str) -> Optional[Path]:
+        """(로컬 디렉토리, Drive 폴더) 쌍별 매니페스트 파일 경로"""
+        if not self.manifest_dir:
+            return None
+        key = hashlib.sha256(f"{local_dir.resolve()}\0{folder_id}".encode('utf-8')).hexdigest()[:32]
+        return self.manifest_dir / f"{key}.json"
+
+    @staticmethod
+    def _file_md5(path: Path) -> str:
+        """파일 내용 MD5"""
+        with open(path, 'rb') as f:
+            return FolderSync._stream_md5(f)
+
+    @staticmethod
+    def _write_chunk(f, digest, chunk: bytes):
+        """받은 청크를 파일에 쓰고 MD5에 반영 (스레드에서 실행)"""
+        digest.update(chunk)
+        f.write(chunk)
+
+    @staticmethod
+    def _stream_md5(stream) -> str:
+        """스트림 내용 MD5 (현재 위치는 처음으로 되돌림)"""
+        digest = hashlib.md5()
+        stream.seek(0)
+        for block in iter(lambda: stream.read(1024 * 1024), b''):
+            digest.update(block)
+        stream.seek(0)
+        return digest.hexdigest()
+
+    @staticmethod
+    def _parse_time(value: Optional[str]) -> Optional[float]:
+        """Drive RFC 3339 시각 → epoch 초"""
+        if not value:
+            return None
+        try:
+            return datetime.fromisoformat(value.replace('Z', '+00:00')).timestamp()
+        except ValueError:
+            return None
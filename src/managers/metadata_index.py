@@ -0,0 +1,342 @@
+"""Drive 메타데이터 로컬 인덱스 (SQLite)"""
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Optional, Dict, List, Iterable, Tuple
+
+
+# 인덱스가 보관하는 Drive 필드 (changes.list / files.list 요청에 사용)
+INDEX_FIELDS = 'id, name, parents, mimeType, md5Checksum, modifiedTime, createdTime, webViewLink, trashed'
+
+# Drive 필드 이름 → 컬럼 이름
+_COLUMNS = {
+    'id': 'id',
+    'name': 'name',
+    'mimeType': 'mime_type',
+    'md5Checksum': 'md5_checksum',
+    'modifiedTime': 'modified_time',
+    'createdTime': 'created_time',
+    'webViewLink': 'web_view_link',
+}
+
+# 로컬에서 지원하는 정렬 기준 (Drive orderBy → (Drive 필드, 정렬 방향))
+# 값이 같으면 id로 정렬해 순서를 고정하므로 (정렬 값, id)가 페이지 커서가 됨
+_ORDER_BY = {
+    'createdTime desc': ('createdTime', 'DESC'),
+    'createdTime': ('createdTime', 'ASC'),
+    'modifiedTime desc': ('modifiedTime', 'DESC'),
+    'modifiedTime': ('modifiedTime', 'ASC'),
+    'name': ('name', 'ASC'),
+    'name desc': ('name', 'DESC'),
+}
+
+
+class DriveMetadataIndex:
+    """Drive 파일 메타데이터를 로컬 SQLite에 보관하고 이름/폴더/접두어 조회를 제공"""
+
+    def __init__(self, db_path: Optional[Path] = None):
+        """
+        메타데이터 인덱스 초기화
+
+        Args:
+            db_path: SQLite 파일 경로 (None이면 메모리 DB)
+        """
+        self.db_path = Path(db_path) if db_path else None
+        if self.db_path:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            str(self.db_path) if self.db_path else ':memory:',
+            check_same_thread=False
+        )
+        self._conn.row_factory = sqlite3.Row
+        self._create_tables()
+
+    def _create_tables(self):
+        """테이블 생성"""
+        with self._lock, self._conn:
+            self._conn.executescript("""
+                CREATE TABLE IF NOT EXISTS files (
+                    id TEXT PRIMARY KEY,
+                    name TEXT NOT NULL,
+                    mime_type TEXT,
+                    md5_checksum TEXT,
+                    modified_time TEXT,
+                    created_time TEXT,
+                    web_view_link TEXT
+                );
+                CREATE INDEX IF NOT EXISTS idx_files_name ON files(name);
+
+                CREATE TABLE IF NOT EXISTS parents (
+                    file_id TEXT NOT NULL,
+                    parent_id TEXT NOT NULL,
+                    PRIMARY KEY (file_id, parent_id)
+                );
+                CREATE INDEX IF NOT EXISTS idx_parents_parent ON parents(parent_id);
+
+                CREATE TABLE IF NOT EXISTS state (
+                    key TEXT PRIMARY KEY,
+                    value TEXT
+                );
+            """)
+
+    # ------------------------------------------------------------------
+    # 쓰기
+    # ------------------------------------------------------------------
+
+    def apply(self, files: Iterable[Dict]):
+        """
+        Drive 파일 메타데이터 반영 (휴지통으로 이동된 파일은 제거)
+
+        Args:
+            files: Drive API 형식의 파일 정보 목록
+        """
+        with self._lock, self._conn:
+            for file in files:
+                if file.get('trashed'):
+                    self._delete(file['id'])
+                else:
+                    self._upsert(file)
+
+    def upsert(self, file: Dict):
+        """
+        파일 메타데이터 저장
+
+        Args:
+            file: Drive API 형식의 파일 정보 (id 필수)
+        """
+        self.apply([file])
+
+    def remove(self, file_id: str):
+        """
+        파일 메타데이터 삭제
+
+        Args:
+            file_id: 삭제할 파일 ID
+        """
+        with self._lock, self._conn:
+            self._delete(file_id)
+
+    def clear(self):
+        """인덱스 전체 초기화 (동기화 상태 포함)"""
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM files")
+            self._conn.execute("DELETE FROM parents")
+            self._conn.execute("DELETE FROM state")
+
+    def _upsert(self, file: Dict):
+        """파일 메타데이터 저장 (잠금 안에서 호출)"""
+        existing = self._conn.execute(
+            "SELECT * FROM files WHERE id = ?", (file['id'],)
+        ).fetchone()
+
+        # 응답에 없는 필드는 기존 값 유지
+        values = {column: (existing[column] if existing else None) for column in _COLUMNS.values()}
+        for field, column in _COLUMNS.items():
+            if field in file:
+                values[column] = file[field]
+
+        if values['name'] is None:
+            return
+
+        self._conn.execute(
+            """
+            INSERT OR REPLACE INTO files
+                (id, name, mime_type, md5_checksum, modified_time, created_time, web_view_link)
+            VALUES
+                (:id, :name, :mime_type, :md5_checksum, :modified_time, :created_time, :web_view_link)
+            """,
+            values
+        )
+
+        if 'parents' in file:
+            self._conn.execute("DELETE FROM parents WHERE file_id = ?", (file['id'],))
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO parents (file_id, parent_id) VALUES (?, ?)",
+                [(file['id'], parent_id) for parent_id in file.get('parents') or []]
+            )
+
+    def _delete(self, file_id: str):
+        """파일 메타데이터 삭제 (잠금 안에서 호출)"""
+        self._conn.execute("DELETE FROM files WHERE id = ?", (file_id,))
+        self._conn.execute("DELETE FROM parents WHERE file_id = ?", (file_id,))
+
+    # ------------------------------------------------------------------
+    # 조회
+    # ------------------------------------------------------------------
+
+    def get(self, file_id: str) -> Optional[Dict]:
+        """
+        파일 ID로 조회
+
+        Args:
+            file_id: 파일 ID
+
+        Returns:
+            Dict: Drive API 형식의 파일 정보 (없으면 None)
+        """
+        rows = self._query("WHERE f.id = ?", (file_id,), limit=1)
+        return rows[0] if rows else None
+
+    def find_by_name(self, name: str, parent_id: Optional[str] = None) -> Optional[Dict]:
+        """
+        이름으로 파일 조회 (같은 이름이 여러 개면 가장 최근에 생성된 파일)
+
+        Args:
+            name: 파일 이름
+            parent_id: 부모 폴더 ID (None이면 전체)
+
+        Returns:
+            Dict: Drive API 형식의 파일 정보 (없으면 None)
+        """
+        rows = self.list_files(parent_id=parent_id, name=name, limit=1)
+        return rows[0] if rows else None
+
+    def list_files(
+        self,
+        parent_id: Optional[str] = None,
+        name: Optional[str] = None,
+        prefix: Optional[str] = None,
+        order_by: str = 'createdTime desc',
+        limit: Optional[int] = None,
+        offset: int = 0,
+        after: Optional[Tuple[str, str]] = None
+    ) -> List[Dict]:
+        """
+        조건에 맞는 파일 목록 조회
+
+        Args:
+            parent_id: 부모 폴더 ID (None이면 전체)
+            name: 정확히 일치하는 이름 (선택)
+            prefix: 이름 접두어 (선택)
+            order_by: 정렬 기준 (supports_order_by로 지원 여부 확인)
+            limit: 최대 결과 수 (None이면 제한 없음)
+            offset: 건너뛸 결과 수
+            after: 이 정렬 키(sort_key) 다음 파일부터 조회 (페이지 사이에 파일이 추가/삭제되어도 위치 유지)
+
+        Returns:
+            List[Dict]: Drive API 형식의 파일 정보 목록
+        """
+        conditions = []
+        params: List = []
+
+        if after is not None:
+            key, direction = self._order_key(order_by)
+            conditions.append(f"({key}, f.id) {'<' if direction == 'DESC' else '>'} (?, ?)")
+            params.extend(after)
+
+        if parent_id:
+            conditions.append("f.id IN (SELECT file_id FROM parents WHERE parent_id = ?)")
+            params.append(parent_id)
+        if name is not None:
+            conditions.append("f.name = ?")
+            params.append(name)
+        if prefix:
+            conditions.append("f.name >= ? AND f.name < ?")
+            params.extend([prefix, prefix + '\U0010ffff'])
+
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+        return self._query(where, tuple(params), order_by=order_by, limit=limit, offset=offset)
+
+    @staticmethod
+    def supports_order_by(order_by: str) -> bool:
+        """로컬 조회에서 지원하는 정렬 기준인지 확인"""
+        return order_by in _ORDER_BY
+
+    @staticmethod
+    def sort_key(file: Dict, order_by: str = 'createdTime desc') -> Tuple[str, str]:
+        """
+        list_files 결과의 정렬 키 (다음 페이지 조회 시 after로 전달)
+
+        Args:
+            file: list_files가 반환한 파일 정보
+            order_by: 조회에 사용한 정렬 기준
+
+        Returns:
+            (정렬 값, 파일 ID)
+        """
+        field, _ = _ORDER_BY.get(order_by, _ORDER_BY['createdTime desc'])
+        return (file.get(field) or '', file['id'])
+
+    @staticmethod
+    def _order_key(order_by: str) -> Tuple[str, str]:
+        """정렬 기준 → (SQL 정렬 식, 방향). 값이 없는 파일은 빈 문자열로 정렬"""
+        field, direction = _ORDER_BY.get(order_by, _ORDER_BY['createdTime desc'])
+        return f"COALESCE(f.{_COLUMNS[field]}, '')", direction
+
+    def _query(
+        self,
+        where: str,
+        params: tuple,
+        order_by: str = 'createdTime desc',
+        limit: Optional[int] = None,
+        offset: int = 0
+    ) -> List[Dict]:
+        """files 테이블 조회 후 Drive API 형식으로 변환"""
+        key, direction = self._order_key(order_by)
+        sql = f"SELECT f.* FROM files f {where} ORDER BY {key} {direction}, f.id {direction}"
+        if limit is not None:
+            sql += f" LIMIT {int(limit)} OFFSET {int(offset)}"
+        elif offset:
+            sql += f" LIMIT -1 OFFSET {int(offset)}"
+
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+            parents: Dict[str, List[str]] = {}
+            if rows:
+                placeholders = ",".join("?" for _ in rows)
+                for file_id, parent_id in self._conn.execute(
+                    f"SELECT file_id, parent_id FROM parents WHERE file_id IN ({placeholders})",
+                    tuple(row['id'] for row in rows)
+                ):
+                    parents.setdefault(file_id, []).append(parent_id)
+
+        files = []
+        for row in rows:
+            file = {field: row[column] for field, column in _COLUMNS.items() if row[column] is not None}
+            file['parents'] = parents.get(row['id'], [])
+            files.append(file)
+        return files
+
+    # ------------------------------------------------------------------
+    # 동기화 상태
+    # ------------------------------------------------------------------
+
+    def get_page_token(self) -> Optional[str]:
+        """changes.list 시작 페이지 토큰 (부트스트랩 전이면 None)"""
+        return self._get_state('page_token')
+
+    def set_page_token(self, page_token: str):
+        """changes.list 시작 페이지 토큰 저장 및 동기화 시각 갱신"""
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO state (key, value) VALUES (?, ?)",
+                [('page_token', page_token), ('last_sync', str(time.time()))]
+            )
+
+    def is_bootstrapped(self) -> bool:
+        """초기 전체 목록 적재가 끝났는지 확인"""
+        return self.get_page_token() is not None
+
+    def seconds_since_sync(self) -> float:
+        """마지막 동기화 이후 경과 시간 (초, 동기화한 적 없으면 무한대)"""
+        last_sync = self._get_state('last_sync')
+        if last_sync is None:
+            return float('inf')
+        return time.time() - float(last_sync)
+
+    def _get_state(self, key: str) -> Optional[str]:
+        with self._lock:
+            row = self._conn.execute("SELECT value FROM state WHERE key = ?", (key,)).fetchone()
+        return row['value'] if row else None
+
+    def close(self):
+        """DB 연결 종료"""
+        with self._lock:
+            self._conn.close()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM files").fetchone()[0]
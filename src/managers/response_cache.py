@@ -0,0 +1,250 @@
+"""Gemini 응답 캐시 (메모리 LRU + 디스크)"""
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Optional, Dict, Any, Tuple, Union
+
+
+class ResponseCache:
+    """
+    요청 키(모델, 프롬프트, 이미지, 생성 설정의 해시) → 응답 캐시
+
+    같은 요청이면 API를 호출하지 않고 저장된 응답을 반환하며,
+    항목은 ttl초가 지나면 만료됩니다.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Optional[Path] = None,
+        ttl: float = 24 * 60 * 60,
+        max_memory_entries: int = 256,
+        max_disk_bytes: int = 64 * 1024 * 1024
+    ):
+        """
+        응답 캐시 초기화
+
+        Args:
+            cache_dir: 디스크 캐시 디렉토리 (None이면 메모리에만 보관)
+            ttl: 항목 유효 시간 (초)
+            max_memory_entries: 메모리 계층 최대 항목 수
+            max_disk_bytes: 디스크 계층 최대 크기 (바이트)
+        """
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self.ttl = ttl
+        self.max_memory_entries = max(1, max_memory_entries)
+        self.max_disk_bytes = max_disk_bytes
+
+        # 키 → (저장 시각, 응답)
+        self._memory: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._disk_bytes = 0
+        self._lock = threading.Lock()
+
+        self._stats = {
+            "memory_hits": 0,
+            "disk_hits": 0,
+            "misses": 0,
+            "expirations": 0,
+            "memory_evictions": 0,
+            "disk_evictions": 0
+        }
+
+        if self.cache_dir:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            self._disk_bytes = sum(path.stat().st_size for path in self.cache_dir.glob("*.json"))
+
+    @staticmethod
+    def make_key(*parts: Union[str, bytes, None]) -> str:
+        """
+        요청 구성 요소로 캐시 키 생성
+
+        각 부분의 길이를 함께 해시하므로 경계가 달라 같은 바이트열이 되는 경우와 구분됩니다.
+
+        Args:
+            parts: 모델 이름, 프롬프트, 이미지 바이트, 생성 설정 등
+
+        Returns:
+            str: SHA-256 16진 문자열
+        """
+        digest = hashlib.sha256()
+        for part in parts:
+            if part is None:
+                part = b""
+            elif isinstance(part, str):
+                part = part.encode('utf-8')
+            digest.update(f"{len(part)}:".encode('ascii'))
+            digest.update(part)
+        return digest.hexdigest()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        캐시된 응답 조회
+
+        Args:
+            key: make_key로 만든 캐시 키
+
+        Returns:
+            Dict: 응답 (없거나 만료되었으면 None)
+        """
+        now = time.time()
+
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                if now - entry[0] < self.ttl:
+                    self._memory.move_to_end(key)
+                    self._stats["memory_hits"] += 1
+                    return dict(entry[1])
+                del self._memory[key]
+
+        entry = self._read_disk(key)
+        if entry is not None:
+            if now - entry[0] < self.ttl:
+                with self._lock:
+                    self._stats["disk_hits"] += 1
+                    self._put_memory(key, entry)
+                return dict(entry[1])
+            self._remove_disk(key)
+
+        with self._lock:
+            if entry is not None:
+                self._stats["expirations"] += 1
+            self._stats["misses"] += 1
+        return None
+
+    def put(self, key: str, response: Dict[str, Any]):
+        """
+        응답 저장
+
+        Args:
+            key: make_key로 만든 캐시 키
+            response: JSON으로 직렬화 가능한 응답
+        """
+        entry = (time.time(), dict(response))
+
+        with self._lock:
+            self._put_memory(key, entry)
+
+        path = self._disk_path(key)
+        if path is None:
+            return
+
+        data = json.dumps({"created_at": entry[0], "response": entry[1]}, ensure_ascii=False).encode('utf-8')
+        if len(data) > self.max_disk_bytes:
+            return
+
+        previous_size = path.stat().st_size if path.exists() else 0
+        try:
+            temp_file = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+            temp_file.write_bytes(data)
+            os.replace(temp_file, path)
+        except OSError:
+            return
+
+        with self._lock:
+            self._disk_bytes += len(data) - previous_size
+        self._evict_disk()
+
+    def clear(self):
+        """캐시 전체 초기화"""
+        with self._lock:
+            self._memory.clear()
+
+        if self.cache_dir:
+            for path in self.cache_dir.glob("*.json"):
+                try:
+                    path.unlink()
+                except OSError:
+                    continue
+            with self._lock:
+                self._disk_bytes = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        캐시 통계 반환
+
+        Returns:
+            Dict: 적중/미스/만료/제거 횟수, 적중률과 계층별 사용량
+        """
+        with self._lock:
+            stats = dict(self._stats)
+            stats["memory_entries"] = len(self._memory)
+            stats["max_memory_entries"] = self.max_memory_entries
+            stats["disk_bytes"] = self._disk_bytes
+            stats["max_disk_bytes"] = self.max_disk_bytes
+
+        lookups = stats["memory_hits"] + stats["disk_hits"] + stats["misses"]
+        stats["hit_ratio"] = (stats["memory_hits"] + stats["disk_hits"]) / lookups if lookups else 0.0
+        return stats
+
+    def _put_memory(self, key: str, entry: Tuple[float, Dict[str, Any]]):
+        """메모리 계층에 저장 후 개수 초과분 제거 (잠금 안에서 호출)"""
+        self._memory[key] = entry
+        self._memory.move_to_end(key)
+
+        while len(self._memory) > self.max_memory_entries:
+            self._memory.popitem(last=False)
+            self._stats["memory_evictions"] += 1
+
+    def _read_disk(self, key: str) -> Optional[Tuple[float, Dict[str, Any]]]:
+        """디스크 계층에서 (저장 시각, 응답) 읽기"""
+        path = self._disk_path(key)
+        if path is None or not path.exists():
+            return None
+
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            os.utime(path)
+        except (OSError, ValueError):
+            return None
+
+        if not isinstance(data, dict) or "response" not in data:
+            return None
+        return float(data.get("created_at", 0)), data["response"]
+
+    def _remove_disk(self, key: str):
+        """디스크 계층 항목 삭제"""
+        path = self._disk_path(key)
+        try:
+            size = path.stat().st_size
+            path.unlink()
+        except OSError:
+            return
+        with self._lock:
+            self._disk_bytes -= size
+
+    def _evict_disk(self):
+        """디스크 계층 용량 초과 시 가장 오래 사용하지 않은 파일부터 제거"""
+        with self._lock:
+            if self._disk_bytes <= self.max_disk_bytes:
+                return
+
+        entries = []
+        for path in self.cache_dir.glob("*.json"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+
+        for _, size, path in sorted(entries):
+            with self._lock:
+                if self._disk_bytes <= self.max_disk_bytes:
+                    return
+            try:
+                path.unlink()
+            except OSError:
+                continue
+            with self._lock:
+                self._disk_bytes -= size
+                self._stats["disk_evictions"] += 1
+
+    def _disk_path(self, key: str) -> Optional[Path]:
+        """디스크 캐시 파일 경로"""
+        if not self.cache_dir:
+            return None
+        return self.cache_dir / f"{key}.json"
@@ -0,0 +1,331 @@
+"""의미 기반 프롬프트 캐시 (임베딩 벡터 유사도)"""
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+from pathlib import Path
+from typing import Optional, Dict, List, Any, Tuple
+
+
+# 최고 유사도 분포를 기록할 구간 경계 (이 값 미만 / 이상)
+SIMILARITY_BUCKETS = [0.5, 0.6, 0.7, 0.8, 0.85, 0.9, 0.95, 0.98]
+
+
+class HashingEmbedder:
+    """
+    문자 n-gram 해싱 임베딩 (외부 호출 없는 결정적 임베더)
+
+    같은 입력이면 항상 같은 벡터를 만들므로 테스트와 오프라인 환경에서 사용합니다.
+    철자가 비슷한 문장끼리만 가깝고, 번역문처럼 표기가 다른 문장은 구분하지 못합니다.
+    """
+
+    def __init__(self, dimensions: int = 512, ngram: int = 3):
+        """
+        Args:
+            dimensions: 벡터 차원 수
+            ngram: 문자 n-gram 길이
+        """
+        self.dimensions = dimensions
+        self.ngram = ngram
+        self.name = f"hashing-{dimensions}-{ngram}"
+
+    def embed(self, text: str) -> List[float]:
+        """
+        텍스트 임베딩
+
+        Args:
+            text: 입력 텍스트
+
+        Returns:
+            List[float]: dimensions 차원 벡터
+        """
+        normalized = " " + re.sub(r'\s+', ' ', text.lower()).strip() + " "
+        vector = [0.0] * self.dimensions
+
+        for i in range(max(1, len(normalized) - self.ngram + 1)):
+            gram = normalized[i:i + self.ngram]
+            digest = hashlib.blake2b(gram.encode('utf-8'), digest_size=8).digest()
+            value = int.from_bytes(digest, 'little')
+            # 하위 비트는 위치, 최상위 비트는 부호 (해시 충돌 편향 완화)
+            vector[value % self.dimensions] += -1.0 if value >> 63 else 1.0
+
+        return vector
+
+
+class GeminiEmbedder:
+    """Gemini 임베딩 API (언어가 달라도 의미가 같으면 가까운 벡터)"""
+
+    def __init__(self, model: str = "models/text-embedding-004"):
+        """
+        Args:
+            model: 임베딩 모델 이름 (genai.configure로 API 키가 설정되어 있어야 함)
+        """
+        self.model = model
+        self.name = f"gemini-{model}"
+
+    def embed(self, text: str) -> List[float]:
+        """
+        텍스트 임베딩 (블로킹 API 호출)
+
+        Args:
+            text: 입력 텍스트
+
+        Returns:
+            List[float]: 임베딩 벡터
+        """
+        import google.generativeai as genai
+
+        result = genai.embed_content(model=self.model, content=text, task_type="semantic_similarity")
+        return list(result["embedding"])
+
+
+class SemanticCache:
+    """
+    프롬프트 임베딩 → 응답 캐시
+
+    새 프롬프트의 임베딩과 저장된 임베딩들의 코사인 유사도를 NumPy 행렬 곱 한 번으로 계산해,
+    같은 범위(scope: 모델, 언어, 컨텍스트 등 프롬프트 외 조건)의 항목 중 가장 가까운 항목이
+    threshold 이상이면 그 응답을 반환합니다.
+
+    numpy가 필요합니다 (설치되어 있지 않으면 생성 시 ImportError).
+    """
+
+    def __init__(
+        self,
+        embedder: Any,
+        threshold: float = 0.92,
+        max_entries: int = 1000,
+        ttl: Optional[float] = None,
+        cache_file: Optional[Path] = None
+    ):
+        """
+        의미 기반 캐시 초기화
+
+        Args:
+            embedder: embed(text) -> List[float]와 name 속성을 가진 임베더
+            threshold: 캐시 적중으로 볼 최소 코사인 유사도
+            max_entries: 최대 항목 수 (넘으면 가장 오래 사용하지 않은 항목 제거)
+            ttl: 항목 유효 시간 (초, None이면 만료 없음)
+            cache_file: 저장 파일 경로 (.npz, None이면 메모리에만 보관)
+
+        Raises:
+            ImportError: numpy가 설치되어 있지 않은 경우
+        """
+        try:
+            import numpy
+        except ImportError:
+            raise ImportError("의미 기반 캐시를 사용하려면 numpy가 필요합니다: pip install numpy")
+        self._np = numpy
+
+        self.embedder = embedder
+        self.threshold = threshold
+        self.max_entries = max(1, max_entries)
+        self.ttl = ttl
+        self.cache_file = Path(cache_file) if cache_file else None
+
+        # 정규화된 벡터 행렬 (행 = 항목)과 항목 정보
+        self._vectors = None
+        self._entries: List[Dict[str, Any]] = []
+        self._lock = threading.Lock()
+
+        self._stats = {
+            "lookups": 0,
+            "hits": 0,
+            "misses": 0,
+            "evictions": 0,
+            "similarity_sum": 0.0
+        }
+        self._histogram = [0] * (len(SIMILARITY_BUCKETS) + 1)
+
+        self._load()
+
+    @staticmethod
+    def make_scope(*parts: Optional[str]) -> str:
+        """
+        프롬프트 외 조건(모델, 언어, 컨텍스트 등)으로 범위 키 생성
+
+        Returns:
+            str: 범위 키 (조건이 모두 같은 항목끼리만 비교)
+        """
+        digest = hashlib.sha256()
+        for part in parts:
+            data = (part or "").encode('utf-8')
+            digest.update(f"{len(data)}:".encode('ascii'))
+            digest.update(data)
+        return digest.hexdigest()
+
+    def lookup(self, prompt: str, scope: str) -> Optional[Tuple[Dict[str, Any], float]]:
+        """
+        의미가 가까운 프롬프트의 응답 조회 (임베딩 계산 포함, 블로킹)
+
+        Args:
+            prompt: 사용자 요청
+            scope: make_scope로 만든 범위 키
+
+        Returns:
+            (응답, 유사도) 또는 None
+        """
+        query = self._normalize(self.embedder.embed(prompt))
+        now = time.time()
+
+        with self._lock:
+            self._stats["lookups"] += 1
+
+            best_index, best_similarity = -1, 0.0
+            if self._vectors is not None and len(self._entries):
+                similarities = self._vectors @ query
+                for index, entry in enumerate(self._entries):
+                    if entry["scope"] != scope or self._expired(entry, now):
+                        similarities[index] = -1.0
+                best_index = int(similarities.argmax())
+                best_similarity = float(similarities[best_index])
+
+            if best_index >= 0 and best_similarity > -1.0:
+                self._record_similarity(best_similarity)
+
+            if best_index < 0 or best_similarity < self.threshold:
+                self._stats["misses"] += 1
+                return None
+
+            entry = self._entries[best_index]
+            entry["last_used"] = now
+            self._stats["hits"] += 1
+            return dict(entry["response"]), best_similarity
+
+    def add(self, prompt: str, scope: str, response: Dict[str, Any]):
+        """
+        프롬프트와 응답 저장 (임베딩 계산 포함, 블로킹)
+
+        Args:
+            prompt: 사용자 요청
+            scope: make_scope로 만든 범위 키
+            response: JSON으로 직렬화 가능한 응답
+        """
+        vector = self._normalize(self.embedder.embed(prompt))
+        now = time.time()
+        entry = {
+            "prompt": prompt,
+            "scope": scope,
+            "response": dict(response),
+            "created_at": now,
+            "last_used": now
+        }
+
+        with self._lock:
+            if self._vectors is not None and self._vectors.shape[1] != vector.shape[0]:
+                # 임베딩 차원이 바뀐 경우 (모델 변경) 기존 항목 폐기
+                self._vectors, self._entries = None, []
+
+            self._entries.append(entry)
+            row = vector[None, :]
+            self._vectors = row if self._vectors is None else self._np.vstack([self._vectors, row])
+            self._evict()
+
+        self.save()
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        캐시 통계 반환
+
+        Returns:
+            Dict: 조회/적중/미스 횟수, 적중률, 평균 최고 유사도, 최고 유사도 분포
+        """
+        with self._lock:
+            stats = dict(self._stats)
+            histogram = list(self._histogram)
+            stats["entries"] = len(self._entries)
+
+        similarity_sum = stats.pop("similarity_sum")
+        compared = sum(histogram)
+        stats["embedder"] = self.embedder.name
+        stats["threshold"] = self.threshold
+        stats["hit_ratio"] = stats["hits"] / stats["lookups"] if stats["lookups"] else 0.0
+        stats["mean_best_similarity"] = similarity_sum / compared if compared else None
+
+        labels = [f"<{SIMILARITY_BUCKETS[0]}"] + [
+            f"{low}-{high}" for low, high in zip(SIMILARITY_BUCKETS, SIMILARITY_BUCKETS[1:])
+        ] + [f">={SIMILARITY_BUCKETS[-1]}"]
+        stats["best_similarity_histogram"] = dict(zip(labels, histogram))
+        return stats
+
+    def clear(self):
+        """캐시 전체 초기화"""
+        with self._lock:
+            self._vectors, self._entries = None, []
+        self.save()
+
+    def save(self):
+        """디스크에 저장 (임시 파일 작성 후 교체)"""
+        if not self.cache_file:
+            return
+
+        with self._lock:
+            vectors = self._vectors
+            metadata = json.dumps({"embedder": self.embedder.name, "entries": self._entries}, ensure_ascii=False)
+
+        try:
+            self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+            temp_file = self.cache_file.with_name(
+                f"{self.cache_file.stem}.{os.getpid()}.{threading.get_ident()}.tmp.npz"
+            )
+            self._np.savez(
+                temp_file,
+                vectors=vectors if vectors is not None else self._np.zeros((0, 0), dtype=self._np.float32),
+                metadata=self._np.array(metadata)
+            )
+            os.replace(temp_file, self.cache_file)
+        except OSError:
+            # 저장 실패 시에도 메모리 캐시는 계속 사용 가능
+            pass
+
+    def _load(self):
+        """디스크에서 로드 (임베더가 다르면 무시)"""
+        if not self.cache_file or not self.cache_file.exists():
+            return
+
+        try:
+            with self._np.load(self.cache_file, allow_pickle=False) as data:
+                metadata = json.loads(str(data["metadata"]))
+                vectors = data["vectors"]
+        except (OSError, ValueError, KeyError):
+            return
+
+        entries = metadata.get("entries") or []
+        if metadata.get("embedder") != self.embedder.name or not entries or len(entries) != len(vectors):
+            return
+
+        self._vectors = vectors.astype(self._np.float32)
+        self._entries = entries
+
+    def _normalize(self, vector: List[float]):
+        """L2 정규화 (내적 = 코사인 유사도)"""
+        array = self._np.asarray(vector, dtype=self._np.float32)
+        norm = float(self._np.linalg.norm(array))
+        return array / norm if norm > 0 else array
+
+    def _expired(self, entry: Dict[str, Any], now: float) -> bool:
+        return self.ttl is not None and now - entry["created_at"] >= self.ttl
+
+    def _evict(self):
+        """만료 항목과 최대 개수 초과분 제거 (잠금 안에서 호출)"""
+        now = time.time()
+        keep = [index for index, entry in enumerate(self._entries) if not self._expired(entry, now)]
+
+        overflow = len(keep) - self.max_entries
+        if overflow > 0:
+            by_last_used = sorted(keep, key=lambda index: self._entries[index]["last_used"])
+            dropped = set(by_last_used[:overflow])
+            keep = [index for index in keep if index not in dropped]
+            self._stats["evictions"] += overflow
+
+        if len(keep) != len(self._entries):
+            self._entries = [self._entries[index] for index in keep]
+            self._vectors = self._vectors[keep] if keep else None
+
+    def _record_similarity(self, similarity: float):
+        """최고 유사도 분포 기록 (잠금 안에서 호출)"""
+        self._stats["similarity_sum"] += similarity
+        bucket = sum(1 for bound in SIMILARITY_BUCKETS if similarity >= bound)
+        self._histogram[bucket] += 1
@@ -0,0 +1,141 @@
+"""재개 가능한 업로드 세션 저장소"""
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Optional, Dict
+
+
+# Drive 재개 가능 업로드 세션 URI는 약 1주일간 유효
+SESSION_TTL = 7 * 24 * 60 * 60
+
+
+class UploadSessionStore:
+    """업로드 세션 URI와 전송 완료 오프셋을 디스크에 보관"""
+
+    def __init__(self, store_file: Optional[Path] = None, ttl: float = SESSION_TTL):
+        """
+        업로드 세션 저장소 초기화
+
+        Args:
+            store_file: 세션 저장 파일 경로 (None이면 메모리에만 유지)
+            ttl: 세션 유효 시간 (초)
+        """
+        self.store_file = Path(store_file) if store_file else None
+        self.ttl = ttl
+
+        self._sessions: Dict[str, Dict] = {}
+        self._lock = threading.Lock()
+
+        self._load()
+
+    def get(self, upload_key: str) -> Optional[Dict]:
+        """
+        저장된 세션 조회
+
+        Args:
+            upload_key: 업로드 식별 키
+
+        Returns:
+            Dict: 세션 정보 (없거나 만료되었으면 None)
+            {
+                "resumable_uri": "세션 URI",
+                "offset": 전송 완료된 바이트 수,
+                "size": 전체 크기,
+                "filename": "파일 이름",
+                "updated_at": 갱신 시각
+            }
+        """
+        with self._lock:
+            session = self._sessions.get(upload_key)
+            if session is None:
+                return None
+
+            if time.time() - session["updated_at"] > self.ttl:
+                del self._sessions[upload_key]
+                return None
+
+            return dict(session)
+
+    def update(
+        self,
+        upload_key: str,
+        resumable_uri: str,
+        offset: int,
+        size: int,
+        filename: str
+    ):
+        """
+        세션 진행 상황 저장
+
+        Args:
+            upload_key: 업로드 식별 키
+            resumable_uri: 재개 가능 업로드 세션 URI
+            offset: 서버가 확인한 전송 완료 바이트 수
+            size: 전체 크기
+            filename: 파일 이름
+        """
+        with self._lock:
+            self._sessions[upload_key] = {
+                "resumable_uri": resumable_uri,
+                "offset": offset,
+                "size": size,
+                "filename": filename,
+                "updated_at": time.time()
+            }
+
+        self.save()
+
+    def remove(self, upload_key: str):
+        """
+        세션 삭제 (업로드 완료 또는 세션 만료 시)
+
+        Args:
+            upload_key: 업로드 식별 키
+        """
+        with self._lock:
+            removed = self._sessions.pop(upload_key, None)
+
+        if removed is not None:
+            self.save()
+
+    def save(self):
+        """세션 목록을 디스크에 저장 (임시 파일 작성 후 교체)"""
+        if not self.store_file:
+            return
+
+        with self._lock:
+            data = dict(self._sessions)
+
+        try:
+            self.store_file.parent.mkdir(parents=True, exist_ok=True)
+            temp_file = self.store_file.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+            with open(temp_file, 'w', encoding='utf-8') as f:
+                json.dump(data, f, ensure_ascii=False)
+            os.replace(temp_file, self.store_file)
+        except OSError:
+            # 저장 실패 시 재시작 후 처음부터 업로드하게 될 뿐이므로 무시
+            pass
+
+    def _load(self):
+        """디스크에서 세션 목록 로드 (만료된 세션은 제외)"""
+        if not self.store_file or not self.store_file.exists():
+            return
+
+        try:
+            with open(self.store_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+
+        now = time.time()
+        for upload_key, session in data.items():
+            try:
+                if now - session["updated_at"] <= self.ttl:
+                    self._sessions[upload_key] = session
+            except (KeyError, TypeError):
+                continue
+
+    def __len__(self) -> int:
+        return len(self._sessions)
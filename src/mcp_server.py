@@ -1,7 +1,9 @@
 """Gemini-Drive MCP Server"""
 import asyncio
 import sys
+import time
 from pathlib import Path
+from typing import Optional
 
 # 프로젝트 루트를 Python 경로에 추가
 project_root = Path(__file__).parent.parent
@@ -12,7 +14,8 @@ from mcp.server.stdio import stdio_server
 from mcp.types import Tool, TextContent
 
 from src.clients.gemini_client import GeminiClient
-from src.clients.drive_client import DriveClient
+from src.clients.drive_client import DriveClient, ProgressCallback
+from src.managers.code_index import CodeSearchIndex
 from src.managers.context_manager import ContextManager
 from src.tools.gemini_tool import GeminiTool
 from src.tools.drive_tool import DriveTool
@@ -21,6 +24,20 @@ from src.utils.config import Config
 from src.utils.logger import setup_logger
 
 
+# 호출 전에 Drive 인증/서비스 생성이 필요한 도구 (generate_batch는 save_to_drive 인자가 있을 때만)
+DRIVE_TOOLS = frozenset({
+    "save_to_drive",
+    "read_from_drive",
+    "read_many_from_drive",
+    "list_drive_files",
+    "delete_drive_files",
+    "search_drive_files",
+    "create_drive_folders",
+    "sync_drive_folder",
+    "search_drive_code",
+})
+
+
 class GeminiDriveMCPServer:
     """Gemini-Drive MCP 서버"""
 
@@ -41,39 +58,93 @@ class GeminiDriveMCPServer:
         self.gemini_client = None
         self.drive_client = None
         self.context_manager = None
+        self.code_index = None
 
         # 기본 폴더 이름
         self.default_folder = self.config.get_drive_folder_name()
 
+        # Drive 인증/서비스 생성 완료 여부 (첫 Drive 도구 호출 때 수행)
+        self._drive_ready = False
+
         self.logger.info("MCP 서버 초기화 완료")
 
     async def initialize_clients(self):
         """API 클라이언트 초기화"""
         try:
             # Gemini 클라이언트
+            started = time.perf_counter()
             api_key = self.config.get_gemini_api_key()
             if not api_key:
                 raise ValueError("GEMINI_API_KEY가 설정되지 않았습니다.")
             self.gemini_client = GeminiClient(api_key)
-            self.logger.info("Gemini 클라이언트 초기화 완료")
+            self.logger.info(f"Gemini 클라이언트 초기화 완료 ({time.perf_counter() - started:.3f}초)")
 
-            # Drive 클라이언트
+            # Drive 클라이언트 (인증과 서비스 생성은 첫 Drive 도구 호출 때 수행)
+            started = time.perf_counter()
             creds_path = self.config.get_credentials_path()
             token_path = self.config.get_token_path()
             self.drive_client = DriveClient(
                 credentials_path=str(creds_path),
-                token_path=str(token_path)
+                token_path=str(token_path),
+                lazy=True
             )
-            self.logger.info("Drive 클라이언트 초기화 완료")
+            self.logger.info(f"Drive 클라이언트 초기화 완료 ({time.perf_counter() - started:.3f}초, 인증 지연)")
+
+            # 코드 검색 인덱스
+            self.code_index = CodeSearchIndex(self.config.get_cache_dir() / "code_index.db")
 
             # Context Manager
+            started = time.perf_counter()
             self.context_manager = ContextManager()
-            self.logger.info(f"컨텍스트 매니저 초기화 완료 (세션: {self.context_manager.session_id})")
+            self.logger.info(
+                f"컨텍스트 매니저 초기화 완료 (세션: {self.context_manager.session_id}, "
+                f"{time.perf_counter() - started:.3f}초)"
+            )
 
         except Exception as e:
             self.logger.error(f"클라이언트 초기화 실패: {e}")
             raise
 
+    def _create_progress_callback(self) -> Optional[ProgressCallback]:
+        """
+        현재 요청에 progressToken이 있으면 MCP 진행 알림을 보내는 콜백 생성
+
+        Returns:
+            ProgressCallback: callback(progress, total, message=None). 토큰이 없으면 None
+        """
+        try:
+            request_context = self.server.request_context
+        except LookupError:
+            return None
+
+        meta = request_context.meta
+        progress_token = meta.progressToken if meta else None
+        if progress_token is None:
+            return None
+
+        async def report(progress: float, total: Optional[float] = None, message: Optional[str] = None):
+            try:
+                await request_context.session.send_progress_notification(
+                    progress_token, progress, total, message=message
+                )
+            except Exception as e:
+                self.logger.warning(f"진행 알림 전송 실패: {e}")
+
+        return report
+
+    async def _ensure_drive_ready(self):
+        """첫 Drive 도구 호출 시 인증/서비스 생성을 마치고 단계별 소요 시간 기록"""
+        if self._drive_ready:
+            return
+
+        timings = await self.drive_client.ensure_ready()
+        self._drive_ready = True
+        self.logger.info(
+            "Drive 서비스 준비 완료 (" +
+            ", ".join(f"{phase}: {seconds:.3f}초" for phase, seconds in timings.items()) +
+            ")"
+        )
+
     def register_tools(self):
         """MCP Tools 등록"""
         self.logger.info("MCP Tools 등록 시작")
@@ -88,6 +159,11 @@ class GeminiDriveMCPServer:
                     description=GeminiTool.get_definition()["description"],
                     inputSchema=GeminiTool.get_definition()["inputSchema"]
                 ),
+                Tool(
+                    name=GeminiTool.get_batch_definition()["name"],
+                    description=GeminiTool.get_batch_definition()["description"],
+                    inputSchema=GeminiTool.get_batch_definition()["inputSchema"]
+                ),
                 Tool(
                     name=DriveTool.get_save_definition()["name"],
                     description=DriveTool.get_save_definition()["description"],
@@ -98,11 +174,41 @@ class GeminiDriveMCPServer:
                     description=DriveTool.get_read_definition()["description"],
                     inputSchema=DriveTool.get_read_definition()["inputSchema"]
                 ),
+                Tool(
+                    name=DriveTool.get_read_many_definition()["name"],
+                    description=DriveTool.get_read_many_definition()["description"],
+                    inputSchema=DriveTool.get_read_many_definition()["inputSchema"]
+                ),
                 Tool(
                     name=DriveTool.get_list_definition()["name"],
                     description=DriveTool.get_list_definition()["description"],
                     inputSchema=DriveTool.get_list_definition()["inputSchema"]
                 ),
+                Tool(
+                    name=DriveTool.get_delete_many_definition()["name"],
+                    description=DriveTool.get_delete_many_definition()["description"],
+                    inputSchema=DriveTool.get_delete_many_definition()["inputSchema"]
+                ),
+                Tool(
+                    name=DriveTool.get_search_many_definition()["name"],
+                    description=DriveTool.get_search_many_definition()["description"],
+                    inputSchema=DriveTool.get_search_many_definition()["inputSchema"]
+                ),
+                Tool(
+                    name=DriveTool.get_create_folders_definition()["name"],
+                    description=DriveTool.get_create_folders_definition()["description"],
+                    inputSchema=DriveTool.get_create_folders_definition()["inputSchema"]
+                ),
+                Tool(
+                    name=DriveTool.get_sync_folder_definition()["name"],
+                    description=DriveTool.get_sync_folder_definition()["description"],
+                    inputSchema=DriveTool.get_sync_folder_definition()["inputSchema"]
+                ),
+                Tool(
+                    name=DriveTool.get_search_code_definition()["name"],
+                    description=DriveTool.get_search_code_definition()["description"],
+                    inputSchema=DriveTool.get_search_code_definition()["inputSchema"]
+                ),
                 Tool(
                     name=ContextTool.get_definition()["name"],
                     description=ContextTool.get_definition()["description"],
@@ -125,12 +231,31 @@ class GeminiDriveMCPServer:
             try:
                 result = None
 
+                # Drive 도구는 첫 호출 때 인증/서비스 생성
+                if name in DRIVE_TOOLS:
+                    await self._ensure_drive_ready()
+
                 # Gemini 코드 생성
                 if name == "generate_code":
                     result = await GeminiTool.execute(
                         self.gemini_client,
                         self.context_manager,
-                        arguments
+                        arguments,
+                        progress_callback=self._create_progress_callback()
+                    )
+
+                # Gemini 일괄 코드 생성 (선택적으로 Drive 저장)
+                elif name == "generate_batch":
+                    if arguments.get("save_to_drive"):
+                        await self._ensure_drive_ready()
+                    result = await GeminiTool.execute_batch(
+                        self.gemini_client,
+                        self.context_manager,
+                        arguments,
+                        drive_client=self.drive_client,
+                        default_folder=self.default_folder,
+                        progress_callback=self._create_progress_callback(),
+                        code_index=self.code_index
                     )
 
                 # Drive 파일 저장
@@ -139,12 +264,24 @@ class GeminiDriveMCPServer:
                         self.drive_client,
                         self.context_manager,
                         arguments,
-                        self.default_folder
+                        self.default_folder,
+                        progress_callback=self._create_progress_callback(),
+                        code_index=self.code_index
                     )
 
                 # Drive 파일 읽기
                 elif name == "read_from_drive":
                     result = await DriveTool.read_file(
+                        self.drive_client,
+                        self.context_manager,
+                        arguments,
+                        self.default_folder,
+                        progress_callback=self._create_progress_callback()
+                    )
+
+                # Drive 여러 파일 읽기
+                elif name == "read_many_from_drive":
+                    result = await DriveTool.read_files(
                         self.drive_client,
                         self.context_manager,
                         arguments,
@@ -159,6 +296,48 @@ class GeminiDriveMCPServer:
                         self.default_folder
                     )
 
+                # Drive 파일 일괄 삭제
+                elif name == "delete_drive_files":
+                    result = await DriveTool.delete_files(
+                        self.drive_client,
+                        self.context_manager,
+                        arguments
+                    )
+
+                # Drive 파일 일괄 검색
+                elif name == "search_drive_files":
+                    result = await DriveTool.search_files(
+                        self.drive_client,
+                        arguments,
+                        self.default_folder
+                    )
+
+                # Drive 폴더 일괄 생성
+                elif name == "create_drive_folders":
+                    result = await DriveTool.create_folders(
+                        self.drive_client,
+                        arguments,
+                        self.default_folder
+                    )
+
+                # 로컬 폴더 ↔ Drive 폴더 동기화
+                elif name == "sync_drive_folder":
+                    result = await DriveTool.sync_folder(
+                        self.drive_client,
+                        self.context_manager,
+                        arguments,
+                        self.default_folder
+                    )
+
+                # Drive 코드 검색 (로컬 인덱스)
+                elif name == "search_drive_code":
+                    result = await DriveTool.search_code(
+                        self.drive_client,
+                        self.code_index,
+                        arguments,
+                        self.default_folder
+                    )
+
                 # 컨텍스트 조회
                 elif name == "get_context":
                     result = await ContextTool.execute(
@@ -183,6 +362,11 @@ class GeminiDriveMCPServer:
 
                 return [TextContent(type="text", text=result_text)]
 
+            except asyncio.CancelledError:
+                # 클라이언트가 요청을 취소한 경우: 진행 중인 작업은 각 클라이언트에서 중단
+                self.logger.info(f"Tool 호출 취소: {name}")
+                raise
+
             except Exception as e:
                 self.logger.error(f"Tool 실행 실패: {name}, 에러: {e}")
                 error_message = f"오류 발생: {str(e)}"
@@ -194,6 +378,7 @@ class GeminiDriveMCPServer:
         """MCP 서버 실행"""
         try:
             self.logger.info("MCP 서버 시작")
+            started = time.perf_counter()
 
             # 클라이언트 초기화
             await self.initialize_clients()
@@ -203,7 +388,7 @@ class GeminiDriveMCPServer:
 
             # stdio 서버 실행
             async with stdio_server() as (read_stream, write_stream):
-                self.logger.info("stdio 서버 시작됨")
+                self.logger.info(f"stdio 서버 시작됨 (시작까지 {time.perf_counter() - started:.3f}초)")
                 await self.server.run(
                     read_stream,
                     write_stream,
@@ -213,6 +398,9 @@ class GeminiDriveMCPServer:
         except Exception as e:
             self.logger.error(f"서버 실행 중 오류: {e}")
             raise
+        finally:
+            if self.gemini_client:
+                self.gemini_client.shutdown()
 
 
 async def main():
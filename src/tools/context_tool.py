@@ -23,6 +23,10 @@ class ContextTool:
                         "type": "number",
                         "description": "최대 항목 수 (기본: 5)",
                         "default": 5
+                    },
+                    "max_tokens": {
+                        "type": "number",
+                        "description": "컨텍스트 토큰 예산 (선택, 기본: CONTEXT_MAX_TOKENS 설정값)"
                     }
                 }
             }
@@ -57,13 +61,16 @@ class ContextTool:
         """
         session_id = arguments.get("session_id")
         max_items = arguments.get("max_items", 5)
+        max_tokens = arguments.get("max_tokens")
+        if max_tokens is not None:
+            max_tokens = int(max_tokens)
 
         # 다른 세션 조회
         if session_id and session_id != context_manager.session_id:
             try:
                 temp_manager = ContextManager(session_id=session_id)
                 temp_manager.load_session(session_id)
-                context_text = temp_manager.get_context(max_interactions=max_items)
+                context_text = temp_manager.get_context(max_interactions=max_items, max_tokens=max_tokens)
                 summary = temp_manager.get_summary()
 
                 return {
@@ -77,7 +84,7 @@ class ContextTool:
                 raise Exception(f"세션 로드 실패: {str(e)}")
 
         # 현재 세션 조회
-        context_text = context_manager.get_context(max_interactions=max_items)
+        context_text = context_manager.get_context(max_interactions=max_items, max_tokens=max_tokens)
         summary = context_manager.get_summary()
 
         return {
@@ -1,6 +1,12 @@
 """Google Drive 파일 관리 Tool"""
+import hashlib
+import time
+from pathlib import Path
 from typing import Dict, Any, Optional
-from src.clients.drive_client import DriveClient
+from src.clients.drive_client import DriveClient, ProgressCallback
+from src.managers.code_index import CodeSearchIndex
+from src.managers.folder_sync import FolderSync
+from src.utils.config import Config
 
 
 class DriveTool:
@@ -26,6 +32,11 @@ class DriveTool:
                     "folder": {
                         "type": "string",
                         "description": "저장할 폴더 이름 (선택). 없으면 기본 폴더에 저장"
+                    },
+                    "overwrite": {
+                        "type": "boolean",
+                        "description": "같은 이름의 파일이 있으면 새로 만들지 않고 갱신 (기본값: false). 내용이 같으면 업로드를 건너뜀",
+                        "default": False
                     }
                 },
                 "required": ["content", "filename"]
@@ -52,6 +63,52 @@ class DriveTool:
                     "folder": {
                         "type": "string",
                         "description": "검색할 폴더 이름 (선택)"
+                    },
+                    "force_remote": {
+                        "type": "boolean",
+                        "description": "true면 로컬 메타데이터 인덱스 대신 Drive에서 직접 검색 (기본: false)",
+                        "default": False
+                    },
+                    "bypass_cache": {
+                        "type": "boolean",
+                        "description": "true면 로컬 내용 캐시를 사용하지 않고 항상 다운로드 (기본: false)",
+                        "default": False
+                    }
+                }
+            }
+        }
+
+    @staticmethod
+    def get_read_many_definition() -> Dict[str, Any]:
+        """여러 파일 읽기 Tool 정의"""
+        return {
+            "name": "read_many_from_drive",
+            "description": "Google Drive에서 여러 파일을 한 번에 읽어옵니다. 이름은 폴더 목록 한 번으로 찾고, 내용은 동시에 다운로드합니다.",
+            "inputSchema": {
+                "type": "object",
+                "properties": {
+                    "file_ids": {
+                        "type": "array",
+                        "items": {"type": "string"},
+                        "description": "파일 ID 목록 (file_ids와 filenames 중 하나 이상 필수)"
+                    },
+                    "filenames": {
+                        "type": "array",
+                        "items": {"type": "string"},
+                        "description": "파일 이름 목록 (file_ids와 filenames 중 하나 이상 필수)"
+                    },
+                    "folder": {
+                        "type": "string",
+                        "description": "이름으로 찾을 폴더 이름 (선택). 없으면 기본 폴더"
+                    },
+                    "max_total_bytes": {
+                        "type": "number",
+                        "description": "전체 내용 최대 바이트 수 (선택). 넘으면 나머지 파일은 잘리거나 생략됨"
+                    },
+                    "bypass_cache": {
+                        "type": "boolean",
+                        "description": "true면 로컬 내용 캐시를 사용하지 않고 항상 다운로드 (기본: false)",
+                        "default": False
                     }
                 }
             }
@@ -72,19 +129,161 @@ class DriveTool:
                     },
                     "max_results": {
                         "type": "number",
-                        "description": "최대 결과 수 (기본: 20)",
+                        "description": "페이지당 최대 결과 수 (기본: 20, 최대: 1000)",
                         "default": 20
+                    },
+                    "cursor": {
+                        "type": "string",
+                        "description": "이전 응답의 next_cursor (선택). 다음 페이지를 조회합니다"
+                    },
+                    "force_remote": {
+                        "type": "boolean",
+                        "description": "true면 로컬 메타데이터 인덱스 대신 Drive에서 직접 조회 (기본: false)",
+                        "default": False
                     }
                 }
             }
         }
 
+    @staticmethod
+    def get_delete_many_definition() -> Dict[str, Any]:
+        """여러 파일 삭제 Tool 정의"""
+        return {
+            "name": "delete_drive_files",
+            "description": "Google Drive에서 여러 파일을 한 번에 삭제합니다. 배치 요청으로 처리되어 100개당 한 번의 요청만 사용합니다.",
+            "inputSchema": {
+                "type": "object",
+                "properties": {
+                    "file_ids": {
+                        "type": "array",
+                        "items": {"type": "string"},
+                        "description": "삭제할 파일 ID 목록"
+                    }
+                },
+                "required": ["file_ids"]
+            }
+        }
+
+    @staticmethod
+    def get_search_many_definition() -> Dict[str, Any]:
+        """여러 파일 검색 Tool 정의"""
+        return {
+            "name": "search_drive_files",
+            "description": "여러 파일 이름을 Google Drive에서 한 번에 검색합니다. 배치 요청으로 처리됩니다.",
+            "inputSchema": {
+                "type": "object",
+                "properties": {
+                    "filenames": {
+                        "type": "array",
+                        "items": {"type": "string"},
+                        "description": "검색할 파일 이름 목록"
+                    },
+                    "folder": {
+                        "type": "string",
+                        "description": "검색할 폴더 이름 (선택). 없으면 기본 폴더에서 검색"
+                    }
+                },
+                "required": ["filenames"]
+            }
+        }
+
+    @staticmethod
+    def get_create_folders_definition() -> Dict[str, Any]:
+        """여러 폴더 생성 Tool 정의"""
+        return {
+            "name": "create_drive_folders",
+            "description": "Google Drive에 여러 폴더를 한 번에 생성합니다. 이미 존재하는 폴더는 기존 폴더 ID를 반환합니다.",
+            "inputSchema": {
+                "type": "object",
+                "properties": {
+                    "folders": {
+                        "type": "array",
+                        "items": {"type": "string"},
+                        "description": "생성할 폴더 이름 목록"
+                    },
+                    "parent": {
+                        "type": "string",
+                        "description": "상위 폴더 이름 또는 경로 (선택). 없으면 기본 폴더 아래에 생성"
+                    }
+                },
+                "required": ["folders"]
+            }
+        }
+
+    @staticmethod
+    def get_sync_folder_definition() -> Dict[str, Any]:
+        """폴더 동기화 Tool 정의"""
+        return {
+            "name": "sync_drive_folder",
+            "description": "로컬 디렉토리와 Google Drive 폴더를 동기화합니다. 내용 해시(MD5)를 비교해 바뀐 파일만 병렬로 전송하며, 하위 폴더도 포함합니다. 삭제는 전파하지 않습니다.",
+            "inputSchema": {
+                "type": "object",
+                "properties": {
+                    "local_dir": {
+                        "type": "string",
+                        "description": "로컬 디렉토리 경로 (상대 경로는 프로젝트 루트 기준)"
+                    },
+                    "folder": {
+                        "type": "string",
+                        "description": "Drive 폴더 이름 또는 경로 (선택). 없으면 기본 폴더"
+                    },
+                    "direction": {
+                        "type": "string",
+                        "enum": ["pull", "push", "both"],
+                        "description": "pull: Drive → 로컬, push: 로컬 → Drive, both: 양방향 (기본값: both)",
+                        "default": "both"
+                    }
+                },
+                "required": ["local_dir"]
+            }
+        }
+
+    @staticmethod
+    def get_search_code_definition() -> Dict[str, Any]:
+        """코드 검색 Tool 정의"""
+        return {
+            "name": "search_drive_code",
+            "description": "기본 Drive 폴더에 저장된 코드/텍스트 파일 내용을 검색합니다. 로컬 인덱스로 검색하므로 파일을 매번 다운로드하지 않으며, 매칭된 줄과 줄 번호를 함께 반환합니다.",
+            "inputSchema": {
+                "type": "object",
+                "properties": {
+                    "query": {
+                        "type": "string",
+                        "description": "검색할 문자열 (regex가 true면 정규식)"
+                    },
+                    "regex": {
+                        "type": "boolean",
+                        "description": "정규식으로 검색 (기본: false)",
+                        "default": False
+                    },
+                    "case_sensitive": {
+                        "type": "boolean",
+                        "description": "대소문자 구분 (기본: false)",
+                        "default": False
+                    },
+                    "max_results": {
+                        "type": "number",
+                        "description": "최대 파일 수 (기본: 20)",
+                        "default": 20
+                    },
+                    "refresh": {
+                        "type": "boolean",
+                        "description": "true면 검색 전에 Drive 폴더의 변경 사항을 바로 반영 (기본: 일정 간격마다 자동 반영)",
+                        "default": False
+                    }
+                },
+                "required": ["query"]
+            }
+        }
+
     @staticmethod
     async def save_file(
         drive_client: DriveClient,
         context_manager: Any,
         arguments: Dict[str, Any],
-        default_folder: Optional[str] = None
+        default_folder: Optional[str] = None,
+        progress_callback: Optional[ProgressCallback] = None,
+        code_index: Optional[CodeSearchIndex] = None
     ) -> Dict[str, Any]:
         """
         파일 저장 실행
@@ -94,6 +293,8 @@ class DriveTool:
             context_manager: 컨텍스트 매니저
             arguments: Tool 인자
             default_folder: 기본 폴더 이름
+            progress_callback: 업로드 진행 상황 콜백 (선택)
+            code_index: 기본 폴더에 저장한 파일을 바로 반영할 코드 검색 인덱스 (선택)
 
         Returns:
             Dict: 저장 결과
@@ -101,6 +302,7 @@ class DriveTool:
         content = arguments.get("content")
         filename = arguments.get("filename")
         folder_name = arguments.get("folder") or default_folder
+        overwrite = bool(arguments.get("overwrite", False))
 
         if not content:
             raise ValueError("'content' 인자가 필요합니다.")
@@ -116,9 +318,20 @@ class DriveTool:
         result = await drive_client.upload_file(
             content=content,
             filename=filename,
-            folder_id=folder_id
+            folder_id=folder_id,
+            progress_callback=progress_callback,
+            overwrite=overwrite
         )
 
+        # 기본 폴더의 코드 검색 인덱스 갱신 (Drive md5Checksum은 업로드한 UTF-8 바이트의 MD5와 같음)
+        if code_index is not None and folder_name == default_folder:
+            code_index.update(
+                result["file_id"],
+                result["file_name"] or filename,
+                content,
+                hashlib.md5(content.encode('utf-8')).hexdigest()
+            )
+
         # 컨텍스트에 저장
         context_manager.add_interaction(
             user_message=f"파일 저장: {filename}",
@@ -127,18 +340,27 @@ class DriveTool:
                 "tool": "save_to_drive",
                 "file_id": result["file_id"],
                 "filename": filename,
-                "folder": folder_name
+                "folder": folder_name,
+                "status": result["status"]
             }
         )
         context_manager.save_session()
 
+        if result["status"] == "unchanged":
+            message = f"내용이 같아 업로드를 건너뛰었습니다: {result['web_view_link']}"
+        elif result["status"] == "updated":
+            message = f"기존 파일을 갱신했습니다: {result['web_view_link']}"
+        else:
+            message = f"파일이 Google Drive에 저장되었습니다: {result['web_view_link']}"
+
         return {
             "success": True,
             "file_id": result["file_id"],
             "filename": result["file_name"],
             "web_view_link": result["web_view_link"],
             "folder": folder_name,
-            "message": f"파일이 Google Drive에 저장되었습니다: {result['web_view_link']}"
+            "status": result["status"],
+            "message": message
         }
 
     @staticmethod
@@ -146,7 +368,8 @@ class DriveTool:
         drive_client: DriveClient,
         context_manager: Any,
         arguments: Dict[str, Any],
-        default_folder: Optional[str] = None
+        default_folder: Optional[str] = None,
+        progress_callback: Optional[ProgressCallback] = None
     ) -> Dict[str, Any]:
         """
         파일 읽기 실행
@@ -156,6 +379,7 @@ class DriveTool:
             context_manager: 컨텍스트 매니저
             arguments: Tool 인자
             default_folder: 기본 폴더 이름
+            progress_callback: 다운로드 진행 상황 콜백 (선택)
 
         Returns:
             Dict: 파일 내용
@@ -173,7 +397,11 @@ class DriveTool:
             if folder_name:
                 folder_id = await drive_client.create_folder(folder_name)
 
-            file_info = await drive_client.search_file(filename, folder_id)
+            file_info = await drive_client.search_file(
+                filename,
+                folder_id,
+                force_remote=bool(arguments.get("force_remote", False))
+            )
             if not file_info:
                 raise FileNotFoundError(f"파일을 찾을 수 없습니다: {filename}")
 
@@ -181,7 +409,11 @@ class DriveTool:
             filename = file_info["name"]
 
         # 파일 다운로드
-        content = await drive_client.download_file(file_id)
+        content = await drive_client.download_file(
+            file_id,
+            progress_callback=progress_callback,
+            use_cache=not arguments.get("bypass_cache", False)
+        )
 
         # 컨텍스트에 저장
         context_manager.add_interaction(
@@ -204,6 +436,147 @@ class DriveTool:
             "message": f"파일을 성공적으로 읽었습니다: {filename}"
         }
 
+    @staticmethod
+    async def read_files(
+        drive_client: DriveClient,
+        context_manager: Any,
+        arguments: Dict[str, Any],
+        default_folder: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        여러 파일 읽기 실행
+
+        Args:
+            drive_client: Drive API 클라이언트
+            context_manager: 컨텍스트 매니저
+            arguments: Tool 인자
+            default_folder: 기본 폴더 이름
+
+        Returns:
+            Dict: 파일별 내용과 오류
+        """
+        file_ids = list(arguments.get("file_ids") or [])
+        filenames = list(arguments.get("filenames") or [])
+        folder_name = arguments.get("folder") or default_folder
+        max_total_bytes = arguments.get("max_total_bytes")
+        max_total_bytes = Config.get_read_many_max_bytes() if max_total_bytes is None else int(max_total_bytes)
+
+        if not file_ids and not filenames:
+            raise ValueError("'file_ids' 또는 'filenames' 인자가 필요합니다.")
+
+        # 요청 순서대로 결과를 채울 항목 (ID로 요청한 파일 → 이름으로 요청한 파일)
+        items = [{"file_id": file_id, "filename": None} for file_id in file_ids]
+
+        if filenames:
+            folder_id = None
+            if folder_name:
+                folder_id = await drive_client.create_folder(folder_name)
+
+            for resolved in await drive_client.resolve_filenames(filenames, folder_id):
+                file = resolved["file"]
+                item = {
+                    "file_id": file["id"] if file else None,
+                    "filename": resolved["filename"],
+                    "content": None,
+                    "size": 0
+                }
+                if resolved.get("error"):
+                    item["error"] = resolved["error"]
+                elif not file:
+                    item["error"] = f"파일을 찾을 수 없습니다: {resolved['filename']}"
+                items.append(item)
+
+        downloads = await drive_client.download_files(
+            [item["file_id"] for item in items if not item.get("error")],
+            max_concurrency=Config.get_read_many_concurrency(),
+            max_total_bytes=max_total_bytes,
+            use_cache=not arguments.get("bypass_cache", False)
+        )
+        for item, download in zip([item for item in items if not item.get("error")], downloads):
+            item.update(download)
+
+        succeeded = [item for item in items if not item.get("error")]
+        total_size = sum(item["size"] for item in succeeded)
+
+        context_manager.add_interaction(
+            user_message=f"여러 파일 읽기: {len(items)}개",
+            assistant_response=f"{len(succeeded)}개 파일 내용을 불러왔습니다 ({total_size} 바이트)",
+            metadata={
+                "tool": "read_many_from_drive",
+                "file_ids": [item["file_id"] for item in succeeded]
+            }
+        )
+        context_manager.save_session()
+
+        return {
+            "success": len(succeeded) == len(items),
+            "files": items,
+            "read": len(succeeded),
+            "failed": len(items) - len(succeeded),
+            "total_size": total_size,
+            "message": f"{len(items)}개 중 {len(succeeded)}개 파일을 읽었습니다 ({total_size} 바이트)"
+        }
+
+    @staticmethod
+    async def search_code(
+        drive_client: DriveClient,
+        code_index: CodeSearchIndex,
+        arguments: Dict[str, Any],
+        default_folder: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        코드 검색 실행
+
+        마지막 동기화 후 CODE_INDEX_REFRESH_INTERVAL이 지났으면 먼저 폴더의 변경 사항
+        (md5Checksum이 바뀐 파일)만 색인에 반영한 뒤 로컬에서 검색합니다.
+
+        Args:
+            drive_client: Drive API 클라이언트
+            code_index: 코드 검색 인덱스
+            arguments: Tool 인자
+            default_folder: 기본 폴더 이름 (색인 대상 폴더)
+
+        Returns:
+            Dict: 파일별 검색 결과
+        """
+        query = arguments.get("query")
+        regex = bool(arguments.get("regex", False))
+        case_sensitive = bool(arguments.get("case_sensitive", False))
+        max_results = int(arguments.get("max_results", 20))
+
+        if not query:
+            raise ValueError("'query' 인자가 필요합니다.")
+        if not default_folder:
+            raise ValueError("DRIVE_FOLDER_NAME이 설정되지 않았습니다.")
+
+        folder_id = await drive_client.create_folder(default_folder)
+
+        refreshed = None
+        refreshed_at = code_index.refreshed_at(folder_id)
+        if (
+            arguments.get("refresh", False)
+            or refreshed_at is None
+            or time.time() - refreshed_at >= Config.get_code_index_refresh_interval()
+        ):
+            refreshed = await code_index.refresh(
+                drive_client,
+                folder_id,
+                max_file_bytes=Config.get_code_index_max_file_bytes(),
+                max_concurrency=Config.get_read_many_concurrency()
+            )
+
+        results = code_index.search(query, regex=regex, case_sensitive=case_sensitive, limit=max_results)
+
+        return {
+            "success": True,
+            "folder": default_folder,
+            "query": query,
+            "count": len(results),
+            "results": results,
+            "refreshed": refreshed,
+            "message": f"{len(results)}개 파일에서 '{query}'을(를) 찾았습니다."
+        }
+
     @staticmethod
     async def list_files(
         drive_client: DriveClient,
@@ -222,21 +595,216 @@ class DriveTool:
             Dict: 파일 목록
         """
         folder_name = arguments.get("folder") or default_folder
-        max_results = arguments.get("max_results", 20)
+        max_results = int(arguments.get("max_results", 20))
+        cursor = arguments.get("cursor")
 
         folder_id = None
         if folder_name:
             folder_id = await drive_client.create_folder(folder_name)
 
-        files = await drive_client.list_files(
+        page = await drive_client.list_files_page(
             folder_id=folder_id,
-            max_results=max_results
+            page_size=max_results,
+            page_token=cursor,
+            force_remote=bool(arguments.get("force_remote", False))
         )
+        files = page["files"]
 
         return {
             "success": True,
             "folder": folder_name,
             "count": len(files),
             "files": files,
+            "next_cursor": page["next_page_token"],
             "message": f"{len(files)}개의 파일을 찾았습니다."
+            + (" 다음 페이지가 있습니다 (next_cursor 사용)." if page["next_page_token"] else "")
+        }
+
+    @staticmethod
+    async def delete_files(
+        drive_client: DriveClient,
+        context_manager: Any,
+        arguments: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """
+        여러 파일 삭제 실행
+
+        Args:
+            drive_client: Drive API 클라이언트
+            context_manager: 컨텍스트 매니저
+            arguments: Tool 인자
+
+        Returns:
+            Dict: 파일별 삭제 결과
+        """
+        file_ids = arguments.get("file_ids")
+        if not file_ids:
+            raise ValueError("'file_ids' 인자가 필요합니다.")
+
+        results = await drive_client.delete_files(file_ids)
+        deleted = sum(1 for item in results if item["success"])
+
+        # 컨텍스트에 저장
+        context_manager.add_interaction(
+            user_message=f"파일 삭제: {len(file_ids)}개",
+            assistant_response=f"{deleted}개 파일을 삭제했습니다",
+            metadata={
+                "tool": "delete_drive_files",
+                "file_ids": [item["file_id"] for item in results if item["success"]]
+            }
+        )
+        context_manager.save_session()
+
+        return {
+            "success": deleted == len(results),
+            "deleted": deleted,
+            "failed": len(results) - deleted,
+            "results": results,
+            "message": f"{len(results)}개 중 {deleted}개 파일을 삭제했습니다."
+        }
+
+    @staticmethod
+    async def search_files(
+        drive_client: DriveClient,
+        arguments: Dict[str, Any],
+        default_folder: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        여러 파일 검색 실행
+
+        Args:
+            drive_client: Drive API 클라이언트
+            arguments: Tool 인자
+            default_folder: 기본 폴더 이름
+
+        Returns:
+            Dict: 이름별 검색 결과
+        """
+        filenames = arguments.get("filenames")
+        folder_name = arguments.get("folder") or default_folder
+
+        if not filenames:
+            raise ValueError("'filenames' 인자가 필요합니다.")
+
+        folder_id = None
+        if folder_name:
+            folder_id = await drive_client.create_folder(folder_name)
+
+        results = await drive_client.search_files(filenames, folder_id)
+        found = sum(1 for item in results if item["file"])
+
+        return {
+            "success": True,
+            "folder": folder_name,
+            "found": found,
+            "results": results,
+            "message": f"{len(results)}개 중 {found}개 파일을 찾았습니다."
+        }
+
+    @staticmethod
+    async def create_folders(
+        drive_client: DriveClient,
+        arguments: Dict[str, Any],
+        default_folder: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        여러 폴더 생성 실행
+
+        Args:
+            drive_client: Drive API 클라이언트
+            arguments: Tool 인자
+            default_folder: 기본 폴더 이름
+
+        Returns:
+            Dict: 폴더별 생성 결과
+        """
+        folders = arguments.get("folders")
+        parent_name = arguments.get("parent") or default_folder
+
+        if not folders:
+            raise ValueError("'folders' 인자가 필요합니다.")
+
+        parent_id = None
+        if parent_name:
+            parent_id = await drive_client.create_folder(parent_name)
+
+        results = await drive_client.create_folders(folders, parent_id)
+        created = sum(1 for item in results if item["created"])
+        failed = sum(1 for item in results if item.get("error"))
+
+        return {
+            "success": failed == 0,
+            "parent": parent_name,
+            "created": created,
+            "failed": failed,
+            "results": results,
+            "message": f"{len(results)}개 폴더 처리 완료 (새로 생성: {created}개)"
+        }
+
+    @staticmethod
+    async def sync_folder(
+        drive_client: DriveClient,
+        context_manager: Any,
+        arguments: Dict[str, Any],
+        default_folder: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        폴더 동기화 실행
+
+        Args:
+            drive_client: Drive API 클라이언트
+            context_manager: 컨텍스트 매니저
+            arguments: Tool 인자
+            default_folder: 기본 폴더 이름
+
+        Returns:
+            Dict: 동기화 결과
+        """
+        local_dir = arguments.get("local_dir")
+        folder_name = arguments.get("folder") or default_folder
+        direction = arguments.get("direction", "both")
+
+        if not local_dir:
+            raise ValueError("'local_dir' 인자가 필요합니다.")
+        if not folder_name:
+            raise ValueError("'folder' 인자가 필요합니다.")
+
+        local_path = Path(local_dir).expanduser()
+        if not local_path.is_absolute():
+            local_path = Config.get_project_root() / local_path
+
+        folder_id = await drive_client.create_folder(folder_name)
+
+        folder_sync = FolderSync(
+            drive_client,
+            manifest_dir=Config.get_cache_dir() / "sync",
+            max_concurrency=Config.get_drive_sync_concurrency()
+        )
+        result = await folder_sync.sync(local_path, folder_id, direction)
+
+        context_manager.add_interaction(
+            user_message=f"폴더 동기화: {local_path} ↔ {folder_name} ({direction})",
+            assistant_response=(
+                f"내려받음 {len(result['downloaded'])}개, 올림 {len(result['uploaded'])}개, "
+                f"변경 없음 {result['unchanged']}개"
+            ),
+            metadata={
+                "tool": "sync_drive_folder",
+                "local_dir": str(local_path),
+                "folder": folder_name,
+                "direction": direction
+            }
+        )
+        context_manager.save_session()
+
+        return {
+            "success": not result["errors"],
+            "local_dir": str(local_path),
+            "folder": folder_name,
+            "direction": direction,
+            **result,
+            "message": (
+                f"동기화 완료: 내려받음 {len(result['downloaded'])}개, 올림 {len(result['uploaded'])}개, "
+                f"변경 없음 {result['unchanged']}개, 실패 {len(result['errors'])}개"
+            )
         }
@@ -1,6 +1,14 @@
 """Gemini 코드 생성 Tool"""
-from typing import Dict, Any
+import asyncio
+import inspect
+import json
+from typing import Dict, Any, Optional, Callable, AsyncIterator, List
 from src.clients.gemini_client import GeminiClient
+from src.tools.drive_tool import DriveTool
+
+
+# 일괄 생성 한 번에 받을 최대 항목 수
+MAX_BATCH_ITEMS = 50
 
 
 class GeminiTool:
@@ -32,17 +40,81 @@ class GeminiTool:
                     "context_id": {
                         "type": "string",
                         "description": "이전 컨텍스트 세션 ID (선택). 이전 대화를 참조하여 코드를 생성합니다."
+                    },
+                    "bypass_cache": {
+                        "type": "boolean",
+                        "description": "true면 같은 요청의 캐시된 응답을 사용하지 않고 새로 생성 (기본: false)",
+                        "default": False
                     }
                 },
                 "required": ["prompt"]
             }
         }
 
+    @staticmethod
+    def get_batch_definition() -> Dict[str, Any]:
+        """일괄 코드 생성 Tool 정의"""
+        return {
+            "name": "generate_batch",
+            "description": "여러 코드 생성 요청을 한 번에 동시에 처리합니다. 관련된 여러 파일(예: 모듈별 테스트)을 만들 때 사용하며, 각 결과를 Drive에 바로 저장할 수도 있습니다.",
+            "inputSchema": {
+                "type": "object",
+                "properties": {
+                    "items": {
+                        "type": "array",
+                        "description": f"생성 요청 목록 (최대 {MAX_BATCH_ITEMS}개)",
+                        "items": {
+                            "type": "object",
+                            "properties": {
+                                "prompt": {
+                                    "type": "string",
+                                    "description": "코드 생성 요청 (자연어)"
+                                },
+                                "language": {
+                                    "type": "string",
+                                    "description": "프로그래밍 언어 (선택)"
+                                },
+                                "filename": {
+                                    "type": "string",
+                                    "description": "Drive에 저장할 파일 이름 (save_to_drive일 때 필요)"
+                                }
+                            },
+                            "required": ["prompt"]
+                        }
+                    },
+                    "context_id": {
+                        "type": "string",
+                        "description": "이전 컨텍스트 세션 ID (선택). 모든 항목에 같은 컨텍스트를 사용합니다."
+                    },
+                    "concurrency": {
+                        "type": "number",
+                        "description": "동시에 생성할 항목 수 (선택, 기본: GEMINI_BATCH_CONCURRENCY 설정값)"
+                    },
+                    "save_to_drive": {
+                        "type": "boolean",
+                        "description": "true면 생성된 코드를 항목의 filename으로 Drive에 저장 (기본: false)",
+                        "default": False
+                    },
+                    "folder": {
+                        "type": "string",
+                        "description": "저장할 Drive 폴더 이름 (선택, 기본 폴더 사용)"
+                    },
+                    "bypass_cache": {
+                        "type": "boolean",
+                        "description": "true면 캐시된 응답을 사용하지 않고 새로 생성 (기본: false)",
+                        "default": False
+                    }
+                },
+                "required": ["items"]
+            }
+        }
+
     @staticmethod
     async def execute(
         gemini_client: GeminiClient,
         context_manager: Any,
-        arguments: Dict[str, Any]
+        arguments: Dict[str, Any],
+        progress_callback: Optional[Callable[..., Any]] = None
     ) -> Dict[str, Any]:
         """
         Tool 실행
@@ -54,6 +126,9 @@ class GeminiTool:
                 - prompt: 코드 생성 요청
                 - language: 프로그래밍 언어 (선택)
                 - context_id: 세션 ID (선택)
+                - bypass_cache: 응답 캐시 우회 여부 (선택)
+            progress_callback: 지정하면 스트리밍으로 생성하며 응답 조각마다
+                callback(받은 문자 수, None, message=응답 조각) 호출 (선택)
 
         Returns:
             Dict: 실행 결과
@@ -75,6 +150,7 @@ class GeminiTool:
 
         language = arguments.get("language")
         context_id = arguments.get("context_id")
+        use_cache = not arguments.get("bypass_cache", False)
 
         # 컨텍스트 로드 (있는 경우)
         context = None
@@ -89,11 +165,17 @@ class GeminiTool:
                 pass
 
         # 코드 생성
-        result = await gemini_client.generate_code(
-            prompt=prompt,
-            language=language,
-            context=context
-        )
+        if progress_callback is None:
+            result = await gemini_client.generate_code(
+                prompt=prompt,
+                language=language,
+                context=context,
+                use_cache=use_cache
+            )
+        else:
+            result = await GeminiTool._stream(
+                gemini_client, prompt, language, context, use_cache, progress_callback
+            )
 
         # 컨텍스트에 저장
         context_manager.add_interaction(
@@ -113,3 +195,254 @@ class GeminiTool:
             "explanation": result["explanation"],
             "session_id": context_manager.session_id
         }
+
+    @staticmethod
+    async def execute_batch(
+        gemini_client: GeminiClient,
+        context_manager: Any,
+        arguments: Dict[str, Any],
+        drive_client: Any = None,
+        default_folder: Optional[str] = None,
+        progress_callback: Optional[Callable[..., Any]] = None,
+        code_index: Any = None
+    ) -> Dict[str, Any]:
+        """
+        일괄 생성 실행
+
+        Args:
+            gemini_client: Gemini API 클라이언트
+            context_manager: 컨텍스트 매니저
+            arguments: Tool 인자
+                - items: 생성 요청 목록 [{"prompt", "language"(선택), "filename"(선택)}]
+                - context_id: 세션 ID (선택)
+                - concurrency: 동시 생성 수 (선택)
+                - save_to_drive: Drive 저장 여부 (선택)
+                - folder: 저장할 Drive 폴더 (선택)
+                - bypass_cache: 응답 캐시 우회 여부 (선택)
+            drive_client: Drive API 클라이언트 (save_to_drive일 때 필요)
+            default_folder: 기본 폴더 이름
+            progress_callback: 항목이 끝날 때마다 callback(끝난 항목 수, 전체 항목 수, message=결과 JSON) 호출 (선택)
+            code_index: 기본 폴더에 저장한 파일을 반영할 코드 검색 인덱스 (선택)
+
+        Returns:
+            Dict: 항목 순서대로 정렬한 결과와 성공/실패 수
+            {
+                "results": [{"index", "success", "code", "language", "explanation", "drive"?} 또는
+                            {"index", "success": False, "error"}],
+                "succeeded": 성공 수,
+                "failed": 실패 수,
+                "session_id": "현재 세션 ID"
+            }
+
+        Raises:
+            ValueError: items가 비어 있거나 너무 많은 경우, Drive 저장에 필요한 값이 없는 경우
+        """
+        items = arguments.get("items")
+        if not items or not isinstance(items, list):
+            raise ValueError("'items' 인자가 필요합니다.")
+        if len(items) > MAX_BATCH_ITEMS:
+            raise ValueError(f"한 번에 최대 {MAX_BATCH_ITEMS}개까지 생성할 수 있습니다. (요청: {len(items)}개)")
+        invalid = [index for index, item in enumerate(items) if not isinstance(item, dict)]
+        if invalid:
+            raise ValueError(f"'items'의 각 항목은 객체여야 합니다. (잘못된 항목: {invalid})")
+
+        save_to_drive = arguments.get("save_to_drive", False)
+        if save_to_drive:
+            if drive_client is None:
+                raise ValueError("Drive 클라이언트가 없어 저장할 수 없습니다.")
+            missing = [index for index, item in enumerate(items) if not item.get("filename")]
+            if missing:
+                raise ValueError(f"Drive에 저장하려면 모든 항목에 'filename'이 필요합니다. (누락: {missing})")
+
+        concurrency = arguments.get("concurrency")
+        context_id = arguments.get("context_id")
+
+        # 컨텍스트 로드 (있는 경우)
+        context = None
+        if context_id:
+            try:
+                temp_manager = type(context_manager)(session_id=context_id)
+                temp_manager.load_session(context_id)
+                context = temp_manager.get_context()
+            except Exception:
+                pass
+
+        results = []
+        async for result in GeminiTool.iter_batch(
+            gemini_client,
+            context_manager,
+            items,
+            concurrency=int(concurrency) if concurrency else None,
+            context=context,
+            use_cache=not arguments.get("bypass_cache", False),
+            drive_client=drive_client if save_to_drive else None,
+            folder=arguments.get("folder"),
+            default_folder=default_folder,
+            code_index=code_index
+        ):
+            if result["success"]:
+                context_manager.add_interaction(
+                    user_message=items[result["index"]]["prompt"],
+                    assistant_response=result["code"],
+                    metadata={
+                        "language": result["language"],
+                        "tool": "generate_batch"
+                    }
+                )
+            results.append(result)
+
+            if progress_callback is not None:
+                notified = progress_callback(
+                    len(results), len(items), message=json.dumps(result, ensure_ascii=False)
+                )
+                if inspect.isawaitable(notified):
+                    await notified
+
+        context_manager.save_session()
+
+        results.sort(key=lambda result: result["index"])
+        succeeded = sum(1 for result in results if result["success"])
+        return {
+            "results": results,
+            "succeeded": succeeded,
+            "failed": len(results) - succeeded,
+            "session_id": context_manager.session_id
+        }
+
+    @staticmethod
+    async def iter_batch(
+        gemini_client: GeminiClient,
+        context_manager: Any,
+        items: List[Dict[str, Any]],
+        concurrency: Optional[int] = None,
+        context: Optional[str] = None,
+        use_cache: bool = True,
+        instruction_set: str = "default",
+        drive_client: Any = None,
+        folder: Optional[str] = None,
+        default_folder: Optional[str] = None,
+        code_index: Any = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        일괄 생성 결과를 끝나는 순서대로 반환 (MCP Tool과 웹 API가 함께 사용)
+
+        drive_client가 있으면 성공한 결과마다 곧바로 DriveTool.save_file로 저장을 시작하고,
+        저장이 끝나는 대로 "drive" 필드를 붙여 반환합니다. 저장하는 동안에도 나머지 항목은 계속 생성하며,
+        앞 항목의 저장을 기다리지 않습니다. 반복을 중간에 멈추면 남은 생성과 저장은 취소합니다.
+
+        Args:
+            gemini_client: Gemini API 클라이언트
+            context_manager: 컨텍스트 매니저 (Drive 저장 기록용)
+            items: 요청 목록 [{"prompt", "language"(선택), "filename"(Drive 저장 시 필수)}]
+            concurrency: 동시 생성 수 (None이면 설정값)
+            context: 모든 항목에 공통인 이전 컨텍스트 (선택)
+            use_cache: False면 캐시를 조회하지 않고 새로 생성
+            instruction_set: 지시문 세트
+            drive_client: 결과를 저장할 Drive 클라이언트 (None이면 저장하지 않음)
+            folder: 저장할 Drive 폴더 (None이면 default_folder)
+            default_folder: 기본 폴더 이름
+            code_index: 기본 폴더에 저장한 파일을 반영할 코드 검색 인덱스 (선택)
+
+        Yields:
+            generate_batch 결과 (저장 시 "drive": {"success", "file_id", "filename", "web_view_link", "status"}
+            또는 {"success": False, "error"})
+
+        Raises:
+            Exception: 저장할 폴더를 만들 수 없는 경우
+        """
+        results = gemini_client.generate_batch(
+            items,
+            concurrency=concurrency,
+            context=context,
+            use_cache=use_cache,
+            instruction_set=instruction_set
+        )
+
+        if drive_client is not None and (folder or default_folder):
+            # 동시에 저장하면서 같은 폴더를 여러 번 만들지 않도록 미리 한 번 해석 (이후 저장은 폴더 캐시 사용)
+            await drive_client.create_folder(folder or default_folder)
+
+        async def save(result: Dict[str, Any]) -> Dict[str, Any]:
+            result["drive"] = await GeminiTool._save_result(
+                drive_client, context_manager, items[result["index"]], result, folder, default_folder, code_index
+            )
+            return result
+
+        next_result = asyncio.ensure_future(results.__anext__())
+        pending = {next_result}
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task is not next_result:
+                        yield task.result()
+                        continue
+
+                    try:
+                        result = task.result()
+                    except StopAsyncIteration:
+                        continue
+                    next_result = asyncio.ensure_future(results.__anext__())
+                    pending.add(next_result)
+
+                    if result["success"] and drive_client is not None:
+                        pending.add(asyncio.ensure_future(save(result)))
+                    else:
+                        yield result
+        finally:
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+            await results.aclose()
+
+    @staticmethod
+    async def _save_result(
+        drive_client: Any,
+        context_manager: Any,
+        item: Dict[str, Any],
+        result: Dict[str, Any],
+        folder: Optional[str],
+        default_folder: Optional[str],
+        code_index: Any
+    ) -> Dict[str, Any]:
+        """생성 결과 하나를 Drive에 저장 (실패해도 예외 대신 오류 정보 반환)"""
+        try:
+            saved = await DriveTool.save_file(
+                drive_client,
+                context_manager,
+                {"content": result["code"], "filename": item["filename"], "folder": folder},
+                default_folder,
+                code_index=code_index
+            )
+        except Exception as e:
+            return {"success": False, "error": str(e)}
+        return {key: saved[key] for key in ("success", "file_id", "filename", "web_view_link", "status")}
+
+    @staticmethod
+    async def _stream(
+        gemini_client: GeminiClient,
+        prompt: str,
+        language: Optional[str],
+        context: Optional[str],
+        use_cache: bool,
+        progress_callback: Callable[..., Any]
+    ) -> Dict[str, str]:
+        """스트리밍으로 생성하며 응답 조각을 진행 알림으로 전달"""
+        received = 0
+        result = None
+        async for event in gemini_client.stream_code(
+            prompt=prompt,
+            language=language,
+            context=context,
+            use_cache=use_cache
+        ):
+            if event["type"] == "done":
+                result = event
+                continue
+
+            received += len(event["text"])
+            notified = progress_callback(received, None, message=event["text"])
+            if inspect.isawaitable(notified):
+                await notified
+
+        return result
@@ -1,6 +1,7 @@
 """환경 설정 관리"""
 import os
 from pathlib import Path
+from typing import Optional
 from dotenv import load_dotenv
 
 
@@ -39,6 +40,96 @@ class Config:
         """Gemini API 키 반환"""
         return os.getenv("GEMINI_API_KEY", "")
 
+    @staticmethod
+    def get_gemini_max_concurrency() -> int:
+        """동시에 실행할 수 있는 Gemini 생성 요청 수 (나머지는 대기열에서 기다림)"""
+        return int(os.getenv("GEMINI_MAX_CONCURRENCY", "4"))
+
+    @staticmethod
+    def get_gemini_request_timeout() -> float:
+        """Gemini 생성 요청 하나의 최대 시간 (초)"""
+        return float(os.getenv("GEMINI_REQUEST_TIMEOUT", "120"))
+
+    @staticmethod
+    def get_gemini_backend() -> str:
+        """Gemini 모델 백엔드 (genai: 실제 API, stub: 고정 응답을 돌려주는 오프라인 백엔드)"""
+        return os.getenv("GEMINI_BACKEND", "genai").lower()
+
+    @staticmethod
+    def get_gemini_context_cache_enabled() -> bool:
+        """고정 지시문을 Gemini 컨텍스트 캐시(cached content)로 등록할지 여부"""
+        return os.getenv("GEMINI_CONTEXT_CACHE", "true").lower() in ("1", "true", "yes")
+
+    @staticmethod
+    def get_gemini_context_cache_ttl() -> float:
+        """Gemini 컨텍스트 캐시 유효 시간 (초, 절반이 지나면 사용 시 연장)"""
+        return float(os.getenv("GEMINI_CONTEXT_CACHE_TTL", "3600"))
+
+    @staticmethod
+    def get_gemini_context_cache_min_tokens() -> int:
+        """컨텍스트 캐시로 등록할 지시문의 최소 토큰 수 (모델의 캐시 최소 크기보다 작으면 등록 실패)"""
+        return int(os.getenv("GEMINI_CONTEXT_CACHE_MIN_TOKENS", "1024"))
+
+    @staticmethod
+    def get_gemini_batch_concurrency() -> int:
+        """일괄 생성(generate_batch)에서 동시에 생성할 항목 수"""
+        return int(os.getenv("GEMINI_BATCH_CONCURRENCY", "4"))
+
+    @staticmethod
+    def get_gemini_batch_rate_limit_rpm() -> float:
+        """일괄 생성의 분당 최대 요청 수 (0이면 제한 없음)"""
+        return float(os.getenv("GEMINI_BATCH_RATE_LIMIT_RPM", "60"))
+
+    @staticmethod
+    def get_response_cache_enabled() -> bool:
+        """Gemini 응답 캐시 사용 여부"""
+        return os.getenv("RESPONSE_CACHE", "true").lower() in ("1", "true", "yes")
+
+    @staticmethod
+    def get_response_cache_ttl() -> float:
+        """Gemini 응답 캐시 유효 시간 (초)"""
+        return float(os.getenv("RESPONSE_CACHE_TTL", "86400"))
+
+    @staticmethod
+    def get_response_cache_memory_entries() -> int:
+        """Gemini 응답 캐시 메모리 계층 최대 항목 수"""
+        return int(os.getenv("RESPONSE_CACHE_MEMORY_ENTRIES", "256"))
+
+    @staticmethod
+    def get_response_cache_disk_bytes() -> int:
+        """Gemini 응답 캐시 디스크 계층 최대 크기 (바이트)"""
+        return int(os.getenv("RESPONSE_CACHE_DISK_BYTES", str(64 * 1024 * 1024)))
+
+    @staticmethod
+    def get_semantic_cache_enabled() -> bool:
+        """의미 기반 프롬프트 캐시 사용 여부 (numpy 필요)"""
+        return os.getenv("SEMANTIC_CACHE", "false").lower() in ("1", "true", "yes")
+
+    @staticmethod
+    def get_semantic_cache_threshold() -> float:
+        """의미 기반 캐시 적중으로 볼 최소 코사인 유사도"""
+        return float(os.getenv("SEMANTIC_CACHE_THRESHOLD", "0.92"))
+
+    @staticmethod
+    def get_semantic_cache_max_entries() -> int:
+        """의미 기반 캐시 최대 항목 수"""
+        return int(os.getenv("SEMANTIC_CACHE_MAX_ENTRIES", "1000"))
+
+    @staticmethod
+    def get_semantic_cache_embedder() -> str:
+        """의미 기반 캐시 임베더 (gemini: Gemini 임베딩 API, hashing: 로컬 n-gram 해싱)"""
+        return os.getenv("SEMANTIC_CACHE_EMBEDDER", "gemini").lower()
+
+    @staticmethod
+    def get_semantic_cache_embedding_model() -> str:
+        """의미 기반 캐시에 사용할 Gemini 임베딩 모델"""
+        return os.getenv("SEMANTIC_CACHE_EMBEDDING_MODEL", "models/text-embedding-004")
+
+    @staticmethod
+    def get_context_max_tokens() -> int:
+        """코드 생성 요청에 함께 보낼 이전 대화 컨텍스트의 토큰 예산"""
+        return int(os.getenv("CONTEXT_MAX_TOKENS", "4000"))
+
     @staticmethod
     def get_credentials_path() -> Path:
         """Google OAuth 인증 파일 경로"""
@@ -65,6 +156,138 @@ class Config:
         log_file = os.getenv("LOG_FILE", "logs/mcp_server.log")
         return Config.get_project_root() / log_file
 
+    @staticmethod
+    def get_cache_dir() -> Path:
+        """로컬 캐시 디렉토리 반환"""
+        cache_dir = os.getenv("CACHE_DIR", "cache")
+        return Config.get_project_root() / cache_dir
+
+    @staticmethod
+    def get_folder_cache_ttl() -> int:
+        """폴더 ID 캐시 유효 시간 (초)"""
+        return int(os.getenv("FOLDER_CACHE_TTL", "86400"))
+
+    @staticmethod
+    def get_folder_cache_size() -> int:
+        """폴더 ID 캐시 최대 항목 수"""
+        return int(os.getenv("FOLDER_CACHE_SIZE", "1024"))
+
+    @staticmethod
+    def get_drive_max_concurrency() -> int:
+        """동시에 실행할 수 있는 Drive 요청 수"""
+        return int(os.getenv("DRIVE_MAX_CONCURRENCY", "8"))
+
+    @staticmethod
+    def get_drive_pool_size() -> Optional[int]:
+        """Drive HTTP 연결 풀 크기 (None이면 동시 실행 수와 같게)"""
+        value = os.getenv("DRIVE_POOL_SIZE")
+        return int(value) if value else None
+
+    @staticmethod
+    def get_drive_pool_timeout() -> float:
+        """Drive HTTP 연결 대여 대기 최대 시간 (초)"""
+        return float(os.getenv("DRIVE_POOL_TIMEOUT", "60"))
+
+    @staticmethod
+    def get_drive_rate_limit_qps() -> float:
+        """Drive 요청 초당 허용 수 (0이면 속도 제한 안 함)"""
+        return float(os.getenv("DRIVE_RATE_LIMIT_QPS", "20"))
+
+    @staticmethod
+    def get_drive_rate_limit_burst() -> float:
+        """Drive 요청 순간 허용량 (토큰 버킷 크기)"""
+        return float(os.getenv("DRIVE_RATE_LIMIT_BURST", "40"))
+
+    @staticmethod
+    def get_drive_max_retries() -> int:
+        """Drive 요청 재시도 최대 횟수 (속도 제한/서버 오류)"""
+        return int(os.getenv("DRIVE_MAX_RETRIES", "5"))
+
+    @staticmethod
+    def get_drive_retry_base_delay() -> float:
+        """Drive 재시도 첫 대기 시간 (초, 재시도마다 2배)"""
+        return float(os.getenv("DRIVE_RETRY_BASE_DELAY", "1"))
+
+    @staticmethod
+    def get_drive_retry_max_delay() -> float:
+        """Drive 재시도 최대 대기 시간 (초)"""
+        return float(os.getenv("DRIVE_RETRY_MAX_DELAY", "32"))
+
+    @staticmethod
+    def get_drive_retry_after_max() -> float:
+        """Drive 서버가 Retry-After로 요구한 대기 시간의 상한 (초, 이보다 길면 재시도하지 않음)"""
+        return float(os.getenv("DRIVE_RETRY_AFTER_MAX", "300"))
+
+    @staticmethod
+    def get_drive_sync_concurrency() -> int:
+        """폴더 동기화 시 동시에 전송할 파일 수"""
+        return int(os.getenv("DRIVE_SYNC_CONCURRENCY", "4"))
+
+    @staticmethod
+    def get_code_index_refresh_interval() -> int:
+        """코드 검색 인덱스를 Drive 폴더와 다시 동기화하기 전 최소 간격 (초)"""
+        return int(os.getenv("CODE_INDEX_REFRESH_INTERVAL", "300"))
+
+    @staticmethod
+    def get_code_index_max_file_bytes() -> int:
+        """코드 검색 인덱스에 포함할 파일 최대 크기 (바이트)"""
+        return int(os.getenv("CODE_INDEX_MAX_FILE_BYTES", str(1024 * 1024)))
+
+    @staticmethod
+    def get_read_many_concurrency() -> int:
+        """여러 파일 읽기 시 동시에 다운로드할 파일 수"""
+        return int(os.getenv("READ_MANY_CONCURRENCY", "8"))
+
+    @staticmethod
+    def get_read_many_max_bytes() -> int:
+        """여러 파일 읽기 시 전체 내용 최대 크기 (바이트)"""
+        return int(os.getenv("READ_MANY_MAX_BYTES", str(2 * 1024 * 1024)))
+
+    @staticmethod
+    def get_drive_resumable_threshold() -> int:
+        """재개 가능(청크) 업로드를 사용할 최소 파일 크기 (바이트)"""
+        return int(os.getenv("DRIVE_RESUMABLE_THRESHOLD", str(5 * 1024 * 1024)))
+
+    @staticmethod
+    def get_drive_upload_chunk_size() -> int:
+        """재개 가능 업로드 청크 크기 (바이트, 256KiB 배수로 올림)"""
+        return int(os.getenv("DRIVE_UPLOAD_CHUNK_SIZE", str(8 * 1024 * 1024)))
+
+    @staticmethod
+    def get_drive_upload_chunk_retries() -> int:
+        """청크 전송 실패 시 이어서 재시도할 횟수"""
+        return int(os.getenv("DRIVE_UPLOAD_CHUNK_RETRIES", "5"))
+
+    @staticmethod
+    def get_drive_download_chunk_size() -> int:
+        """스트리밍 다운로드 청크 크기 (바이트)"""
+        return int(os.getenv("DRIVE_DOWNLOAD_CHUNK_SIZE", str(1024 * 1024)))
+
+    @staticmethod
+    def get_drive_metadata_index_enabled() -> bool:
+        """로컬 Drive 메타데이터 인덱스 사용 여부"""
+        return os.getenv("DRIVE_METADATA_INDEX", "true").lower() in ("1", "true", "yes")
+
+    @staticmethod
+    def get_drive_index_sync_interval() -> int:
+        """메타데이터 인덱스 증분 동기화 간격 (초)"""
+        return int(os.getenv("DRIVE_INDEX_SYNC_INTERVAL", "30"))
+
+    @staticmethod
+    def get_content_cache_enabled() -> bool:
+        """Drive 파일 내용 캐시 사용 여부"""
+        return os.getenv("CONTENT_CACHE", "true").lower() in ("1", "true", "yes")
+
+    @staticmethod
+    def get_content_cache_memory_bytes() -> int:
+        """내용 캐시 메모리 계층 최대 크기 (바이트)"""
+        return int(os.getenv("CONTENT_CACHE_MEMORY_BYTES", str(32 * 1024 * 1024)))
+
+    @staticmethod
+    def get_content_cache_disk_bytes() -> int:
+        """내용 캐시 디스크 계층 최대 크기 (바이트)"""
+        return int(os.getenv("CONTENT_CACHE_DISK_BYTES", str(256 * 1024 * 1024)))
+
     @staticmethod
     def ensure_dir(directory: Path):
         """디렉토리 생성"""
@@ -0,0 +1,96 @@
+"""토큰 버킷 속도 제한"""
+import asyncio
+import threading
+import time
+from typing import Dict
+
+
+class TokenBucket:
+    """
+    초당 rate개, 최대 capacity개까지 쌓이는 토큰 버킷
+
+    대기는 호출한 쪽에서 하도록 필요한 대기 시간만 계산하므로(reserve),
+    여러 스레드와 서로 다른 이벤트 루프에서 하나의 버킷을 함께 쓸 수 있습니다.
+    """
+
+    def __init__(self, rate: float, capacity: float):
+        """
+        토큰 버킷 초기화
+
+        Args:
+            rate: 초당 보충되는 토큰 수
+            capacity: 최대 토큰 수 (순간 허용량)
+        """
+        self.rate = rate
+        self.capacity = max(1.0, capacity)
+
+        self._tokens = self.capacity
+        self._updated_at = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+        self._stats = {
+            "reservations": 0,
+            "throttled": 0,
+            "wait_seconds": 0.0
+        }
+
+    def reserve(self, tokens: float = 1) -> float:
+        """
+        토큰 예약 후 사용 전까지 기다려야 할 시간 반환
+
+        토큰이 부족하면 미리 차감(음수 허용)해 두므로, 반환된 시간만큼 기다린 뒤 요청하면
+        여러 호출자가 동시에 예약해도 전체 속도가 rate를 넘지 않습니다.
+
+        Args:
+            tokens: 사용할 토큰 수
+
+        Returns:
+            float: 대기 시간 (초, 0이면 즉시 사용 가능)
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated_at) * self.rate)
+            self._updated_at = now
+
+            self._tokens -= tokens
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+            wait = max(wait, self._paused_until - now)
+
+            self._stats["reservations"] += 1
+            if wait > 0:
+                self._stats["throttled"] += 1
+                self._stats["wait_seconds"] += wait
+
+            return wait
+
+    async def acquire(self, tokens: float = 1):
+        """
+        토큰을 사용할 수 있을 때까지 비동기 대기
+
+        Args:
+            tokens: 사용할 토큰 수
+        """
+        wait = self.reserve(tokens)
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    def pause(self, seconds: float):
+        """
+        일정 시간 동안 모든 예약을 지연 (서버가 Retry-After로 속도를 낮추라고 할 때)
+
+        Args:
+            seconds: 지연 시간 (초)
+        """
+        with self._lock:
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+
+    def stats(self) -> Dict[str, float]:
+        """
+        버킷 통계 반환
+
+        Returns:
+            Dict: 예약 횟수, 대기한 횟수, 총 대기 시간
+        """
+        with self._lock:
+            return dict(self._stats)
@@ -0,0 +1,28 @@
+"""토큰 수 추정 (API 호출 없는 근사치)"""
+import math
+
+
+# ASCII 문자(영문, 코드) 몇 개가 토큰 하나인지 (코드는 기호가 많아 영어 문장보다 짧게 잡음)
+ASCII_CHARS_PER_TOKEN = 3.5
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    Gemini 토큰 수 근사치
+
+    SentencePiece 계열 토크나이저는 영문/코드를 3~4자당 한 토큰, 한글 등 비ASCII 문자는
+    대략 한두 글자당 한 토큰으로 나누므로, 비ASCII 문자는 글자당 한 토큰으로 넉넉하게 셉니다.
+    인코딩 한 번으로 계산하므로 긴 텍스트에도 빠릅니다.
+
+    Args:
+        text: 입력 텍스트
+
+    Returns:
+        int: 추정 토큰 수 (빈 문자열이면 0)
+    """
+    if not text:
+        return 0
+
+    ascii_chars = len(text.encode('ascii', 'ignore'))
+    non_ascii_chars = len(text) - ascii_chars
+    return math.ceil(ascii_chars / ASCII_CHARS_PER_TOKEN) + non_ascii_chars
@@ -1,7 +1,10 @@
 """파일 관리 API"""
 import asyncio
-from flask import Blueprint, request, jsonify, current_app
+from typing import Iterator
+from urllib.parse import quote
+from flask import Blueprint, Response, request, jsonify, current_app, stream_with_context
 from src.utils.logger import setup_logger
+from src.web.api.streaming import iterate_async
 
 files_bp = Blueprint('files', __name__)
 logger = setup_logger('api.files')
@@ -75,15 +78,17 @@ def list_files():
 @files_bp.route('/file/<file_id>', methods=['GET'])
 def get_file(file_id):
     """
-    Drive 파일 읽기 API
+    Drive 파일 읽기 API (스트리밍)
 
-    Response:
-    {
-        "success": true,
-        "filename": "fibonacci.py",
-        "content": "def fibonacci(n): ...",
-        "language": "python"
-    }
+    파일 내용을 Drive에서 받는 즉시 청크 단위로 전달합니다.
+    첫 청크를 받기 전에 실패하면 JSON 오류(500)를 반환하고, 전송 도중 실패하면
+    서버 로그에 기록한 뒤 연결을 끊습니다. (Content-Length보다 짧은 응답으로 중단을 감지)
+
+    Response: text/plain; charset=utf-8
+    Headers:
+    - X-File-Name: 파일 이름 (URL 인코딩)
+    - X-Language: 파일 확장자로 추정한 언어
+    - Content-Length: 파일 크기 (Drive가 크기를 제공하는 파일만)
     """
     try:
         drive_client = get_drive_client()
@@ -97,22 +102,32 @@ def get_file(file_id):
         loop = asyncio.new_event_loop()
         asyncio.set_event_loop(loop)
         try:
-            result = loop.run_until_complete(
-                drive_client.download_file(file_id)
+            metadata = loop.run_until_complete(
+                drive_client.get_file_metadata(file_id, fields='id, name, size')
             )
         finally:
             loop.close()
 
         # 파일 확장자로 언어 추정
-        filename = result['file_name']
+        filename = metadata['name']
         language = _detect_language_from_filename(filename)
 
-        return jsonify({
-            'success': True,
-            'filename': filename,
-            'content': result['content'],
-            'language': language
-        })
+        # 첫 청크까지 받아 본 뒤 응답 시작 (다운로드 시작 오류는 JSON으로 반환)
+        chunks = iterate_async(drive_client.stream_text(file_id))
+        first = next(chunks, '')
+
+        headers = {
+            'X-File-Name': quote(filename),
+            'X-Language': language
+        }
+        if metadata.get('size') is not None:
+            headers['Content-Length'] = str(metadata['size'])
+
+        return Response(
+            stream_with_context(_stream_body(file_id, first, chunks)),
+            mimetype='text/plain',
+            headers=headers
+        )
 
     except Exception as e:
         logger.error(f"파일 읽기 오류: {e}")
@@ -122,6 +137,17 @@ def get_file(file_id):
         }), 500
 
 
+def _stream_body(file_id: str, first: str, chunks: Iterator[str]) -> Iterator[str]:
+    """이미 받은 첫 청크에 이어 나머지를 전달 (전송 중 오류는 기록 후 연결 중단)"""
+    try:
+        if first:
+            yield first
+        yield from chunks
+    except Exception as e:
+        logger.error(f"파일 스트리밍 중단 ({file_id}): {e}")
+        raise
+
+
 def _detect_language_from_filename(filename: str) -> str:
     """파일명에서 언어 감지"""
     ext_map = {
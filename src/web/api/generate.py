@@ -1,8 +1,13 @@
 """코드 생성 API"""
 import asyncio
-from flask import Blueprint, request, jsonify, current_app
+import json
+from typing import Optional, Dict, Any, AsyncIterator
+from flask import Blueprint, request, jsonify, current_app, Response, stream_with_context
+from src.tools.gemini_tool import GeminiTool, MAX_BATCH_ITEMS
+from src.utils.config import Config
 from src.utils.logger import setup_logger
 from src.utils.github_manager import GitHubManager
+from src.web.api.streaming import iterate_async
 
 generate_bp = Blueprint('generate', __name__)
 logger = setup_logger('api.generate')
@@ -27,7 +32,8 @@ def generate_code():
     {
         "prompt": "Python으로 피보나치 수열 만들어줘",
         "language": "python",  // 선택사항
-        "context_id": "session_id"  // 선택사항
+        "context_id": "session_id",  // 선택사항
+        "bypass_cache": false  // 선택사항, true면 캐시된 응답을 사용하지 않음
     }
 
     Response:
@@ -74,75 +80,312 @@ def generate_code():
             except Exception as e:
                 logger.warning(f"컨텍스트 로드 실패: {e}")
 
-        # 한글 최적화 프롬프트 구성
-        optimized_prompt = _build_korean_prompt(prompt, language)
-
         # 코드 생성 (async 함수를 동기로 실행)
         loop = asyncio.new_event_loop()
         asyncio.set_event_loop(loop)
         try:
             result = loop.run_until_complete(
                 gemini_client.generate_code(
-                    prompt=optimized_prompt,
+                    prompt=prompt,
                     language=language,
                     context=context,
-                    image_base64=image_base64
+                    image_base64=image_base64,
+                    use_cache=not data.get('bypass_cache', False),
+                    # 한글 최적화 지시문
+                    instruction_set='korean'
                 )
             )
         finally:
             loop.close()
 
-        # GitHub에 푸시 (옵션)
-        github_url = None
-        if push_to_github and result.get('code'):
-            try:
-                github_manager = get_github_manager()
-                push_result = github_manager.create_and_push_project(
-                    project_name=project_name,
-                    code=result['code'],
-                    language=result.get('language', 'python'),
-                    commit_message=f"Generated by Gemini: {prompt[:50]}"
-                )
+        return jsonify(_complete_generation(
+            result, prompt, project_name, push_to_github, context_manager
+        ))
 
-                if push_result.get('success'):
-                    github_url = push_result.get('github_url')
-                    logger.info(f"Successfully pushed to GitHub: {github_url}")
-                else:
-                    logger.warning(f"Failed to push to GitHub: {push_result.get('error')}")
-            except Exception as e:
-                logger.error(f"GitHub push error: {e}")
+    except Exception as e:
+        logger.error(f"코드 생성 오류: {e}")
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
 
-        # 컨텍스트 저장
-        if context_manager:
-            context_manager.add_interaction(
-                user_message=prompt,
-                assistant_response=result['code']
-            )
-            session_id = context_manager.session_id
-        else:
-            session_id = None
 
-        response_data = {
-            'success': True,
-            'code': result['code'],
-            'language': result['language'],
-            'explanation': result.get('explanation', ''),
-            'session_id': session_id
+@generate_bp.route('/generate/stream', methods=['POST'])
+def generate_code_stream():
+    """
+    코드 생성 스트리밍 API (Server-Sent Events)
+
+    Request: /api/generate와 같음
+
+    Response (text/event-stream):
+        event: chunk
+        data: {"text": "응답 조각", "code": "이번 조각에서 추출된 코드"}
+
+        event: done
+        data: /api/generate 응답과 같은 JSON
+
+        event: error
+        data: {"success": false, "error": "오류 메시지"}
+    """
+    gemini_client = get_gemini_client()
+    context_manager = get_context_manager()
+
+    data = request.get_json()
+    if not data or 'prompt' not in data:
+        return jsonify({
+            'success': False,
+            'error': 'prompt 필드가 필요합니다'
+        }), 400
+
+    if not gemini_client:
+        return jsonify({
+            'success': False,
+            'error': 'Gemini 클라이언트가 초기화되지 않았습니다'
+        }), 500
+
+    prompt = data['prompt']
+    language = data.get('language')
+    context_id = data.get('context_id')
+    image_base64 = data.get('image')
+    project_name = data.get('project_name', 'generated-project')
+    push_to_github = data.get('push_to_github', False)
+
+    # 컨텍스트 로드 (선택사항)
+    context = None
+    if context_id and context_manager:
+        try:
+            context_manager.load_session(context_id)
+            context = context_manager.get_context()
+        except Exception as e:
+            logger.warning(f"컨텍스트 로드 실패: {e}")
+
+    async def events() -> AsyncIterator[str]:
+        try:
+            async for event in gemini_client.stream_code(
+                prompt=prompt,
+                language=language,
+                context=context,
+                image_base64=image_base64,
+                use_cache=not data.get('bypass_cache', False),
+                instruction_set='korean'
+            ):
+                if event['type'] == 'chunk':
+                    yield _sse('chunk', {'text': event['text'], 'code': event['code']})
+                else:
+                    yield _sse('done', _complete_generation(
+                        event, prompt, project_name, push_to_github, context_manager
+                    ))
+        except Exception as e:
+            logger.error(f"코드 생성 스트리밍 오류: {e}")
+            yield _sse('error', {'success': False, 'error': str(e)})
+
+    return Response(
+        stream_with_context(iterate_async(events())),
+        mimetype='text/event-stream',
+        headers={
+            'Cache-Control': 'no-cache',
+            # 프록시(nginx 등)가 이벤트를 모아서 보내지 않도록
+            'X-Accel-Buffering': 'no'
         }
+    )
 
-        # GitHub URL 추가
-        if github_url:
-            response_data['github_url'] = github_url
 
-        return jsonify(response_data)
+@generate_bp.route('/generate/batch', methods=['POST'])
+def generate_code_batch():
+    """
+    일괄 코드 생성 API (Server-Sent Events)
 
-    except Exception as e:
-        logger.error(f"코드 생성 오류: {e}")
+    Request:
+    {
+        "items": [
+            {"prompt": "...", "language": "python", "filename": "test_a.py"},  // language, filename 선택
+            ...
+        ],
+        "context_id": "session_id",  // 선택사항
+        "concurrency": 4,  // 선택사항, 동시 생성 수
+        "bypass_cache": false,  // 선택사항
+        "save_to_drive": false,  // 선택사항, true면 각 결과를 filename으로 Drive에 저장
+        "folder": "폴더 이름"  // 선택사항
+    }
+
+    Response (text/event-stream, 항목이 끝나는 순서대로):
+        event: result
+        data: {"index": 0, "success": true, "code": "...", "language": "...", "explanation": "...",
+               "drive": {"success": true, "file_id": "...", "filename": "...", "web_view_link": "...",
+                         "status": "created"}}  // drive는 저장 시, 저장이 끝난 뒤 전송
+        data: {"index": 1, "success": false, "error": "오류 메시지"}  // 항목별 실패
+
+        event: done
+        data: {"success": true, "succeeded": 성공 수, "failed": 실패 수, "session_id": "..."}
+
+        event: error
+        data: {"success": false, "error": "오류 메시지"}
+    """
+    gemini_client = get_gemini_client()
+    context_manager = get_context_manager()
+    drive_client = current_app.config.get('DRIVE_CLIENT')
+    code_index = current_app.config.get('CODE_INDEX')
+
+    data = request.get_json()
+    items = data.get('items') if data else None
+    if not items or not isinstance(items, list):
         return jsonify({
             'success': False,
-            'error': str(e)
+            'error': 'items 필드가 필요합니다'
+        }), 400
+
+    if len(items) > MAX_BATCH_ITEMS:
+        return jsonify({
+            'success': False,
+            'error': f'한 번에 최대 {MAX_BATCH_ITEMS}개까지 생성할 수 있습니다'
+        }), 400
+
+    if not gemini_client:
+        return jsonify({
+            'success': False,
+            'error': 'Gemini 클라이언트가 초기화되지 않았습니다'
         }), 500
 
+    save_to_drive = data.get('save_to_drive', False)
+    if save_to_drive:
+        if not drive_client:
+            return jsonify({
+                'success': False,
+                'error': 'Drive 클라이언트가 초기화되지 않았습니다'
+            }), 500
+        if not context_manager:
+            return jsonify({
+                'success': False,
+                'error': 'Context Manager가 초기화되지 않았습니다'
+            }), 500
+        if not all(isinstance(item, dict) and item.get('filename') for item in items):
+            return jsonify({
+                'success': False,
+                'error': 'Drive에 저장하려면 모든 항목에 filename이 필요합니다'
+            }), 400
+
+    # 컨텍스트 로드 (선택사항)
+    context = None
+    context_id = data.get('context_id')
+    if context_id and context_manager:
+        try:
+            context_manager.load_session(context_id)
+            context = context_manager.get_context()
+        except Exception as e:
+            logger.warning(f"컨텍스트 로드 실패: {e}")
+
+    async def events() -> AsyncIterator[str]:
+        succeeded = failed = 0
+        try:
+            async for result in GeminiTool.iter_batch(
+                gemini_client,
+                context_manager,
+                items,
+                concurrency=int(data['concurrency']) if data.get('concurrency') else None,
+                context=context,
+                use_cache=not data.get('bypass_cache', False),
+                instruction_set='korean',
+                drive_client=drive_client if save_to_drive else None,
+                folder=data.get('folder'),
+                default_folder=Config.get_drive_folder_name(),
+                code_index=code_index
+            ):
+                if result['success']:
+                    succeeded += 1
+                    if context_manager:
+                        context_manager.add_interaction(
+                            user_message=items[result['index']]['prompt'],
+                            assistant_response=result['code']
+                        )
+                else:
+                    failed += 1
+                yield _sse('result', result)
+
+            yield _sse('done', {
+                'success': True,
+                'succeeded': succeeded,
+                'failed': failed,
+                'session_id': context_manager.session_id if context_manager else None
+            })
+        except Exception as e:
+            logger.error(f"일괄 코드 생성 오류: {e}")
+            yield _sse('error', {'success': False, 'error': str(e)})
+
+    return Response(
+        stream_with_context(iterate_async(events())),
+        mimetype='text/event-stream',
+        headers={
+            'Cache-Control': 'no-cache',
+            'X-Accel-Buffering': 'no'
+        }
+    )
+
+
+def _sse(event: str, data: Dict[str, Any]) -> str:
+    """Server-Sent Events 메시지 한 건"""
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+
+def _complete_generation(
+    result: Dict[str, Any],
+    prompt: str,
+    project_name: str,
+    push_to_github: bool,
+    context_manager: Any
+) -> Dict[str, Any]:
+    """생성 결과를 GitHub에 푸시(옵션)하고 컨텍스트에 저장한 뒤 응답 데이터 구성"""
+    # GitHub에 푸시 (옵션)
+    github_url = None
+    if push_to_github and result.get('code'):
+        github_url = _push_to_github(project_name, prompt, result)
+
+    # 컨텍스트 저장
+    if context_manager:
+        context_manager.add_interaction(
+            user_message=prompt,
+            assistant_response=result['code']
+        )
+        session_id = context_manager.session_id
+    else:
+        session_id = None
+
+    response_data = {
+        'success': True,
+        'code': result['code'],
+        'language': result['language'],
+        'explanation': result.get('explanation', ''),
+        'session_id': session_id
+    }
+
+    # GitHub URL 추가
+    if github_url:
+        response_data['github_url'] = github_url
+
+    return response_data
+
+
+def _push_to_github(project_name: str, prompt: str, result: Dict[str, Any]) -> Optional[str]:
+    """생성된 코드를 GitHub에 푸시하고 저장소 URL 반환 (실패 시 None)"""
+    try:
+        github_manager = get_github_manager()
+        push_result = github_manager.create_and_push_project(
+            project_name=project_name,
+            code=result['code'],
+            language=result.get('language', 'python'),
+            commit_message=f"Generated by Gemini: {prompt[:50]}"
+        )
+
+        if push_result.get('success'):
+            github_url = push_result.get('github_url')
+            logger.info(f"Successfully pushed to GitHub: {github_url}")
+            return github_url
+
+        logger.warning(f"Failed to push to GitHub: {push_result.get('error')}")
+    except Exception as e:
+        logger.error(f"GitHub push error: {e}")
+
+    return None
+
 
 @generate_bp.route('/modify', methods=['POST'])
 def modify_code():
@@ -208,25 +451,6 @@ def modify_code():
         }), 500
 
 
-def _build_korean_prompt(user_input: str, language: str = None) -> str:
-    """한글 최적화 프롬프트 구성"""
-    lang_hint = f"언어: {language}" if language else ""
-
-    return f"""당신은 한국어를 완벽하게 이해하는 코드 생성 AI입니다.
-
-사용자 요청: {user_input}
-{lang_hint}
-
-규칙:
-1. 한국어 요청을 정확히 이해하고 코드로 변환
-2. 상세한 한글 주석 포함
-3. 초보자도 이해할 수 있게 설명
-4. 실행 가능한 완전한 코드 작성
-5. 코드 블록(```)으로 감싸기
-
-코드를 생성하세요:"""
-
-
 def _build_modification_prompt(original_code: str, modification: str) -> str:
     """코드 수정 프롬프트 구성"""
     return f"""원본 코드:
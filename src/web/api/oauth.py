@@ -65,32 +65,20 @@ def callback():
         # 인증 코드로 토큰 교환
         oauth_flow.fetch_token(authorization_response=request.url)
 
-        # 토큰 저장
-        credentials = oauth_flow.credentials
+        # 토큰 저장 (같은 토큰 파일을 쓰는 모든 Drive 클라이언트에 즉시 반영)
+        from src.clients.credentials_manager import CredentialsManager
         config = Config()
-        token_path = config.get_project_root() / 'config' / 'token.json'
-
-        # 토큰을 JSON 파일로 저장
-        import json
-        token_data = {
-            'token': credentials.token,
-            'refresh_token': credentials.refresh_token,
-            'token_uri': credentials.token_uri,
-            'client_id': credentials.client_id,
-            'client_secret': credentials.client_secret,
-            'scopes': credentials.scopes
-        }
-
-        with open(token_path, 'w') as f:
-            json.dump(token_data, f)
+        creds_path = config.get_credentials_path()
+        token_path = config.get_token_path()
+        CredentialsManager.get(creds_path, token_path).update(oauth_flow.credentials)
 
         logger.info("OAuth 토큰 저장 완료")
 
-        # Drive 클라이언트 재초기화
-        from src.clients.drive_client import DriveClient
-        creds_path = config.get_credentials_path()
-        current_app.config['DRIVE_CLIENT'] = DriveClient(str(creds_path))
-        logger.info("Drive 클라이언트 재초기화 성공")
+        # Drive 클라이언트가 없을 때만 생성 (기존 클라이언트는 공유 자격 증명을 그대로 사용)
+        if current_app.config.get('DRIVE_CLIENT') is None:
+            from src.clients.drive_client import DriveClient
+            current_app.config['DRIVE_CLIENT'] = DriveClient(str(creds_path), str(token_path))
+            logger.info("Drive 클라이언트 초기화 성공")
 
         # 성공 페이지 반환
         return """
@@ -0,0 +1,33 @@
+"""Flask 스트리밍 응답 유틸리티"""
+import asyncio
+from typing import AsyncIterator, Iterator, TypeVar
+
+T = TypeVar('T')
+
+
+def iterate_async(async_iterator: AsyncIterator[T]) -> Iterator[T]:
+    """
+    비동기 이터레이터를 동기 제너레이터로 변환
+
+    Flask 스트리밍 응답에서 사용하며, 요청 스레드 전용 이벤트 루프에서 항목을 하나씩 가져옵니다.
+
+    Args:
+        async_iterator: 비동기 이터레이터 (비동기 제너레이터 등)
+
+    Yields:
+        비동기 이터레이터의 각 항목
+    """
+    loop = asyncio.new_event_loop()
+    try:
+        while True:
+            try:
+                item = loop.run_until_complete(async_iterator.__anext__())
+            except StopAsyncIteration:
+                break
+            yield item
+    finally:
+        # 클라이언트 연결이 끊겨 중단된 경우 비동기 제너레이터 정리
+        aclose = getattr(async_iterator, 'aclose', None)
+        if aclose is not None:
+            loop.run_until_complete(aclose())
+        loop.close()
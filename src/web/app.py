@@ -18,6 +18,7 @@ sys.path.insert(0, str(project_root))
 
 from src.clients.gemini_client import GeminiClient
 from src.clients.drive_client import DriveClient
+from src.managers.code_index import CodeSearchIndex
 from src.managers.context_manager import ContextManager
 from src.utils.config import Config
 from src.utils.logger import setup_logger
@@ -62,6 +63,9 @@ def init_clients():
         app.config['CONTEXT_MANAGER'] = ContextManager()
         logger.info("Context Manager 초기화 성공")
 
+        # 코드 검색 인덱스 (MCP 서버와 같은 파일을 사용해 웹에서 저장한 파일도 검색에 반영)
+        app.config['CODE_INDEX'] = CodeSearchIndex(config.get_cache_dir() / "code_index.db")
+
         return True
 
     except Exception as e:
@@ -79,19 +83,28 @@ def index():
 def health_check():
     """헬스 체크 엔드포인트"""
     gemini_client = get_gemini_client()
+    drive_client = get_drive_client()
     context_manager = get_context_manager()
 
     return jsonify({
         'status': 'ok',
         'gemini_ready': gemini_client is not None,
-        'context_ready': context_manager is not None
+        'drive_ready': drive_client is not None,
+        'context_ready': context_manager is not None,
+        'drive_pool': drive_client.pool_stats() if drive_client else None,
+        'drive_requests': drive_client.request_stats() if drive_client else None,
+        'gemini_cache': gemini_client.cache_stats() if gemini_client else None,
+        'gemini_requests': gemini_client.request_stats() if gemini_client else None,
+        'gemini_tokens': gemini_client.token_stats() if gemini_client else None
     })
 
 
 # API 라우트 등록
 from src.web.api.generate import generate_bp
+from src.web.api.files import files_bp
 
 app.register_blueprint(generate_bp, url_prefix='/api')
+app.register_blueprint(files_bp, url_prefix='/api')
 
 
 if __name__ == '__main__':
@@ -148,21 +148,33 @@ generateBtn.addEventListener('click', async () => {
             requestBody.image = currentImageBase64;
         }
 
-        const response = await fetch('/api/generate', {
-            method: 'POST',
-            headers: { 'Content-Type': 'application/json' },
-            body: JSON.stringify(requestBody)
+        // 스트리밍 생성: 코드 조각을 받는 즉시 표시
+        codeOutput.textContent = '';
+        codeOutput.className = '';
+        explanation.style.display = 'none';
+        githubLink.style.display = 'none';
+
+        let streamedCode = '';
+        const data = await streamGenerate(requestBody, (chunk) => {
+            if (!chunk.code) {
+                return;
+            }
+            if (!streamedCode) {
+                // 첫 코드 조각이 도착하면 로딩 화면 대신 결과 영역 표시
+                showLoading(false);
+                resultSection.style.display = 'block';
+            }
+            streamedCode += chunk.code;
+            codeOutput.textContent = streamedCode;
         });
 
-        const data = await response.json();
-
         if (data.success) {
             currentCode = data.code;
             currentLanguage = data.language;
             currentSessionId = data.session_id;
             currentProjectName = projectName;
 
-            // 코드 표시
+            // 최종 코드 표시 (하이라이트는 완료 후 한 번만)
             codeOutput.textContent = data.code;
             codeOutput.className = `language-${data.language}`;
             Prism.highlightElement(codeOutput);
@@ -202,6 +214,62 @@ generateBtn.addEventListener('click', async () => {
     }
 });
 
+// 코드 생성 스트리밍 요청 (Server-Sent Events)
+// 조각마다 onChunk({text, code})를 호출하고, 최종 결과(/api/generate 응답과 같은 형식)를 반환
+async function streamGenerate(requestBody, onChunk) {
+    const response = await fetch('/api/generate/stream', {
+        method: 'POST',
+        headers: { 'Content-Type': 'application/json' },
+        body: JSON.stringify(requestBody)
+    });
+
+    if (!response.ok || !response.body) {
+        return await response.json();
+    }
+
+    const reader = response.body.getReader();
+    const decoder = new TextDecoder();
+    let buffer = '';
+    let result = { success: false, error: '응답이 중간에 끊어졌습니다' };
+
+    while (true) {
+        const { done, value } = await reader.read();
+        if (done) {
+            break;
+        }
+        buffer += decoder.decode(value, { stream: true });
+
+        // 이벤트는 빈 줄로 구분
+        let boundary;
+        while ((boundary = buffer.indexOf('\n\n')) !== -1) {
+            const message = buffer.slice(0, boundary);
+            buffer = buffer.slice(boundary + 2);
+
+            let event = 'message';
+            let data = '';
+            for (const line of message.split('\n')) {
+                if (line.startsWith('event: ')) {
+                    event = line.slice(7);
+                } else if (line.startsWith('data: ')) {
+                    data += line.slice(6);
+                }
+            }
+            if (!data) {
+                continue;
+            }
+
+            const payload = JSON.parse(data);
+            if (event === 'chunk') {
+                onChunk(payload);
+            } else {
+                result = payload;
+            }
+        }
+    }
+
+    return result;
+}
+
 // 코드 복사
 copyBtn.addEventListener('click', () => {
     navigator.clipboard.writeText(currentCode).then(() => {
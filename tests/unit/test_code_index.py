@@ -0,0 +1,108 @@
+"""CodeSearchIndex 단위 테스트"""
+import asyncio
+import hashlib
+
+import pytest
+
+from src.managers.code_index import CodeSearchIndex, FOLDER_MIME_TYPE
+
+
+class FakeDrive:
+    """폴더 목록과 다운로드만 흉내 내는 Drive 클라이언트 대역"""
+
+    def __init__(self, files):
+        self.files = files
+        self.downloaded = []
+
+    async def iter_files(self, folder_id=None, fields=None, order_by=None):
+        for file in self.files:
+            if file["parent"] == folder_id:
+                yield {key: value for key, value in file.items() if key not in ("content", "parent")}
+
+    async def download_files(self, file_ids, max_concurrency=None):
+        self.downloaded.extend(file_ids)
+        contents = {file["id"]: file.get("content") for file in self.files}
+        return [{"file_id": file_id, "content": contents[file_id]} for file_id in file_ids]
+
+
+def remote_file(file_id, name, content, parent="root", mime_type="text/plain"):
+    return {
+        "id": file_id, "name": name, "parent": parent, "mimeType": mime_type,
+        "size": str(len(content.encode("utf-8"))),
+        "md5Checksum": hashlib.md5(content.encode("utf-8")).hexdigest(),
+        "content": content
+    }
+
+
+class TestCodeSearchIndex:
+    @pytest.fixture
+    def index(self):
+        index = CodeSearchIndex()
+        index.update("f1", "app.py", "import os\n\ndef load_config():\n    return os.environ\n", "a")
+        index.update("f2", "config.py", "LOAD_CONFIG = True\n# load_config helper\nload_config()\n", "b")
+        index.update("f3", "README.md", "Usage: run app\n", "c")
+        return index
+
+    def test_substring_ranked_by_matches(self, index):
+        results = index.search("load_config")
+        assert [result["file_id"] for result in results] == ["f2", "f1"]
+        assert results[0]["match_count"] == 3
+        assert results[1]["snippets"] == [{"line": 3, "text": "def load_config():"}]
+
+    def test_case_sensitive(self, index):
+        results = index.search("LOAD_CONFIG", case_sensitive=True)
+        assert [result["file_id"] for result in results] == ["f2"]
+        assert results[0]["match_count"] == 1
+
+    def test_regex(self, index):
+        results = index.search(r"def \w+\(\)", regex=True)
+        assert [result["file_id"] for result in results] == ["f1"]
+
+        # 필수 리터럴이 없는 정규식은 전체 파일을 검사
+        results = index.search(r"^(import|Usage)", regex=True)
+        assert {result["file_id"] for result in results} == {"f1", "f3"}
+
+        with pytest.raises(ValueError):
+            index.search("(", regex=True)
+
+    def test_short_query_scans_all(self, index):
+        assert {result["file_id"] for result in index.search("os")} == {"f1"}
+
+    def test_update_skips_same_md5(self, index):
+        assert index.update("f1", "app.py", "changed", "a") is False
+        assert index.search("changed") == []
+
+        assert index.update("f1", "app.py", "changed", "a2") is True
+        assert [result["file_id"] for result in index.search("changed")] == ["f1"]
+        assert index.search("load_config", case_sensitive=True)[0]["file_id"] == "f2"
+
+    def test_required_literals(self):
+        assert CodeSearchIndex._required_literals(r"foo\d+bar") == ["foo", "bar"]
+        assert CodeSearchIndex._required_literals(r"foo|bar") == []
+        assert CodeSearchIndex._required_literals(r"ab.c") == []
+
+    def test_refresh_downloads_only_changes(self):
+        files = [
+            remote_file("folder", "lib", "", mime_type=FOLDER_MIME_TYPE),
+            remote_file("f1", "main.py", "print('hello')\n"),
+            remote_file("f2", "util.py", "def hello():\n    pass\n", parent="folder"),
+            remote_file("f3", "image.png", "binary", mime_type="image/png"),
+        ]
+        drive = FakeDrive(files)
+        index = CodeSearchIndex()
+
+        result = asyncio.run(index.refresh(drive, "root"))
+        assert result == {"indexed": 2, "removed": 0, "unchanged": 0, "failed": 0}
+        assert {hit["name"] for hit in index.search("hello")} == {"main.py", "lib/util.py"}
+        assert index.refreshed_at("root") is not None
+
+        # 내용이 바뀐 파일만 다시 다운로드하고, 사라진 파일은 색인에서 삭제
+        files[1].update(remote_file("f1", "main.py", "print('bye')\n"))
+        del files[2]
+        drive.downloaded.clear()
+
+        result = asyncio.run(index.refresh(drive, "root"))
+        assert result == {"indexed": 1, "removed": 1, "unchanged": 0, "failed": 0}
+        assert drive.downloaded == ["f1"]
+        assert index.search("hello") == []
+        assert len(index) == 1
@@ -0,0 +1,50 @@
+"""ContentCache 단위 테스트"""
+from src.managers.content_cache import ContentCache
+
+
+class TestContentCache:
+    def test_memory_hit_and_version_change(self):
+        cache = ContentCache()
+        cache.put("file1", "md5:a", b"hello")
+
+        assert cache.get("file1", "md5:a") == b"hello"
+        assert cache.get("file1", "md5:b") is None
+
+        stats = cache.stats()
+        assert stats["memory_hits"] == 1
+        assert stats["misses"] == 1
+
+    def test_new_version_replaces_old(self, tmp_path):
+        cache = ContentCache(cache_dir=tmp_path)
+        cache.put("file1", "md5:a", b"old")
+        cache.put("file1", "md5:b", b"new")
+
+        assert cache.get("file1", "md5:a") is None
+        assert len(list(tmp_path.glob("*.bin"))) == 1
+
+    def test_disk_tier_survives_restart(self, tmp_path):
+        ContentCache(cache_dir=tmp_path).put("file1", "md5:a", b"hello")
+
+        cache = ContentCache(cache_dir=tmp_path)
+        assert cache.get("file1", "md5:a") == b"hello"
+        assert cache.stats()["disk_hits"] == 1
+        assert cache.stats()["disk_bytes"] == 5
+
+    def test_memory_eviction(self):
+        cache = ContentCache(max_memory_bytes=10)
+        cache.put("file1", "t", b"12345")
+        cache.put("file2", "t", b"12345")
+        cache.put("file3", "t", b"12345")
+
+        assert cache.get("file1", "t") is None
+        assert cache.stats()["memory_evictions"] == 1
+        assert cache.stats()["memory_bytes"] == 10
+
+    def test_disk_eviction(self, tmp_path):
+        cache = ContentCache(cache_dir=tmp_path, max_memory_bytes=0, max_disk_bytes=10)
+        cache.put("file1", "t", b"12345")
+        cache.put("file2", "t", b"12345")
+        cache.put("file3", "t", b"12345")
+
+        assert cache.stats()["disk_evictions"] == 1
+        assert cache.stats()["disk_bytes"] == 10
@@ -0,0 +1,79 @@
+"""ContextManager 토큰 예산 컨텍스트 단위 테스트"""
+from src.managers.context_manager import ContextManager
+from src.utils.tokens import estimate_tokens
+
+
+def word_count(text):
+    return len(text.split())
+
+
+class CountingCounter:
+    """호출 횟수를 세는 토큰 카운터 (단어 수)"""
+
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self, text):
+        self.calls += 1
+        return word_count(text)
+
+
+class TestContextManager:
+    def test_long_responses_kept_whole_within_budget(self, tmp_path):
+        manager = ContextManager(context_dir=tmp_path)
+        code = "def fibonacci(n):\n" + "    x = 1\n" * 100
+        manager.add_interaction("피보나치", code)
+
+        context = manager.get_context(max_tokens=10000)
+        assert context.startswith("이전 대화:")
+        assert code in context
+        assert "..." not in context
+
+    def test_newest_first_and_oldest_dropped(self, tmp_path):
+        manager = ContextManager(context_dir=tmp_path, token_counter=word_count)
+        for i in range(10):
+            manager.add_interaction(f"요청{i}", f"응답{i} a b c")
+
+        # 헤더 2 + 대화당 (형식 3 + 사용자 1 + 응답 4) = 8
+        context = manager.get_context(max_tokens=2 + 8 * 3)
+        assert "요청6" not in context
+        assert context.index("요청7") < context.index("요청8") < context.index("요청9")
+
+        assert "요청7" not in manager.get_context(max_interactions=2, max_tokens=1000)
+
+    def test_partial_response_keeps_whole_blocks(self, tmp_path):
+        manager = ContextManager(context_dir=tmp_path, token_counter=word_count)
+        response = "def a():\n    return 1\n\n\ndef b():\n\n    return 2\n\n\ndef c():\n    return 3"
+        manager.add_interaction("오래된 요청", "old")
+        manager.add_interaction("함수 세 개", response)
+
+        # 헤더 2 + 형식 3 + 사용자 2 + 생략 표시 1 + 블록 하나(4) 만큼
+        context = manager.get_context(max_tokens=12)
+        assert "def a():\n    return 1\n..." in context
+        assert "def b" not in context
+        assert "오래된 요청" not in context
+
+        # 빈 줄이 있어도 들여쓴 본문은 같은 블록
+        assert ContextManager._split_blocks(response)[1] == "def b():\n\n    return 2"
+
+    def test_token_counts_computed_once_per_interaction(self, tmp_path):
+        counter = CountingCounter()
+        manager = ContextManager(context_dir=tmp_path, token_counter=counter)
+        for i in range(100):
+            manager.add_interaction(f"요청{i}", "응답")
+
+        manager.get_context(max_tokens=50)
+        first = counter.calls
+        manager.get_context(max_tokens=50)
+        # 두 번째는 헤더/형식과 예산 경계에서 줄여 넣는 응답만 계산
+        assert counter.calls - first <= 4
+        # 예산을 넘는 오래된 대화는 세지 않음
+        assert first < 2 * 20
+
+
+class TestEstimateTokens:
+    def test_estimate(self):
+        assert estimate_tokens("") == 0
+        assert estimate_tokens("abcdefg") == 2
+        assert estimate_tokens("한글") == 2
+        assert estimate_tokens("x" * 3500) == 1000
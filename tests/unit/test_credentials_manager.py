@@ -0,0 +1,67 @@
+"""CredentialsManager 단위 테스트"""
+import datetime
+import json
+import time
+
+from src.clients.credentials_manager import CredentialsManager
+
+
+class FakeCredentials:
+    def __init__(self, expires_in):
+        self.refresh_token = "refresh"
+        self.refreshed = 0
+        self.expiry = self._utcnow() + datetime.timedelta(seconds=expires_in)
+
+    @staticmethod
+    def _utcnow():
+        return datetime.datetime.now(datetime.timezone.utc).replace(tzinfo=None)
+
+    def refresh(self, request):
+        self.refreshed += 1
+        self.expiry = self._utcnow() + datetime.timedelta(hours=1)
+
+    def to_json(self):
+        return json.dumps({"refreshed": self.refreshed})
+
+
+class TestCredentialsManager:
+    def test_shared_instance_per_token_path(self, tmp_path):
+        first = CredentialsManager.get(tmp_path / "credentials.json", tmp_path / "token.json")
+        second = CredentialsManager.get(tmp_path / "credentials.json", tmp_path / "token.json")
+        other = CredentialsManager.get(tmp_path / "credentials.json", tmp_path / "other.json")
+
+        assert first is second
+        assert first is not other
+
+    def test_update_saves_token_and_notifies(self, tmp_path):
+        manager = CredentialsManager(tmp_path / "credentials.json", tmp_path / "token.json")
+        received = []
+        manager.add_listener(received.append)
+
+        creds = FakeCredentials(expires_in=3600)
+        manager.update(creds)
+        manager.stop()
+
+        assert received == [creds]
+        assert manager.load() is creds
+        assert json.loads((tmp_path / "token.json").read_text()) == {"refreshed": 0}
+        assert not list(tmp_path.glob("*.tmp"))
+
+    def test_refreshes_before_expiry_in_background(self, tmp_path):
+        manager = CredentialsManager(
+            tmp_path / "credentials.json",
+            tmp_path / "token.json",
+            refresh_margin=600
+        )
+        creds = FakeCredentials(expires_in=300)
+        manager.update(creds)
+
+        token_file = tmp_path / "token.json"
+        deadline = time.time() + 2
+        while json.loads(token_file.read_text())["refreshed"] == 0 and time.time() < deadline:
+            time.sleep(0.01)
+        manager.stop()
+
+        assert creds.refreshed == 1
+        assert manager.seconds_until_refresh() > 0
+        assert json.loads(token_file.read_text()) == {"refreshed": 1}
@@ -0,0 +1,73 @@
+"""디스커버리 문서 로드 순서 및 MCP Drive 도구 목록 단위 테스트"""
+import json
+
+import pytest
+
+from src.clients import discovery
+from src.mcp_server import DRIVE_TOOLS
+from src.tools.drive_tool import DriveTool
+
+
+@pytest.fixture
+def sources(monkeypatch):
+    """패키지 포함본/네트워크 대역 (호출 기록)"""
+    calls = {"packaged": 0, "fetch": 0}
+    packaged = {"value": None}
+
+    def read_packaged(api, version):
+        calls["packaged"] += 1
+        return packaged["value"]
+
+    def fetch(api, version):
+        calls["fetch"] += 1
+        return json.dumps({"source": "network"})
+
+    monkeypatch.setattr(discovery, "_documents", {})
+    monkeypatch.setattr(discovery, "_read_packaged", read_packaged)
+    monkeypatch.setattr(discovery, "_fetch", fetch)
+    return calls, packaged
+
+
+class TestLoadDiscoveryDocument:
+    def test_disk_cache_first(self, tmp_path, sources):
+        calls, packaged = sources
+        packaged["value"] = json.dumps({"source": "packaged"})
+        (tmp_path / "drive.v3.json").write_text(json.dumps({"source": "disk"}))
+
+        assert discovery.load_discovery_document("drive", "v3", tmp_path) == {"source": "disk"}
+        assert calls == {"packaged": 0, "fetch": 0}
+
+    def test_packaged_before_network(self, tmp_path, sources):
+        calls, packaged = sources
+        packaged["value"] = json.dumps({"source": "packaged"})
+
+        assert discovery.load_discovery_document("drive", "v3", tmp_path) == {"source": "packaged"}
+        assert calls == {"packaged": 1, "fetch": 0}
+        # 포함본은 디스크에 다시 쓰지 않음
+        assert not (tmp_path / "drive.v3.json").exists()
+
+    def test_network_result_cached_on_disk(self, tmp_path, sources):
+        calls, _ = sources
+
+        assert discovery.load_discovery_document("drive", "v3", tmp_path) == {"source": "network"}
+        assert calls["fetch"] == 1
+        assert json.loads((tmp_path / "drive.v3.json").read_text()) == {"source": "network"}
+
+        # 같은 프로세스에서는 파싱한 문서를 재사용
+        discovery.load_discovery_document("drive", "v3", tmp_path)
+        assert calls["fetch"] == 1
+
+        # 재시작 후에는 디스크 캐시에서 읽음
+        discovery._documents.clear()
+        assert discovery.load_discovery_document("drive", "v3", tmp_path) == {"source": "network"}
+        assert calls["fetch"] == 1
+
+
+class TestDriveTools:
+    def test_drive_tools_match_definitions(self):
+        names = {
+            getattr(DriveTool, attribute)()["name"]
+            for attribute in dir(DriveTool)
+            if attribute.startswith("get_") and attribute.endswith("_definition")
+        }
+        assert DRIVE_TOOLS == names
@@ -0,0 +1,880 @@
+"""DriveClient 단위 테스트 (메모리 Drive 서비스 대역 사용)"""
+import asyncio
+import builtins
+import hashlib
+import io
+import itertools
+import json
+import os
+import re
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from types import SimpleNamespace
+
+import httplib2
+import pytest
+from googleapiclient.errors import HttpError
+
+from src.clients import drive_client as drive_client_module
+from src.clients.drive_client import DriveClient
+from src.clients.service_pool import DriveServicePool
+from src.managers.content_cache import ContentCache
+from src.managers.context_manager import ContextManager
+from src.managers.folder_cache import FolderCache
+from src.managers.metadata_index import DriveMetadataIndex
+from src.managers.upload_sessions import UploadSessionStore
+from src.tools.drive_tool import DriveTool
+
+
+def http_error(status, reason=None, retry_after=None):
+    headers = {"status": status}
+    if retry_after is not None:
+        headers["retry-after"] = str(retry_after)
+    body = json.dumps({"error": {"errors": [{"reason": reason}]}}).encode() if reason else b""
+    return HttpError(httplib2.Response(headers), body)
+
+
+class FakeRequest:
+    """execute()하면 처리 함수를 호출하는 HttpRequest 대역"""
+
+    def __init__(self, handler):
+        self.handler = handler
+
+    def execute(self, http=None):
+        return self.handler()
+
+
+class FakeUploadRequest:
+    """
+    재개 가능 업로드 요청 대역
+
+    세션 URI별로 서버가 확인한 오프셋을 FakeDriveService에 기록하고, 청크마다 받은 구간을 남깁니다.
+    """
+
+    def __init__(self, drive, media, complete):
+        self.drive = drive
+        self.media = media
+        self.complete = complete
+        self.resumable_uri = None
+        self.resumable_progress = 0
+        self._in_error_state = False
+
+    def execute(self, http=None):
+        return self.complete(self.media.getbytes(0, self.media.size()))
+
+    def next_chunk(self, http=None):
+        drive = self.drive
+        if self._in_error_state:
+            # 재개: 서버에 확인된 오프셋 조회 (세션이 만료되었으면 404)
+            if self.resumable_uri not in drive.sessions:
+                raise http_error(404)
+            self.resumable_progress = drive.sessions[self.resumable_uri]
+            self._in_error_state = False
+
+        if self.resumable_uri is None:
+            self.resumable_uri = f"https://upload.example/session/{next(drive.ids)}"
+            drive.sessions[self.resumable_uri] = 0
+
+        if drive.fail_chunk_at is not None and self.resumable_progress >= drive.fail_chunk_at:
+            drive.fail_chunk_at = None
+            raise http_error(400)
+
+        start = self.resumable_progress
+        chunk = self.media.getbytes(start, self.media.chunksize())
+        drive.received.append((self.resumable_uri, start, len(chunk)))
+        drive.chunks.setdefault(self.resumable_uri, bytearray()).extend(chunk)
+        self.resumable_progress += len(chunk)
+        drive.sessions[self.resumable_uri] = self.resumable_progress
+
+        if self.resumable_progress < self.media.size():
+            return SimpleNamespace(resumable_progress=self.resumable_progress), None
+
+        del drive.sessions[self.resumable_uri]
+        return None, self.complete(bytes(drive.chunks.pop(self.resumable_uri)))
+
+
+class FakeFiles:
+    """service.files() 대역"""
+
+    def __init__(self, drive):
+        self.drive = drive
+
+    def create(self, body=None, media_body=None, fields=None):
+        def complete(content=None):
+            return self.drive.add(body['name'], (body.get('parents') or [None])[0], content)
+
+        if media_body is not None:
+            return FakeUploadRequest(self.drive, media_body, complete)
+        return FakeRequest(complete)
+
+    def update(self, fileId=None, media_body=None, fields=None):
+        def complete(content):
+            return self.drive.write(fileId, content)
+
+        return FakeUploadRequest(self.drive, media_body, complete)
+
+    def list(self, q=None, pageSize=100, pageToken=None, **kwargs):
+        def handler():
+            self.drive.list_calls.append({"q": q, "pageSize": pageSize, "pageToken": pageToken})
+            time.sleep(self.drive.list_delay)
+            files = self.drive.query(q)
+            offset = int(pageToken) if pageToken else 0
+            page = files[offset:offset + pageSize]
+            result = {"files": [self.drive.metadata(file['id']) for file in page]}
+            if offset + pageSize < len(files):
+                result["nextPageToken"] = str(offset + pageSize)
+            return result
+
+        return FakeRequest(handler)
+
+    def get(self, fileId=None, fields=None):
+        return FakeRequest(lambda: self.drive.metadata(fileId))
+
+    def delete(self, fileId=None):
+        def handler():
+            self.drive.check_failure(fileId)
+            self.drive.remove(fileId)
+            return ""
+
+        return FakeRequest(handler)
+
+    def get_media(self, fileId=None):
+        return SimpleNamespace(uri=f"https://drive.example/media/{fileId}", headers={}, http=None)
+
+
+class FakeHttp:
+    """Range 요청에 206으로 응답하는 미디어 다운로드용 HTTP 대역"""
+
+    def __init__(self, drive):
+        self.drive = drive
+
+    def request(self, uri, method="GET", headers=None, **kwargs):
+        file_id = uri.rsplit("/", 1)[1]
+        content = self.drive.files[file_id]["content"]
+        start, end = map(int, re.match(r"bytes=(\d+)-(\d+)", headers["range"]).groups())
+        chunk = content[start:end + 1]
+        self.drive.downloads.append((file_id, start, len(chunk)))
+        response = httplib2.Response({
+            "status": 206,
+            "content-range": f"bytes {start}-{start + len(chunk) - 1}/{len(content)}"
+        })
+        return response, chunk
+
+
+class FakeChanges:
+    """service.changes() 대역 (FakeDriveService의 변경 기록을 순서대로 반환)"""
+
+    def __init__(self, drive):
+        self.drive = drive
+
+    def getStartPageToken(self):
+        def handler():
+            self.drive.start_token_calls += 1
+            return {"startPageToken": str(len(self.drive.changes))}
+
+        return FakeRequest(handler)
+
+    def list(self, pageToken=None, **kwargs):
+        def handler():
+            self.drive.change_calls.append(pageToken)
+            time.sleep(self.drive.changes_delay)
+            return {
+                "changes": self.drive.changes[int(pageToken):],
+                "newStartPageToken": str(len(self.drive.changes))
+            }
+
+        return FakeRequest(handler)
+
+
+class FakeBatch:
+    """BatchHttpRequest 대역 (요청을 순서대로 실행하고 콜백으로 결과 전달)"""
+
+    def __init__(self, drive, callback):
+        self.drive = drive
+        self.callback = callback
+        self.requests = []
+
+    def add(self, request, request_id=None):
+        self.requests.append((request_id, request))
+
+    def execute(self, http=None):
+        self.drive.batches.append([request_id for request_id, _ in self.requests])
+        for request_id, request in self.requests:
+            try:
+                self.callback(request_id, request.execute(), None)
+            except HttpError as e:
+                self.callback(request_id, None, e)
+
+
+class FakeDriveService:
+    """메모리에 파일을 보관하는 Drive 서비스 대역"""
+
+    def __init__(self):
+        self.ids = itertools.count(1)
+        self.files = {}
+        self.sessions = {}
+        self.chunks = {}
+        self.received = []
+        self.list_calls = []
+        self.downloads = []
+        self.batches = []
+        self.failures = {}
+        self.fail_chunk_at = None
+        self.list_delay = 0
+        self.changes = []
+        self.change_calls = []
+        self.start_token_calls = 0
+        self.changes_delay = 0
+        self.http = FakeHttp(self)
+
+    def files_resource(self):
+        return FakeFiles(self)
+
+    def fail(self, file_id, *statuses):
+        """file_id 요청이 statuses 순서대로 실패하도록 설정"""
+        self.failures[file_id] = list(statuses)
+
+    def check_failure(self, file_id):
+        statuses = self.failures.get(file_id)
+        if statuses:
+            raise http_error(statuses.pop(0))
+
+    def add(self, name, parent=None, content=b""):
+        file_id = f"id{next(self.ids)}"
+        self.files[file_id] = {
+            "id": file_id,
+            "name": name,
+            "parents": [parent or "root"],
+            "mimeType": "text/plain",
+            "createdTime": f"2025-01-01T00:{len(self.files):02d}:00Z",
+            "webViewLink": f"https://drive.example/{file_id}"
+        }
+        return self.write(file_id, content)
+
+    def remove(self, file_id):
+        self.metadata(file_id)
+        del self.files[file_id]
+        self.changes.append({"fileId": file_id, "removed": True})
+
+    def touch(self, file_id, **fields):
+        """내용은 그대로 두고 메타데이터만 변경"""
+        self.files[file_id].update(fields)
+        self.changes.append({"fileId": file_id, "removed": False, "file": self.metadata(file_id)})
+
+    def write(self, file_id, content):
+        if file_id not in self.files:
+            raise http_error(404)
+        file = self.files[file_id]
+        file["content"] = bytes(content or b"")
+        file["md5Checksum"] = hashlib.md5(file["content"]).hexdigest()
+        file["size"] = str(len(file["content"]))
+        self.changes.append({"fileId": file_id, "removed": False, "file": self.metadata(file_id)})
+        return self.metadata(file_id)
+
+    def metadata(self, file_id):
+        if file_id not in self.files:
+            raise http_error(404)
+        return {key: value for key, value in self.files[file_id].items() if key != "content"}
+
+    def query(self, q):
+        files = list(self.files.values())
+        name = re.search(r"name='((?:[^'\\]|\\.)*)'", q or "")
+        if name:
+            files = [file for file in files if file["name"] == name.group(1)]
+        parent = re.search(r"'([^']+)' in parents", q or "")
+        if parent:
+            files = [file for file in files if parent.group(1) in file["parents"]]
+        return files
+
+
+class FakeService:
+    """풀에서 대여되는 서비스 객체 대역"""
+
+    def __init__(self, drive):
+        self.drive = drive
+
+    def files(self):
+        return self.drive.files_resource()
+
+    def changes(self):
+        return FakeChanges(self.drive)
+
+    def new_batch_http_request(self, callback=None):
+        return FakeBatch(self.drive, callback)
+
+
+class FakePool:
+    """DriveServicePool 대역 (모든 대여가 같은 서비스 대역 사용)"""
+
+    def __init__(self, drive):
+        self.drive = drive
+        self.service = FakeService(drive)
+
+    @contextmanager
+    def lease(self):
+        yield SimpleNamespace(service=self.service, http=self.drive.http)
+
+
+@pytest.fixture
+def drive():
+    return FakeDriveService()
+
+
+@pytest.fixture
+def make_client(tmp_path, monkeypatch, drive):
+    monkeypatch.setenv("CACHE_DIR", str(tmp_path / "cache"))
+    monkeypatch.setenv("DRIVE_METADATA_INDEX", "false")
+    monkeypatch.setenv("CONTENT_CACHE", "false")
+    credentials = tmp_path / "credentials.json"
+    credentials.write_text("{}")
+    clients = []
+
+    def make(**kwargs):
+        kwargs.setdefault("folder_cache", FolderCache())
+        kwargs.setdefault("upload_sessions", UploadSessionStore())
+        client = DriveClient(str(credentials), max_concurrency=4, lazy=True, **kwargs)
+        client.pool = FakePool(drive)
+        client.rate_limiter = None
+        client.retry_base_delay = 0.001
+        client.retry_max_delay = 0.01
+        clients.append(client)
+        return client
+
+    yield make
+    for client in clients:
+        client.close()
+
+
+class TestResumableUpload:
+    CONTENT = b"0123456789"
+
+    def upload(self, client):
+        return asyncio.run(client.upload_file(self.CONTENT, "big.txt", resumable=True))
+
+    def interrupted_upload(self, make_client, drive, store_file):
+        client = make_client(upload_sessions=UploadSessionStore(store_file))
+        client.upload_chunk_size = 4
+        drive.fail_chunk_at = 4
+
+        with pytest.raises(Exception, match="파일 업로드 실패"):
+            self.upload(client)
+
+        [(uri, _, _)] = drive.received
+        return uri
+
+    def test_interrupted_upload_resumes_from_saved_offset(self, make_client, drive, tmp_path):
+        store_file = tmp_path / "sessions.json"
+        uri = self.interrupted_upload(make_client, drive, store_file)
+
+        # 프로세스 재시작: 디스크에 저장된 세션을 새 클라이언트가 이어받음
+        store = UploadSessionStore(store_file)
+        client = make_client(upload_sessions=store)
+        client.upload_chunk_size = 4
+        result = self.upload(client)
+
+        assert result["status"] == "created"
+        assert drive.received == [(uri, 0, 4), (uri, 4, 4), (uri, 8, 2)]
+        assert drive.files[result["file_id"]]["content"] == self.CONTENT
+        assert UploadSessionStore(store_file)._sessions == {}
+
+    def test_expired_session_restarts_from_scratch(self, make_client, drive, tmp_path):
+        store_file = tmp_path / "sessions.json"
+        old_uri = self.interrupted_upload(make_client, drive, store_file)
+        drive.sessions.clear()
+
+        client = make_client(upload_sessions=UploadSessionStore(store_file))
+        client.upload_chunk_size = 4
+        result = self.upload(client)
+
+        new_uri = drive.received[1][0]
+        assert new_uri != old_uri
+        assert drive.received[1:] == [(new_uri, 0, 4), (new_uri, 4, 4), (new_uri, 8, 2)]
+        assert drive.files[result["file_id"]]["content"] == self.CONTENT
+        assert UploadSessionStore(store_file)._sessions == {}
+
+    def test_upload_key_hashed_off_event_loop(self, make_client, drive, monkeypatch):
+        threads = []
+        upload_key = DriveClient._upload_key
+
+        def record(*args):
+            threads.append(threading.get_ident())
+            return upload_key(*args)
+
+        monkeypatch.setattr(DriveClient, "_upload_key", staticmethod(record))
+        result = self.upload(make_client())
+
+        assert drive.files[result["file_id"]]["content"] == self.CONTENT
+        assert threads and threading.get_ident() not in threads
+
+
+class TestStreaming:
+    def test_multibyte_characters_split_across_chunks(self, make_client, drive):
+        text = "한글 ✓ 텍스트 😀 끝"
+        file = drive.add("korean.txt", content=text.encode("utf-8"))
+        client = make_client()
+
+        async def collect(iterator):
+            return [item async for item in iterator]
+
+        # 3바이트 청크는 2·3·4바이트 문자를 모두 경계에서 자름
+        chunks = asyncio.run(collect(client.stream_file(file["id"], chunk_size=3)))
+        assert all(len(chunk) <= 3 for chunk in chunks)
+        assert b"".join(chunks) == text.encode("utf-8")
+
+        parts = asyncio.run(collect(client.stream_text(file["id"], chunk_size=3)))
+        assert "".join(parts) == text
+        assert len(parts) > 1
+        assert "\ufffd" not in "".join(parts)
+
+
+class TestBatch:
+    def test_split_into_batches_of_100(self, make_client, drive):
+        file_ids = [drive.add(f"file{i}.txt")["id"] for i in range(250)]
+        client = make_client()
+
+        results = asyncio.run(client.delete_files(file_ids))
+
+        assert sorted(len(batch) for batch in drive.batches) == [50, 100, 100]
+        # 배치 요청 ID는 전체 목록에서의 위치
+        assert sorted(int(request_id) for batch in drive.batches for request_id in batch) == list(range(250))
+        assert [result["file_id"] for result in results] == file_ids
+        assert all(result["success"] for result in results)
+        assert drive.files == {}
+
+    def test_only_failed_items_retried(self, make_client, drive):
+        file_ids = [drive.add(f"file{i}.txt")["id"] for i in range(5)]
+        drive.fail(file_ids[1], 503)
+        drive.fail(file_ids[3], 429, 500)
+        drive.fail(file_ids[4], 403)
+        client = make_client()
+
+        results = asyncio.run(client.delete_files(file_ids))
+
+        # 1회차: 전체, 2회차: 재시도 가능한 오류(503, 429)만, 3회차: 다시 실패한 500만
+        assert drive.batches == [["0", "1", "2", "3", "4"], ["0", "1"], ["0"]]
+        assert [result["success"] for result in results] == [True, True, True, True, False]
+        assert "403" in results[4]["error"]
+        assert list(drive.files) == [file_ids[4]]
+        assert client.request_stats()["retries"] == 2
+
+
+class TestPagination:
+    def test_follows_page_tokens(self, make_client, drive):
+        names = [drive.add(f"file{i}.txt")["name"] for i in range(5)]
+        client = make_client()
+
+        async def collect(**kwargs):
+            return [file["name"] async for file in client.iter_files(page_size=2, **kwargs)]
+
+        assert asyncio.run(collect()) == names
+        assert [call["pageToken"] for call in drive.list_calls] == [None, "2", "4"]
+
+        # max_results에 도달하면 남은 만큼만 요청하고 멈춤
+        drive.list_calls.clear()
+        assert asyncio.run(collect(max_results=3)) == names[:3]
+        assert [(call["pageToken"], call["pageSize"]) for call in drive.list_calls] == [(None, 2), ("2", 1)]
+
+    def test_last_page_has_no_token(self, make_client, drive):
+        for i in range(3):
+            drive.add(f"file{i}.txt")
+        client = make_client()
+
+        first = asyncio.run(client.list_files_page(page_size=2))
+        assert len(first["files"]) == 2
+        assert first["next_page_token"] == "2"
+
+        last = asyncio.run(client.list_files_page(page_size=2, page_token=first["next_page_token"]))
+        assert len(last["files"]) == 1
+        assert last["next_page_token"] is None
+
+    def test_prefetch_cancelled_when_closed_early(self, make_client, drive):
+        for i in range(6):
+            drive.add(f"file{i}.txt")
+        drive.list_delay = 0.1
+        client = make_client()
+
+        cancelled = []
+        list_files_page = client.list_files_page
+
+        async def spy(**kwargs):
+            try:
+                return await list_files_page(**kwargs)
+            except asyncio.CancelledError:
+                cancelled.append(kwargs["page_token"])
+                raise
+
+        client.list_files_page = spy
+
+        async def run():
+            files = client.iter_files(page_size=2)
+            first = await files.__anext__()
+            # 다음 페이지 미리 요청이 시작된 뒤 닫음
+            await asyncio.sleep(0.02)
+            started = time.monotonic()
+            await files.aclose()
+            return first, time.monotonic() - started
+
+        first, close_seconds = asyncio.run(run())
+        assert first["name"] == "file0.txt"
+        assert cancelled == ["2"]
+        # 미리 요청한 페이지 응답을 기다리지 않고 닫힘
+        assert close_seconds < 0.05
+        assert [call["pageToken"] for call in drive.list_calls] == [None, "2"]
+
+
+class TestMetadataIndexSync:
+    def test_local_cursor_survives_index_changes(self, make_client, drive):
+        file_ids = [drive.add(f"file{i}.txt")["id"] for i in range(5)]
+        client = make_client(metadata_index=DriveMetadataIndex())
+        # 매 조회마다 변경분 동기화
+        client.index_sync_interval = 0
+
+        def page(token=None):
+            result = asyncio.run(client.list_files_page(page_size=2, page_token=token))
+            return [file["name"] for file in result["files"]], result["next_page_token"]
+
+        names, token = page()
+        assert names == ["file4.txt", "file3.txt"]
+        assert token.startswith("local:")
+
+        # 페이지 사이에 앞쪽 파일이 추가/삭제되어도 다음 페이지는 밀리지 않음
+        drive.add("newest.txt")
+        drive.remove(file_ids[4])
+        names, token = page(token)
+        assert names == ["file2.txt", "file1.txt"]
+        names, token = page(token)
+        assert names == ["file0.txt"]
+        assert token is None
+
+        # 처음부터 다시 조회하면 변경이 반영됨
+        assert page()[0] == ["newest.txt", "file3.txt"]
+        assert len(drive.list_calls) == 1
+
+    def test_stale_local_cursor_rejected(self, make_client, drive):
+        for i in range(3):
+            drive.add(f"file{i}.txt")
+        client = make_client(metadata_index=DriveMetadataIndex())
+
+        token = asyncio.run(client.list_files_page(page_size=1))["next_page_token"]
+        list_calls = len(drive.list_calls)
+
+        # 인덱스를 쓸 수 없는 조회에 로컬 커서를 주면 첫 페이지를 반복하지 않고 오류
+        with pytest.raises(Exception, match="페이지 토큰"):
+            asyncio.run(client.list_files_page(page_size=1, page_token=token, force_remote=True))
+        with pytest.raises(Exception, match="페이지 토큰"):
+            asyncio.run(client.list_files_page(page_size=1, page_token=token, order_by="name"))
+        with pytest.raises(Exception, match="페이지 토큰"):
+            asyncio.run(client.list_files_page(page_size=1, page_token="local:not-a-token"))
+        assert len(drive.list_calls) == list_calls
+
+    def test_concurrent_syncs_run_once(self, make_client, drive):
+        for i in range(3):
+            drive.add(f"file{i}.txt")
+        drive.list_delay = 0.05
+        client = make_client(metadata_index=DriveMetadataIndex())
+        client.index_sync_interval = 60
+
+        async def list_concurrently():
+            return await asyncio.gather(*(client.list_files_page(page_size=10) for _ in range(3)))
+
+        # 첫 적재는 한 번만 (나머지는 적재를 기다린 뒤 인덱스 사용)
+        pages = asyncio.run(list_concurrently())
+        assert drive.start_token_calls == 1
+        assert len(drive.list_calls) == 1
+        assert all(len(page["files"]) == 3 for page in pages)
+
+        # 증분 동기화 중이면 다른 요청은 기다리지 않고 현재 인덱스 사용
+        client.index_sync_interval = 0
+        drive.changes_delay = 0.05
+        asyncio.run(list_concurrently())
+        assert len(drive.change_calls) == 1
+
+    def test_changes_evict_content_cache(self, make_client, drive):
+        changed = drive.add("changed.txt", content=b"old")
+        renamed = drive.add("renamed.txt", content=b"same")
+        removed = drive.add("removed.txt", content=b"gone")
+        client = make_client(metadata_index=DriveMetadataIndex(), content_cache=ContentCache())
+        client.index_sync_interval = 60
+
+        asyncio.run(client.sync_metadata_index())
+        for file in (changed, renamed, removed):
+            asyncio.run(client.download_file(file["id"]))
+
+        drive.write(changed["id"], b"new")
+        drive.touch(renamed["id"], name="renamed2.txt")
+        drive.remove(removed["id"])
+        assert asyncio.run(client.sync_metadata_index()) == {"updated": 2, "removed": 1}
+
+        cache = client.content_cache
+        assert cache.get(changed["id"], f"md5:{changed['md5Checksum']}") is None
+        assert cache.get(removed["id"], f"md5:{removed['md5Checksum']}") is None
+        # 이름만 바뀐 파일은 내용이 같으므로 유지
+        assert cache.get(renamed["id"], f"md5:{renamed['md5Checksum']}") == b"same"
+        assert asyncio.run(client.download_file(changed["id"])) == "new"
+
+
+class TestOverwriteUpload:
+    def upload(self, client, content):
+        return asyncio.run(client.upload_file(content, "app.py", folder_id="folder", overwrite=True))
+
+    def test_same_content_skipped(self, make_client, drive):
+        existing = drive.add("app.py", "folder", b"print(1)")
+        client = make_client()
+
+        result = self.upload(client, "print(1)")
+        assert result["status"] == "unchanged"
+        assert result["file_id"] == existing["id"]
+        assert drive.received == []
+
+    def test_changed_content_updated(self, make_client, drive):
+        existing = drive.add("app.py", "folder", b"print(1)")
+        client = make_client()
+
+        result = self.upload(client, "print(2)")
+        assert result["status"] == "updated"
+        assert result["file_id"] == existing["id"]
+        assert drive.files[existing["id"]]["content"] == b"print(2)"
+        assert len(drive.files) == 1
+
+    def test_md5_hashed_off_event_loop(self, make_client, drive, monkeypatch):
+        drive.add("app.py", "folder", b"print(1)")
+        threads = []
+        stream_md5 = DriveClient._stream_md5
+
+        def record(stream):
+            threads.append(threading.get_ident())
+            return stream_md5(stream)
+
+        monkeypatch.setattr(DriveClient, "_stream_md5", staticmethod(record))
+        assert self.upload(make_client(), "print(1)")["status"] == "unchanged"
+        assert threads and threading.get_ident() not in threads
+
+    def test_missing_file_created(self, make_client, drive):
+        drive.add("app.py", "other", b"print(1)")
+        client = make_client()
+
+        result = self.upload(client, "print(1)")
+        assert result["status"] == "created"
+        assert drive.files[result["file_id"]]["parents"] == ["folder"]
+        assert len(drive.files) == 2
+
+    def test_stale_index_md5_checked_against_drive(self, make_client, drive):
+        existing = drive.add("app.py", "folder", b"print(1)")
+        client = make_client(metadata_index=DriveMetadataIndex())
+        client.index_sync_interval = 60
+        asyncio.run(client.sync_metadata_index())
+
+        # 인덱스가 모르는 사이 Drive에서 내용이 바뀜: 인덱스의 md5만 보고 건너뛰면 안 됨
+        drive.write(existing["id"], b"print(2)")
+        result = self.upload(client, "print(1)")
+        assert result["status"] == "updated"
+        assert drive.files[existing["id"]]["content"] == b"print(1)"
+
+        # 인덱스에는 있지만 Drive에서 삭제된 파일: 새로 생성
+        drive.remove(existing["id"])
+        result = self.upload(client, "print(1)")
+        assert result["status"] == "created"
+        assert client.metadata_index.get(existing["id"]) is None
+
+
+class TestDownloadMany:
+    def downloaded(self, drive, file_id):
+        return sum(length for downloaded_id, _, length in drive.downloads if downloaded_id == file_id)
+
+    def test_byte_cap_enforced_before_fetching(self, make_client, drive):
+        files = [drive.add(f"file{i}.txt", content=b"abcd" * 100) for i in range(3)]
+        client = make_client()
+        client.download_chunk_size = 64
+
+        results = asyncio.run(client.download_files([file["id"] for file in files], max_total_bytes=500))
+
+        assert [result["size"] for result in results] == [400, 100, 0]
+        assert [result["truncated"] for result in results] == [False, True, False]
+        assert "제한" in results[2]["error"]
+        # 잘리는 파일은 예산을 채우는 청크까지만, 예산이 바닥난 뒤의 파일은 전혀 받지 않음
+        assert self.downloaded(drive, files[0]["id"]) == 400
+        assert 100 <= self.downloaded(drive, files[1]["id"]) < 100 + client.download_chunk_size
+        assert self.downloaded(drive, files[2]["id"]) == 0
+
+    def test_truncation_keeps_whole_characters(self, make_client, drive):
+        file = drive.add("korean.txt", content="가나다".encode("utf-8"))
+        client = make_client()
+
+        [result] = asyncio.run(client.download_files([file["id"]], max_total_bytes=5))
+        assert result["content"] == "가"
+        assert result["size"] == 3
+        assert result["truncated"] is True
+
+    def test_read_many(self, make_client, drive, tmp_path):
+        by_id = drive.add("a.py", content=b"a = 1")
+        drive.add("b.py", content=b"b = 2")
+        client = make_client()
+        context_manager = ContextManager(context_dir=tmp_path / "context")
+
+        def read(**arguments):
+            return asyncio.run(DriveTool.read_files(client, context_manager, arguments))
+
+        result = read(file_ids=[by_id["id"]], filenames=["b.py", "missing.py"])
+        assert [item["content"] for item in result["files"]] == ["a = 1", "b = 2", None]
+        assert "missing.py" in result["files"][2]["error"]
+        assert result["read"] == 2
+        assert result["total_size"] == 10
+        assert result["success"] is False
+
+        # max_total_bytes=0은 기본값이 아니라 0바이트 제한
+        drive.downloads.clear()
+        result = read(file_ids=[by_id["id"]], max_total_bytes=0)
+        assert result["files"][0]["content"] is None
+        assert drive.downloads == []
+
+
+class TestRetry:
+    def failing(self, *errors):
+        """errors를 차례로 던진 뒤 "ok"를 반환하는 요청 (호출 시각 기록)"""
+        calls = []
+
+        def execute():
+            calls.append(time.monotonic())
+            if len(calls) <= len(errors):
+                raise errors[len(calls) - 1]
+            return "ok"
+
+        return (lambda service: SimpleNamespace(execute=execute)), calls
+
+    def test_rate_limit_responses_retried(self, make_client):
+        client = make_client()
+        build, calls = self.failing(http_error(429), http_error(403, "userRateLimitExceeded"))
+
+        assert asyncio.run(client._execute(build)) == "ok"
+        assert len(calls) == 3
+        stats = client.request_stats()
+        assert stats["throttled"] == 2
+        assert stats["server_errors"] == 0
+        assert stats["retries"] == 2
+
+    def test_plain_forbidden_not_retried(self, make_client):
+        client = make_client()
+        build, calls = self.failing(http_error(403, "insufficientFilePermissions"))
+
+        with pytest.raises(HttpError):
+            asyncio.run(client._execute(build))
+        assert len(calls) == 1
+        assert client.request_stats()["retries"] == 0
+
+    def test_retry_after_honored_beyond_max_delay(self, make_client):
+        client = make_client()
+        build, calls = self.failing(http_error(429, retry_after=0.2))
+
+        assert asyncio.run(client._execute(build)) == "ok"
+        # retry_max_delay(0.01초)로 줄이지 않고 Retry-After만큼 기다림
+        assert calls[1] - calls[0] >= 0.2
+        assert client.request_stats()["retry_wait_seconds"] == pytest.approx(0.2)
+
+    def test_too_long_retry_after_not_retried(self, make_client):
+        client = make_client()
+        client.retry_after_max = 0.1
+        build, calls = self.failing(http_error(429, retry_after=60))
+
+        with pytest.raises(HttpError):
+            asyncio.run(client._execute(build))
+        assert len(calls) == 1
+
+    def test_max_retries(self, make_client):
+        client = make_client()
+        client.max_retries = 2
+        build, calls = self.failing(*[http_error(503)] * 5)
+
+        with pytest.raises(HttpError):
+            asyncio.run(client._execute(build))
+        assert len(calls) == 3
+        stats = client.request_stats()
+        assert stats["server_errors"] == 3
+        assert stats["retries"] == 2
+
+
+class TestConcurrency:
+    def test_requests_overlap_bounded_with_own_connections(self, make_client):
+        client = make_client()
+        client.pool = DriveServicePool(object(), lambda http: SimpleNamespace(http=http), size=client.max_concurrency)
+        lock = threading.Lock()
+        active = set()
+        max_active = 0
+        used = []
+
+        def request(service):
+            def execute():
+                nonlocal max_active
+                http = client._local.http
+                with lock:
+                    # 동시에 실행 중인 요청끼리는 서비스/연결을 공유하지 않음
+                    assert id(service) not in active
+                    active.add(id(service))
+                    max_active = max(max_active, len(active))
+                    used.append((service, http))
+                time.sleep(0.05)
+                with lock:
+                    active.discard(id(service))
+                return threading.get_ident()
+
+            return SimpleNamespace(execute=execute)
+
+        async def run():
+            return await asyncio.gather(*(client._execute(request) for _ in range(12)))
+
+        started = time.monotonic()
+        threads = asyncio.run(run())
+        elapsed = time.monotonic() - started
+
+        assert max_active == client.max_concurrency
+        assert elapsed < 12 * 0.05 / 2
+        assert threading.get_ident() not in threads
+        assert all(service.http is http for service, http in used)
+        assert len({id(service) for service, _ in used}) == client.max_concurrency
+
+
+class TestInMemoryUpload:
+    @pytest.fixture
+    def no_temp_files(self, tmp_path, monkeypatch):
+        """임시 파일 생성과 (테스트 디렉토리 밖) 임시 디렉토리 파일 열기를 실패시킴"""
+        temp_dir = tempfile.gettempdir()
+        real_open = builtins.open
+
+        def guarded_open(file, *args, **kwargs):
+            path = os.path.realpath(os.fspath(file)) if isinstance(file, (str, bytes, os.PathLike)) else None
+            if path and path.startswith(temp_dir) and not path.startswith(str(tmp_path.resolve())):
+                raise AssertionError(f"임시 디렉토리에 파일을 열었습니다: {path}")
+            return real_open(file, *args, **kwargs)
+
+        def fail(*args, **kwargs):
+            raise AssertionError("임시 파일을 만들었습니다")
+
+        monkeypatch.setattr(builtins, "open", guarded_open)
+        for name in ("mkstemp", "mkdtemp", "NamedTemporaryFile", "TemporaryFile", "SpooledTemporaryFile"):
+            monkeypatch.setattr(tempfile, name, fail)
+
+    @pytest.fixture
+    def media(self, monkeypatch):
+        """MediaIoBaseUpload에 전달된 (내용, mimetype) 기록"""
+        received = []
+
+        class RecordingUpload(drive_client_module.MediaIoBaseUpload):
+            def __init__(self, fd, mimetype, *args, **kwargs):
+                super().__init__(fd, mimetype, *args, **kwargs)
+                received.append((self.getbytes(0, self.size()), mimetype))
+
+        monkeypatch.setattr(drive_client_module, "MediaIoBaseUpload", RecordingUpload)
+        return received
+
+    @pytest.mark.parametrize("content, expected, mime_type", [
+        ("print('안녕')", "print('안녕')".encode("utf-8"), "text/x-python"),
+        (b"\x00\x01binary", b"\x00\x01binary", "application/octet-stream"),
+        (io.BytesIO(b"\x89PNG stream"), b"\x89PNG stream", "image/png"),
+    ])
+    def test_upload_from_memory(self, make_client, drive, media, no_temp_files, content, expected, mime_type):
+        client = make_client()
+        result = asyncio.run(client.upload_file(content, "file", mime_type=mime_type))
+
+        assert media == [(expected, mime_type)]
+        assert drive.files[result["file_id"]]["content"] == expected
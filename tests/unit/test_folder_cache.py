@@ -0,0 +1,54 @@
+"""FolderCache 단위 테스트"""
+import time
+
+from src.managers.folder_cache import FolderCache
+
+
+class TestFolderCache:
+    def test_set_and_get(self):
+        cache = FolderCache()
+        cache.set(None, "proj", "id-proj")
+        cache.set("id-proj", "sub", "id-sub")
+
+        assert cache.get(None, "proj") == "id-proj"
+        assert cache.get("id-proj", "sub") == "id-sub"
+        assert cache.get(None, "sub") is None
+
+    def test_ttl_expiry(self):
+        cache = FolderCache(ttl=0.01)
+        cache.set(None, "proj", "id-proj")
+        time.sleep(0.02)
+
+        assert cache.get(None, "proj") is None
+
+    def test_lru_eviction(self):
+        cache = FolderCache(max_entries=2)
+        cache.set(None, "a", "id-a")
+        cache.set(None, "b", "id-b")
+        cache.get(None, "a")
+        cache.set(None, "c", "id-c")
+
+        assert cache.get(None, "a") == "id-a"
+        assert cache.get(None, "b") is None
+        assert cache.get(None, "c") == "id-c"
+
+    def test_invalidate_removes_descendants(self):
+        cache = FolderCache()
+        cache.set(None, "proj", "id-proj")
+        cache.set("id-proj", "sub", "id-sub")
+        cache.set("id-sub", "dir", "id-dir")
+        cache.set(None, "other", "id-other")
+
+        removed = cache.invalidate_id("id-proj")
+
+        assert {entry["id"] for entry in removed} == {"id-proj", "id-sub", "id-dir"}
+        assert cache.get(None, "other") == "id-other"
+        assert len(cache) == 1
+
+    def test_persistence(self, tmp_path):
+        cache_file = tmp_path / "folder_cache.json"
+        cache = FolderCache(cache_file=cache_file)
+        cache.set(None, "proj", "id-proj")
+
+        reloaded = FolderCache(cache_file=cache_file)
+        assert reloaded.get(None, "proj") == "id-proj"
@@ -0,0 +1,149 @@
+"""FolderSync 단위 테스트"""
+import asyncio
+import hashlib
+import itertools
+import threading
+
+from src.managers.folder_sync import FolderSync, FOLDER_MIME_TYPE
+
+
+class FakeDrive:
+    """메모리에 파일을 보관하는 Drive 클라이언트 대역"""
+
+    def __init__(self):
+        self.ids = itertools.count(1)
+        self.files = {}
+        self.uploads = 0
+        self.downloads = 0
+        self.listings = []
+        self.root = self._add("root", None, FOLDER_MIME_TYPE)
+
+    def _add(self, name, parent, mime_type, content=None):
+        file_id = f"id{next(self.ids)}"
+        self.files[file_id] = {"id": file_id, "name": name, "parent": parent, "mimeType": mime_type}
+        if content is not None:
+            self._write(file_id, content)
+        return file_id
+
+    def _write(self, file_id, content):
+        file = self.files[file_id]
+        file["content"] = content
+        file["md5Checksum"] = hashlib.md5(content).hexdigest()
+        file["modifiedTime"] = "2030-01-01T00:00:00Z"
+
+    async def iter_files(self, folder_id=None, fields=None, order_by=None, force_remote=False):
+        self.listings.append(force_remote)
+        for file in list(self.files.values()):
+            if file["parent"] == folder_id:
+                yield {key: value for key, value in file.items() if key not in ("content", "parent")}
+
+    async def stream_file(self, file_id):
+        self.downloads += 1
+        yield self.files[file_id]["content"]
+
+    async def create_folder(self, path, parent_id):
+        for name in path.split("/"):
+            existing = [
+                file["id"] for file in self.files.values()
+                if file["parent"] == parent_id and file["name"] == name
+            ]
+            parent_id = existing[0] if existing else self._add(name, parent_id, FOLDER_MIME_TYPE)
+        return parent_id
+
+    async def upload_file(self, stream, filename, folder_id=None, mime_type=None, file_id=None):
+        self.uploads += 1
+        content = stream.read()
+        if file_id:
+            self._write(file_id, content)
+        else:
+            file_id = self._add(filename, folder_id, mime_type, content)
+        return {"file_id": file_id}
+
+
+class TestFolderSync:
+    def test_pull_then_only_deltas(self, tmp_path):
+        drive = FakeDrive()
+        src = asyncio.run(drive.create_folder("src", drive.root))
+        drive._add("main.py", src, "text/x-python", b"print(1)")
+        drive._add("README.md", drive.root, "text/markdown", b"# hi")
+
+        sync = FolderSync(drive, manifest_dir=tmp_path / "manifests")
+        local = tmp_path / "project"
+
+        result = asyncio.run(sync.sync(local, drive.root, "pull"))
+        assert result["downloaded"] == ["README.md", "src/main.py"]
+        assert (local / "src" / "main.py").read_bytes() == b"print(1)"
+
+        result = asyncio.run(sync.sync(local, drive.root, "pull"))
+        assert result["downloaded"] == []
+        assert result["unchanged"] == 2
+        assert drive.downloads == 2
+
+    def test_pull_writes_off_event_loop(self, tmp_path, monkeypatch):
+        drive = FakeDrive()
+        drive._add("main.py", drive.root, "text/x-python", b"print(1)")
+
+        threads = []
+        write_chunk = FolderSync._write_chunk
+
+        def record(f, digest, chunk):
+            threads.append(threading.current_thread())
+            write_chunk(f, digest, chunk)
+
+        monkeypatch.setattr(FolderSync, "_write_chunk", staticmethod(record))
+
+        local = tmp_path / "project"
+        sync = FolderSync(drive, manifest_dir=tmp_path / "manifests")
+        asyncio.run(sync.sync(local, drive.root, "pull"))
+
+        assert (local / "main.py").read_bytes() == b"print(1)"
+        assert threads and threading.main_thread() not in threads
+
+    def test_lists_remote_bypassing_index(self, tmp_path):
+        drive = FakeDrive()
+        folder = drive._add("pkg", drive.root, FOLDER_MIME_TYPE)
+        drive._add("a.py", folder, "text/x-python", b"a = 1")
+
+        sync = FolderSync(drive, manifest_dir=tmp_path / "manifests")
+        asyncio.run(sync.sync(tmp_path / "project", drive.root, "pull"))
+        # 하위 폴더까지 모든 목록을 인덱스가 아닌 Drive에서 조회
+        assert drive.listings == [True, True]
+
+    def test_push_creates_and_updates(self, tmp_path):
+        drive = FakeDrive()
+        local = tmp_path / "project"
+        (local / "pkg").mkdir(parents=True)
+        (local / "pkg" / "a.py").write_bytes(b"a = 1")
+        (local / "b.py").write_bytes(b"b = 1")
+
+        sync = FolderSync(drive, manifest_dir=tmp_path / "manifests")
+        result = asyncio.run(sync.sync(local, drive.root, "push"))
+        assert result["uploaded"] == ["b.py", "pkg/a.py"]
+
+        (local / "b.py").write_bytes(b"b = 2")
+        result = asyncio.run(sync.sync(local, drive.root, "push"))
+        assert result["uploaded"] == ["b.py"]
+        assert result["unchanged"] == 1
+        assert drive.uploads == 3
+
+        names = sorted(file["name"] for file in drive.files.values())
+        assert names == ["a.py", "b.py", "pkg", "root"]
+
+    def test_both_directions(self, tmp_path):
+        drive = FakeDrive()
+        remote_id = drive._add("remote.txt", drive.root, "text/plain", b"v1")
+        local = tmp_path / "project"
+        local.mkdir()
+        (local / "local.txt").write_bytes(b"mine")
+
+        sync = FolderSync(drive, manifest_dir=tmp_path / "manifests")
+        result = asyncio.run(sync.sync(local, drive.root, "both"))
+        assert result["downloaded"] == ["remote.txt"]
+        assert result["uploaded"] == ["local.txt"]
+
+        # Drive 쪽만 바뀐 경우 내려받음
+        drive._write(remote_id, b"v2")
+        result = asyncio.run(sync.sync(local, drive.root, "both"))
+        assert result["downloaded"] == ["remote.txt"]
+        assert result["uploaded"] == []
+        assert (local / "remote.txt").read_bytes() == b"v2"
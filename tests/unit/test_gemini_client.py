@@ -0,0 +1,507 @@
+"""GeminiClient 동시 실행/취소 단위 테스트"""
+import asyncio
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from src.clients.gemini_backends import GenaiBackend, StubBackend
+from src.clients.gemini_client import GeminiClient, StreamingCodeExtractor, SYSTEM_INSTRUCTIONS
+from src.managers.response_cache import ResponseCache
+from src.tools.gemini_tool import GeminiTool
+from src.utils.rate_limiter import TokenBucket
+
+
+class FakeChunk:
+    def __init__(self, text):
+        self.text = text
+
+
+class FakeModel:
+    """청크 사이마다 잠시 멈추는 스트리밍 모델 대역"""
+
+    def __init__(self, chunks=("```python\n", "print('hi')\n", "```"), delay=0.05):
+        self.chunks = chunks
+        self.delay = delay
+        self.started = 0
+        self.finished_chunks = 0
+        self.request_options = None
+        self.lock = threading.Lock()
+
+    def generate_content(self, contents, stream=False, request_options=None):
+        assert stream
+        self.request_options = request_options
+        with self.lock:
+            self.started += 1
+        return self._stream()
+
+    def _stream(self):
+        for chunk in self.chunks:
+            time.sleep(self.delay)
+            with self.lock:
+                self.finished_chunks += 1
+            yield FakeChunk(chunk)
+
+
+class ConcurrencyModel(FakeModel):
+    """동시에 실행 중인 생성 수의 최댓값을 기록"""
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.active = 0
+        self.max_active = 0
+
+    def _stream(self):
+        with self.lock:
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        try:
+            yield from super()._stream()
+        finally:
+            with self.lock:
+                self.active -= 1
+
+
+class FakeBackend(StubBackend):
+    """모든 지시문 세트에 같은 FakeModel을 쓰는 백엔드"""
+
+    def __init__(self):
+        super().__init__()
+        self.model = None
+
+    def create_model(self, model_name, system_instruction, generation_config):
+        return self.model
+
+
+@pytest.fixture
+def client():
+    client = GeminiClient("test-key", max_concurrency=2, timeout=5, response_cache=ResponseCache(), backend=FakeBackend())
+    yield client
+    client.shutdown()
+
+
+class TestGeminiClient:
+    def test_generation_does_not_block_event_loop(self, client):
+        client.backend.model = FakeModel(delay=0.1)
+
+        async def run():
+            ticks = 0
+
+            async def ticker():
+                nonlocal ticks
+                while True:
+                    await asyncio.sleep(0.01)
+                    ticks += 1
+
+            task = asyncio.create_task(ticker())
+            result = await client.generate_code("hello")
+            task.cancel()
+            return result, ticks
+
+        result, ticks = asyncio.run(run())
+        assert result["code"] == "print('hi')"
+        assert result["language"] == "python"
+        assert ticks > 10
+        assert client.backend.model.request_options == {"timeout": 5}
+
+    def test_generations_overlap(self, client):
+        client.backend.model = FakeModel(delay=0.1)
+
+        async def run():
+            started = time.monotonic()
+            await asyncio.gather(client.generate_code("a"), client.generate_code("b"))
+            return time.monotonic() - started
+
+        # 순차 실행이면 0.6초, 동시에 실행되면 약 0.3초
+        assert asyncio.run(run()) < 0.5
+
+    def test_timeout_abandons_generation(self, client):
+        model = FakeModel(chunks=["x"] * 20, delay=0.05)
+        client.backend.model = model
+
+        with pytest.raises(TimeoutError):
+            asyncio.run(client.generate_code("slow", timeout=0.2))
+
+        # 작업 스레드도 다음 청크에서 중단
+        time.sleep(0.2)
+        assert model.finished_chunks < 20
+
+    def test_cancelled_request_is_abandoned(self, client):
+        model = FakeModel(chunks=["x"] * 20, delay=0.05)
+        client.backend.model = model
+
+        async def run():
+            task = asyncio.create_task(client.generate_code("slow"))
+            await asyncio.sleep(0.15)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+
+        asyncio.run(run())
+        time.sleep(0.2)
+        assert model.finished_chunks < 20
+
+    def test_stream_code_yields_chunks_then_result(self, client):
+        client.backend.model = FakeModel(chunks=("설명\n```py", "thon\nprint(1)\n``", "`\n끝"), delay=0.01)
+
+        async def run():
+            return [event async for event in client.stream_code("hello")]
+
+        events = asyncio.run(run())
+        assert [event["type"] for event in events] == ["chunk", "chunk", "chunk", "done"]
+        assert "".join(event["code"] for event in events[:-1]) == "print(1)\n"
+        assert events[-1]["code"] == "print(1)"
+        assert events[-1]["language"] == "python"
+
+    def test_stream_code_closed_early_abandons_generation(self, client):
+        model = FakeModel(chunks=["x"] * 20, delay=0.05)
+        client.backend.model = model
+
+        async def run():
+            stream = client.stream_code("slow")
+            await stream.__anext__()
+            await stream.aclose()
+
+        asyncio.run(run())
+        time.sleep(0.2)
+        assert model.finished_chunks < 20
+
+
+    def test_repeated_request_served_from_cache(self, client):
+        model = FakeModel(delay=0)
+        client.backend.model = model
+
+        first = asyncio.run(client.generate_code("hello", language="python"))
+        second = asyncio.run(client.generate_code("hello", language="python"))
+        assert second == first
+        assert model.started == 1
+
+        # 프롬프트가 다르거나 캐시를 우회하면 새로 생성
+        asyncio.run(client.generate_code("hello", language="go"))
+        asyncio.run(client.generate_code("hello", language="python", use_cache=False))
+        assert model.started == 3
+
+        async def stream():
+            return [event async for event in client.stream_code("hello", language="python")]
+
+        events = asyncio.run(stream())
+        assert events[-1]["code"] == first["code"]
+        assert model.started == 3
+        assert client.cache_stats()["memory_hits"] == 2
+
+
+    def test_concurrent_identical_requests_share_one_call(self, client):
+        model = FakeModel(delay=0.05)
+        client.backend.model = model
+
+        async def stream():
+            return [event async for event in client.stream_code("hello")]
+
+        async def run():
+            return await asyncio.gather(
+                client.generate_code("hello"),
+                client.generate_code("hello  \n"),
+                stream()
+            )
+
+        first, second, events = asyncio.run(run())
+        assert first == second
+        assert events[-1]["code"] == first["code"]
+        assert "".join(event["text"] for event in events[:-1]) == "".join(model.chunks)
+        assert model.started == 1
+
+        stats = client.request_stats()
+        assert stats["started"] == 1
+        assert stats["coalesced"] == 2
+        assert stats["in_flight"] == 0
+
+    def test_cancelling_one_waiter_keeps_shared_call(self, client):
+        model = FakeModel(chunks=["```python\n", "x = 1\n", "```"], delay=0.1)
+        client.backend.model = model
+
+        async def run():
+            leader = asyncio.create_task(client.generate_code("shared"))
+            follower = asyncio.create_task(client.generate_code("shared"))
+            await asyncio.sleep(0.05)
+            leader.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await leader
+            return await follower
+
+        result = asyncio.run(run())
+        assert result["code"] == "x = 1"
+        assert model.started == 1
+        assert client.request_stats()["abandoned"] == 0
+
+    def test_cancelling_all_waiters_abandons_shared_call(self, client):
+        model = FakeModel(chunks=["x"] * 20, delay=0.05)
+        client.backend.model = model
+
+        async def run():
+            tasks = [asyncio.create_task(client.generate_code("slow", use_cache=False)) for _ in range(2)]
+            await asyncio.sleep(0.15)
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+        asyncio.run(run())
+        time.sleep(0.2)
+        assert model.finished_chunks < 20
+        assert model.started == 1
+        assert client.request_stats()["abandoned"] == 1
+
+    def test_generate_batch_bounded_with_per_item_errors(self, client):
+        model = ConcurrencyModel(delay=0.03)
+        client.backend.model = model
+        client._batch_limiter = None
+
+        async def run():
+            items = [{"prompt": f"item {i}"} for i in range(6)] + [{"language": "python"}]
+            return [result async for result in client.generate_batch(items, concurrency=2)]
+
+        results = asyncio.run(run())
+        assert len(results) == 7
+        assert model.max_active == 2
+        assert model.started == 6
+
+        failed = [result for result in results if not result["success"]]
+        assert [result["index"] for result in failed] == [6]
+        assert "prompt" in failed[0]["error"]
+        assert {result["index"] for result in results if result["success"]} == set(range(6))
+
+    def test_generate_batch_limiter_skips_cache_hits(self, client):
+        client.backend.model = FakeModel(delay=0)
+        client._batch_limiter = TokenBucket(rate=0.001, capacity=1)
+
+        async def run(items):
+            return [result async for result in client.generate_batch(items)]
+
+        asyncio.run(client.generate_code("cached"))
+        results = asyncio.run(run([{"prompt": "cached"}, {"prompt": "new"}, "not a dict"]))
+        assert [result["success"] for result in sorted(results, key=lambda result: result["index"])] == [True, True, False]
+        # API를 호출한 "new"만 토큰을 사용 (버킷 용량 1이라 캐시 적중이 토큰을 쓰면 기다려야 함)
+        assert client._batch_limiter.stats()["reservations"] == 1
+        assert client._batch_limiter.stats()["throttled"] == 0
+
+    def test_execute_batch_rejects_non_dict_items(self, client):
+        with pytest.raises(ValueError, match="객체"):
+            asyncio.run(GeminiTool.execute_batch(client, None, {"items": [{"prompt": "a"}, "b"]}))
+
+    def test_iter_batch_saves_concurrently(self, client):
+        client.backend.model = FakeModel(delay=0)
+        client._batch_limiter = None
+        folders = []
+        context_manager = SimpleNamespace(add_interaction=lambda **kwargs: None, save_session=lambda: None)
+
+        class FakeDrive:
+            async def create_folder(self, folder_name, parent_id=None):
+                folders.append(folder_name)
+                return "folder"
+
+            async def upload_file(self, content, filename, folder_id=None, progress_callback=None, overwrite=False):
+                await asyncio.sleep(0.3 if filename == "slow.py" else 0)
+                return {"file_id": filename, "file_name": filename, "web_view_link": "link", "status": "created"}
+
+        async def run():
+            items = [{"prompt": "a", "filename": "slow.py"}, {"prompt": "b", "filename": "fast.py"}]
+            return [
+                result async for result in GeminiTool.iter_batch(
+                    client, context_manager, items, drive_client=FakeDrive(), default_folder="Generated"
+                )
+            ]
+
+        results = asyncio.run(run())
+        # 느린 저장이 끝나기를 기다리지 않고 뒤 항목의 결과를 먼저 반환
+        assert [result["index"] for result in results] == [1, 0]
+        assert [result["drive"]["filename"] for result in results] == ["fast.py", "slow.py"]
+        assert all(result["drive"]["success"] for result in results)
+        assert folders[0] == "Generated"
+
+    def test_semantic_cache_matches_reworded_prompt(self):
+        pytest.importorskip("numpy")
+        from src.managers.semantic_cache import SemanticCache, HashingEmbedder
+
+        client = GeminiClient(
+            "test-key",
+            timeout=5,
+            response_cache=ResponseCache(),
+            semantic_cache=SemanticCache(HashingEmbedder(), threshold=0.8),
+            backend=FakeBackend()
+        )
+        model = FakeModel(delay=0)
+        client.backend.model = model
+        try:
+            first = asyncio.run(client.generate_code("Python fibonacci function", language="python"))
+            second = asyncio.run(client.generate_code("python Fibonacci function please", language="python"))
+            assert second["code"] == first["code"]
+            assert model.started == 1
+
+            # 언어가 다르면 적중하지 않음
+            asyncio.run(client.generate_code("python Fibonacci function please", language="go"))
+            assert model.started == 2
+            assert client.cache_stats()["semantic"]["hits"] == 1
+        finally:
+            client.shutdown()
+
+
+class TestSystemInstructions:
+    @pytest.fixture
+    def stub_client(self):
+        client = GeminiClient("test-key", timeout=5, response_cache=ResponseCache(), backend=StubBackend())
+        client.context_cache_ttl = None
+        yield client
+        client.shutdown()
+
+    def test_fixed_instructions_not_in_prompt(self, stub_client):
+        result = asyncio.run(stub_client.generate_code("피보나치", language="python", instruction_set="korean"))
+        assert result["code"] == "print('stub')"
+
+        call = stub_client.backend.calls[0]
+        assert call["system_instruction"] == SYSTEM_INSTRUCTIONS["korean"]
+        assert call["contents"] == "프로그래밍 언어: python\n사용자 요청:\n피보나치"
+
+        stats = stub_client.token_stats()
+        assert stats["requests"] == 1
+        assert stats["cached_tokens"] == 0
+        assert stats["instructions"]["korean"]["context_cache"] is False
+
+        with pytest.raises(Exception, match="지시문 세트"):
+            asyncio.run(stub_client.generate_code("x", instruction_set="unknown"))
+
+    def test_context_cache_created_once_and_renewed(self, stub_client):
+        stub_client.context_cache_ttl = 0.2
+        stub_client.context_cache_min_tokens = 0
+
+        asyncio.run(stub_client.generate_code("a"))
+        asyncio.run(stub_client.generate_code("b"))
+        assert len(stub_client.backend.cached_contents) == 1
+        assert stub_client.backend.cached_contents[0].renewals == 0
+
+        # 유효 시간의 절반이 지나면 다음 사용 때 연장
+        time.sleep(0.15)
+        asyncio.run(stub_client.generate_code("c"))
+        assert len(stub_client.backend.cached_contents) == 1
+        assert stub_client.backend.cached_contents[0].renewals == 1
+
+        stats = stub_client.token_stats()
+        assert stats["requests"] == 3
+        assert stats["cached_tokens"] == 3 * stats["instructions"]["default"]["tokens"]
+        assert 0 < stats["cached_ratio"] < 1
+        assert stats["instructions"]["default"]["context_cache"] is True
+
+
+class SlowCacheBackend(StubBackend):
+    """컨텍스트 캐시 등록이 느리고, 클라이언트가 요청한 토큰 수 조회를 기록하는 백엔드"""
+
+    def __init__(self, delay=0.2):
+        super().__init__()
+        self.delay = delay
+        self.token_requests = 0
+
+    def count_tokens(self, model_name, text):
+        # StubModel의 사용량 추정은 모델 이름 없이 호출
+        if model_name:
+            self.token_requests += 1
+        return super().count_tokens(model_name, text)
+
+    def create_cached_content(self, model_name, system_instruction, ttl):
+        time.sleep(self.delay)
+        return super().create_cached_content(model_name, system_instruction, ttl)
+
+
+class TestModelRegistry:
+    @pytest.fixture
+    def slow_client(self):
+        client = GeminiClient("test-key", timeout=5, response_cache=ResponseCache(), backend=SlowCacheBackend())
+        client.context_cache_ttl = 60
+        client.context_cache_min_tokens = 0
+        yield client
+        client.shutdown()
+
+    def test_concurrent_first_use_creates_once_outside_lock(self, slow_client):
+        models = []
+        threads = [
+            threading.Thread(target=lambda: models.append(slow_client._get_model("default")))
+            for _ in range(3)
+        ]
+        for thread in threads:
+            thread.start()
+        time.sleep(0.05)
+
+        # 캐시 등록(네트워크) 중에도 잠금을 쓰는 통계 조회는 바로 반환
+        started = time.monotonic()
+        slow_client.token_stats()
+        assert time.monotonic() - started < 0.1
+
+        for thread in threads:
+            thread.join()
+        assert len(slow_client.backend.cached_contents) == 1
+        assert len(models) == 3 and all(model is models[0] for model in models)
+        assert slow_client._models_pending == {}
+
+    def test_failed_renewal_evicts_entry(self, slow_client, monkeypatch):
+        slow_client.backend.delay = 0
+        first = slow_client._get_model("default")
+        slow_client._models[(slow_client.model_name, "default")]["expires_at"] = time.time()
+
+        def fail(*args):
+            raise RuntimeError("unavailable")
+
+        monkeypatch.setattr(slow_client.backend, "renew_cached_content", fail)
+        monkeypatch.setattr(slow_client.backend, "create_cached_content", fail)
+        create_model = slow_client.backend.create_model
+        monkeypatch.setattr(slow_client.backend, "create_model", fail)
+        with pytest.raises(RuntimeError):
+            slow_client._get_model("default")
+        # 만료되는 캐시를 계속 쓰지 않도록 항목을 제거
+        assert (slow_client.model_name, "default") not in slow_client._models
+
+        monkeypatch.setattr(slow_client.backend, "create_model", create_model)
+        assert slow_client._get_model("default") is not first
+
+    def test_token_count_skipped_without_context_cache(self, slow_client):
+        slow_client.context_cache_ttl = None
+        asyncio.run(slow_client.generate_code("hello"))
+
+        assert slow_client.backend.token_requests == 0
+        assert slow_client.backend.cached_contents == []
+        assert slow_client.token_stats()["instructions"]["default"]["tokens"] > 0
+
+    def test_genai_backend_ttl_accepted_by_sdk(self):
+        caching_types = pytest.importorskip("google.generativeai.types.caching_types")
+        ttls = []
+
+        class FakeCachedContent:
+            @staticmethod
+            def create(model, system_instruction, ttl):
+                ttls.append(caching_types.to_optional_ttl(ttl))
+                return FakeCachedContent()
+
+            def update(self, ttl):
+                ttls.append(caching_types.to_optional_ttl(ttl))
+
+        backend = GenaiBackend("test-key")
+        backend._genai = SimpleNamespace(caching=SimpleNamespace(CachedContent=FakeCachedContent))
+
+        cached_content = backend.create_cached_content("gemini-2.0-flash", "지시문", 3600.0)
+        backend.renew_cached_content(cached_content, 1.5)
+        assert ttls == [{"seconds": 3600, "nanos": 0}, {"seconds": 1, "nanos": 500000000}]
+
+
+class TestStreamingCodeExtractor:
+    def feed_all(self, chunks):
+        extractor = StreamingCodeExtractor()
+        return [extractor.feed(chunk) for chunk in chunks], extractor
+
+    def test_fence_split_across_chunks(self):
+        deltas, extractor = self.feed_all(["intro `", "``python\na = 1", "\nb = 2`", "`` tail"])
+        assert deltas == ["", "a = 1", "\nb = 2", ""]
+        assert extractor.code == "a = 1\nb = 2"
+
+    def test_non_language_first_line_is_code(self):
+        _, extractor = self.feed_all(["```\n", "# requirements.txt\nflask\n```"])
+        assert extractor.code == "# requirements.txt\nflask\n"
+
+        _, extractor = self.feed_all(["```flask==3.0\n", "requests\n```"])
+        assert extractor.code == "flask==3.0\nrequests\n"
@@ -0,0 +1,50 @@
+"""DriveMetadataIndex 단위 테스트"""
+import pytest
+
+from src.managers.metadata_index import DriveMetadataIndex
+
+
+class TestDriveMetadataIndex:
+    @pytest.fixture
+    def index(self):
+        index = DriveMetadataIndex()
+        index.apply([
+            {"id": "f1", "name": "app.py", "parents": ["folder"], "md5Checksum": "a",
+             "createdTime": "2025-01-01T00:00:00Z"},
+            {"id": "f2", "name": "app_test.py", "parents": ["folder"], "md5Checksum": "b",
+             "createdTime": "2025-01-02T00:00:00Z"},
+            {"id": "f3", "name": "README.md", "parents": ["other"],
+             "createdTime": "2025-01-03T00:00:00Z"},
+        ])
+        return index
+
+    def test_find_by_name(self, index):
+        assert index.find_by_name("app.py")["id"] == "f1"
+        assert index.find_by_name("app.py", "other") is None
+        assert index.find_by_name("README.md", "other")["parents"] == ["other"]
+
+    def test_list_folder_newest_first(self, index):
+        files = index.list_files(parent_id="folder")
+        assert [file["id"] for file in files] == ["f2", "f1"]
+
+    def test_prefix_search(self, index):
+        files = index.list_files(prefix="app", order_by="name")
+        assert [file["name"] for file in files] == ["app.py", "app_test.py"]
+
+    def test_partial_update_keeps_existing_fields(self, index):
+        index.upsert({"id": "f1", "name": "main.py"})
+        file = index.get("f1")
+        assert file["name"] == "main.py"
+        assert file["md5Checksum"] == "a"
+        assert file["parents"] == ["folder"]
+
+    def test_trashed_files_are_removed(self, index):
+        index.apply([{"id": "f2", "trashed": True}])
+        assert index.get("f2") is None
+        assert len(index) == 2
+
+    def test_page_token(self, index):
+        assert not index.is_bootstrapped()
+        index.set_page_token("42")
+        assert index.get_page_token() == "42"
+        assert index.seconds_since_sync() < 5
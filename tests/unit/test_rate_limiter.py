@@ -0,0 +1,42 @@
+"""TokenBucket 단위 테스트"""
+import asyncio
+import time
+
+from src.utils.rate_limiter import TokenBucket
+
+
+class TestTokenBucket:
+    def test_burst_then_wait(self):
+        bucket = TokenBucket(rate=10, capacity=2)
+
+        assert bucket.reserve() == 0
+        assert bucket.reserve() == 0
+        assert 0.05 < bucket.reserve() <= 0.1
+        assert 0.15 < bucket.reserve() <= 0.2
+
+        stats = bucket.stats()
+        assert stats["reservations"] == 4
+        assert stats["throttled"] == 2
+
+    def test_cost_counts_multiple_tokens(self):
+        bucket = TokenBucket(rate=100, capacity=10)
+
+        assert bucket.reserve(10) == 0
+        assert 0.09 < bucket.reserve(10) <= 0.1
+
+    def test_pause_delays_everyone(self):
+        bucket = TokenBucket(rate=100, capacity=100)
+        bucket.pause(0.5)
+
+        assert 0.4 < bucket.reserve() <= 0.5
+
+    def test_acquire_sleeps(self):
+        bucket = TokenBucket(rate=20, capacity=1)
+
+        async def run():
+            started = time.monotonic()
+            for _ in range(3):
+                await bucket.acquire()
+            return time.monotonic() - started
+
+        assert asyncio.run(run()) >= 0.09
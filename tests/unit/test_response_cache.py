@@ -0,0 +1,54 @@
+"""ResponseCache 단위 테스트"""
+import time
+
+from src.managers.response_cache import ResponseCache
+
+
+class TestResponseCache:
+    def test_make_key_separates_parts(self):
+        assert ResponseCache.make_key("ab", "c") != ResponseCache.make_key("a", "bc")
+        assert ResponseCache.make_key("m", "p", b"img") == ResponseCache.make_key("m", "p", b"img")
+        assert ResponseCache.make_key("m", "p", None) != ResponseCache.make_key("m", "p", b"img")
+
+    def test_memory_lru_eviction(self):
+        cache = ResponseCache(max_memory_entries=2)
+        cache.put("a", {"text": "1"})
+        cache.put("b", {"text": "2"})
+        assert cache.get("a") == {"text": "1"}
+
+        cache.put("c", {"text": "3"})
+        assert cache.get("b") is None
+        assert cache.get("a") == {"text": "1"}
+
+        stats = cache.stats()
+        assert stats["memory_evictions"] == 1
+        assert stats["memory_hits"] == 2
+        assert stats["misses"] == 1
+
+    def test_disk_tier_survives_restart(self, tmp_path):
+        ResponseCache(tmp_path).put("key", {"text": "응답"})
+
+        cache = ResponseCache(tmp_path)
+        assert cache.get("key") == {"text": "응답"}
+        assert cache.get("key") == {"text": "응답"}
+        assert cache.stats()["disk_hits"] == 1
+        assert cache.stats()["memory_hits"] == 1
+
+    def test_ttl_expiry(self, tmp_path):
+        cache = ResponseCache(tmp_path, ttl=0.05)
+        cache.put("key", {"text": "old"})
+        time.sleep(0.1)
+
+        assert cache.get("key") is None
+        assert cache.stats()["expirations"] == 1
+        assert not list(tmp_path.glob("*.json"))
+
+    def test_disk_size_limit(self, tmp_path):
+        cache = ResponseCache(tmp_path, max_memory_entries=1, max_disk_bytes=200)
+        for index in range(5):
+            cache.put(f"key{index}", {"text": "x" * 50})
+            time.sleep(0.01)
+
+        assert cache.stats()["disk_bytes"] <= 200
+        assert cache.stats()["disk_evictions"] > 0
+        assert cache.get("key4") == {"text": "x" * 50}
@@ -0,0 +1,76 @@
+"""SemanticCache 단위 테스트"""
+import pytest
+
+pytest.importorskip("numpy")
+
+from src.managers.semantic_cache import SemanticCache, HashingEmbedder
+
+
+@pytest.fixture
+def cache():
+    return SemanticCache(HashingEmbedder(), threshold=0.8)
+
+
+class TestHashingEmbedder:
+    def test_deterministic(self):
+        embedder = HashingEmbedder(dimensions=64)
+        assert embedder.embed("피보나치 함수") == HashingEmbedder(dimensions=64).embed("피보나치 함수")
+        assert len(embedder.embed("")) == 64
+
+
+class TestSemanticCache:
+    def test_near_duplicate_hit(self, cache):
+        scope = SemanticCache.make_scope("model", "python")
+        cache.add("Python fibonacci function", scope, {"text": "fib"})
+
+        found = cache.lookup("python  Fibonacci function!", scope)
+        assert found is not None
+        assert found[0] == {"text": "fib"}
+        assert found[1] >= 0.8
+
+        assert cache.lookup("Flask 웹 서버로 파일 업로드 페이지 만들기", scope) is None
+
+    def test_scope_must_match(self, cache):
+        cache.add("Python fibonacci function", SemanticCache.make_scope("model", "python"), {"text": "fib"})
+        assert cache.lookup("Python fibonacci function", SemanticCache.make_scope("model", "go")) is None
+
+    def test_stats_report_similarity_distribution(self, cache):
+        scope = SemanticCache.make_scope("model", "python")
+        assert cache.lookup("anything", scope) is None
+
+        cache.add("Python fibonacci function", scope, {"text": "fib"})
+        cache.lookup("Python fibonacci function", scope)
+        cache.lookup("정렬 알고리즘 비교", scope)
+
+        stats = cache.stats()
+        assert stats["lookups"] == 3
+        assert stats["hits"] == 1
+        assert stats["misses"] == 2
+        assert stats["hit_ratio"] == pytest.approx(1 / 3)
+        # 비교 대상이 없던 첫 조회는 분포에 포함하지 않음
+        assert sum(stats["best_similarity_histogram"].values()) == 2
+        assert stats["best_similarity_histogram"][">=0.98"] == 1
+
+    def test_max_entries_evicts_least_recently_used(self):
+        cache = SemanticCache(HashingEmbedder(), threshold=0.99, max_entries=2)
+        scope = SemanticCache.make_scope("model")
+        cache.add("first prompt", scope, {"text": "1"})
+        cache.add("second prompt", scope, {"text": "2"})
+        cache.lookup("first prompt", scope)
+        cache.add("third prompt", scope, {"text": "3"})
+
+        assert cache.lookup("second prompt", scope) is None
+        assert cache.lookup("first prompt", scope)[0] == {"text": "1"}
+        assert cache.stats()["evictions"] == 1
+
+    def test_persistence(self, tmp_path):
+        cache_file = tmp_path / "semantic.npz"
+        scope = SemanticCache.make_scope("model")
+        SemanticCache(HashingEmbedder(), cache_file=cache_file).add("저장된 요청", scope, {"text": "응답"})
+
+        reloaded = SemanticCache(HashingEmbedder(), cache_file=cache_file)
+        assert reloaded.lookup("저장된 요청", scope)[0] == {"text": "응답"}
+
+        # 임베더가 다르면 저장된 벡터를 사용하지 않음
+        other = SemanticCache(HashingEmbedder(dimensions=128), cache_file=cache_file)
+        assert other.stats()["entries"] == 0
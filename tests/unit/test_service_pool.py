@@ -0,0 +1,55 @@
+"""DriveServicePool 단위 테스트"""
+import threading
+
+import pytest
+
+from src.clients.service_pool import DriveServicePool
+
+
+def make_pool(size=2, timeout=None):
+    return DriveServicePool(object(), lambda http: {"http": http}, size=size, timeout=timeout)
+
+
+class TestDriveServicePool:
+    def test_reuses_returned_service(self):
+        pool = make_pool()
+
+        with pool.lease() as first:
+            pass
+        with pool.lease() as second:
+            pass
+
+        assert first is second
+        stats = pool.stats()
+        assert stats["created"] == 1
+        assert stats["checkouts"] == 2
+        assert stats["reuse_ratio"] == 0.5
+
+    def test_concurrent_leases_get_separate_connections(self):
+        pool = make_pool(size=2)
+
+        first = pool.checkout()
+        second = pool.checkout()
+
+        assert first is not second
+        assert first.service["http"] is first.http
+        assert pool.stats()["created"] == 2
+
+    def test_waits_for_checkin_when_full(self):
+        pool = make_pool(size=1)
+        held = pool.checkout()
+
+        threading.Timer(0.05, pool.checkin, args=(held,)).start()
+        with pool.lease() as pooled:
+            assert pooled is held
+
+        stats = pool.stats()
+        assert stats["waits"] == 1
+        assert stats["max_wait_seconds"] >= 0.04
+
+    def test_timeout(self):
+        pool = make_pool(size=1, timeout=0.01)
+        pool.checkout()
+
+        with pytest.raises(TimeoutError):
+            pool.checkout()